@@ -11,9 +11,11 @@ from peaqevcore.common.spotprice.models.spotprice_type import SpotPriceType
 from custom_components.peaqev.peaqservice.hub.models.hub_options import \
     HubOptions
 from custom_components.peaqev.peaqservice.util.constants import TYPELITE
+from custom_components.peaqev.peaqservice.util.extensionmethods import \
+    next_hub_slug
 from custom_components.peaqev.services import async_prepare_register_services
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, HUB_SLUG, PLATFORMS
 from .peaqservice.chargertypes.models.chargertypes_enum import ChargerType
 from .peaqservice.hub.hub_factory import HubFactory
 
@@ -24,19 +26,31 @@ async def async_setup_entry(hass: HomeAssistant, conf: ConfigEntry) -> bool:
     """Set up Peaqev"""
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][conf.entry_id] = conf.data
     options = await async_set_options(conf)
-    hub = await HubFactory.async_create(hass, options, DOMAIN)
-    hass.data[DOMAIN]['hub'] = hub
+    hub = await HubFactory.async_create(hass, options, get_hub_slug(hass, conf))
+    hass.data[DOMAIN][conf.entry_id] = hub
     await hub.async_setup()
 
     conf.async_on_unload(conf.add_update_listener(async_update_entry))
-    await async_prepare_register_services(hub, hass)
+    await async_prepare_register_services(hass)
 
     await hass.config_entries.async_forward_entry_setups(conf, PLATFORMS)
     return True
 
 
+def get_hub_slug(hass: HomeAssistant, conf: ConfigEntry) -> str:
+    """Names the hub's entities. Picked once per config entry and stored in its data."""
+    slug = conf.data.get(HUB_SLUG)
+    if slug:
+        return slug
+    taken = {
+        e.data.get(HUB_SLUG) for e in hass.config_entries.async_entries(DOMAIN) if e.entry_id != conf.entry_id
+    }
+    slug = next_hub_slug(DOMAIN, taken)
+    hass.config_entries.async_update_entry(conf, data={**conf.data, HUB_SLUG: slug})
+    return slug
+
+
 PRICE_CHANGES = [
     'min_price',
     'top_price',
@@ -56,20 +70,24 @@ async def async_update_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Reload Peaqev component when options changed."""
     _LOGGER.debug('Reloading Peaqev component')
     new_options = await async_set_options(config_entry)
-    old_options = hass.data[DOMAIN]['hub'].options
+    hub = hass.data[DOMAIN][config_entry.entry_id]
+    old_options = hub.options
     diff = old_options.compare(new_options)
-    hass.data[DOMAIN]['hub'].options = new_options
+    hub.options = new_options
     if len(diff) == 0:
         return
     if [i for i in diff if i in RELOAD_CHANGES]:
         await hass.config_entries.async_reload(config_entry.entry_id)
     elif [i for i in diff if i in PRICE_CHANGES]:
-        await hass.data[DOMAIN]['hub'].async_init_hours()
+        await hub.async_init_hours()
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(config_entry.entry_id).stop()
+    return unload_ok
 
 
 async def async_set_options(conf) -> HubOptions:
@@ -125,6 +143,8 @@ async def async_set_options(conf) -> HubOptions:
     options.max_charge = conf.options.get('max_charge', 0)
     options.fuse_type = await async_get_existing_param(conf, 'mains', '')
     options.gainloss = await async_get_existing_param(conf, 'gainloss', False)
+    options.ingestion_window = await async_get_existing_param(conf, 'ingestion_window', 0) / 1000
+    options.charger_priority = await async_get_existing_param(conf, 'charger_priority', 0)
     return options
 
 
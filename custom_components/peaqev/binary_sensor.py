@@ -1,5 +1,4 @@
 import logging
-from datetime import timedelta
 
 from homeassistant.core import HomeAssistant
 
@@ -15,15 +14,12 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry, async_add_entities
 ):  # pylint:disable=unused-argument
-    hub = hass.data[DOMAIN]["hub"]
+    hub = hass.data[DOMAIN][config_entry.entry_id]
 
     peaqsensors = await async_gather_binary_sensors(hub)
     async_add_entities(peaqsensors)
 
 
-SCAN_INTERVAL = timedelta(seconds=4)
-
-
 async def async_gather_binary_sensors(hub) -> list:
     ret = []
     if hub.chargertype.type != ChargerType.NoCharger:
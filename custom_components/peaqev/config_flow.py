@@ -12,7 +12,8 @@ from homeassistant.core import callback
 from custom_components.peaqev.configflow.config_flow_helpers import \
     async_set_startpeak_dict
 from custom_components.peaqev.configflow.config_flow_schemas import (
-    CHARGER_DETAILS_SCHEMA, CHARGER_SCHEMA, HOURS_SCHEMA, MONTHS_SCHEMA,
+    CHARGER_DETAILS_SCHEMA, CHARGER_PRIORITY_VALIDATOR, CHARGER_SCHEMA,
+    HOURS_SCHEMA, INGESTION_WINDOW_VALIDATOR, MONTHS_SCHEMA,
     OUTLET_DETAILS_SCHEMA, PRICEAWARE_HOURS_SCHEMA, PRICEAWARE_SCHEMA,
     SENSOR_SCHEMA, TYPE_SCHEMA)
 from custom_components.peaqev.configflow.config_flow_validation import \
@@ -173,6 +174,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             self.data['mains'] = user_input['mains']
             self.data['gainloss'] = user_input['gainloss']
+            self.data['ingestion_window'] = user_input['ingestion_window']
+            self.data['charger_priority'] = user_input['charger_priority']
             return self.async_create_entry(title=self.info['title'], data=self.data)
 
         schema = vol.Schema(
@@ -182,6 +185,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     default='',
                 ):                                      vol.In(FUSES_LIST),
                 vol.Optional('gainloss', default=True): cv.boolean,
+                vol.Optional('ingestion_window', default=0): INGESTION_WINDOW_VALIDATOR,
+                vol.Optional('charger_priority', default=0): CHARGER_PRIORITY_VALIDATOR,
             }
         )
 
@@ -352,10 +357,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             self.options['mains'] = user_input['mains']
             self.options['gainloss'] = user_input['gainloss']
+            self.options['ingestion_window'] = user_input['ingestion_window']
+            self.options['charger_priority'] = user_input['charger_priority']
             return self.async_create_entry(title='', data=self.options)
 
         mainsvalue = await self._get_existing_param('mains', '')
         gainloss = await self._get_existing_param('gainloss', True)
+        ingestion_window = await self._get_existing_param('ingestion_window', 0)
+        charger_priority = await self._get_existing_param('charger_priority', 0)
 
         schema = vol.Schema(
             {
@@ -364,6 +373,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     default=mainsvalue,
                 ):                                          vol.In(FUSES_LIST),
                 vol.Optional('gainloss', default=gainloss): cv.boolean,
+                vol.Optional('ingestion_window', default=ingestion_window): INGESTION_WINDOW_VALIDATOR,
+                vol.Optional('charger_priority', default=charger_priority): CHARGER_PRIORITY_VALIDATOR,
             }
         )
 
@@ -101,6 +101,11 @@ MONTHS_SCHEMA = vol.Schema(
     }
 )
 
+INGESTION_WINDOW_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0, max=2000))
+"""milliseconds. 0 disables batching of power readings"""
+
+CHARGER_PRIORITY_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0, max=10))
+
 SCHEMAS = [
     SENSOR_SCHEMA,
     CHARGER_SCHEMA,
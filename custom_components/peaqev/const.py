@@ -2,3 +2,5 @@ DOMAIN = 'peaqev'
 PLATFORMS = ['sensor', 'binary_sensor', 'switch', 'number', 'select']
 DOMAIN_DATA = f'{DOMAIN}_data'
 LISTENER_FN_CLOSE = 'update_listener_close_fn'
+HUB_SLUG = 'hub_slug'
+"""stored in the config entry so a hub keeps its entity ids across restarts"""
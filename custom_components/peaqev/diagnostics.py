@@ -0,0 +1,36 @@
+"""Diagnostics support for peaqev."""
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.peaqev.const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    hub = hass.data[DOMAIN][entry.entry_id]
+    ret = {
+        "observer": hub.observer.diagnostics(),
+        "readiness": hub.readiness.diagnostics(),
+        "state_changes": {k: v.as_dict() for k, v in hub.states.handler_time.items()},
+        "state_changes_handled": dict(hub.model.state_changes_handled),
+        "state_changes_skipped": dict(hub.model.state_changes_skipped),
+        "scheduler_updates_skipped": hub.states.scheduler_updates_skipped,
+        "entities": hub.entity_coordinator.diagnostics(),
+    }
+    if hasattr(hub, 'max_min_controller'):
+        ret["max_min_skipped_resets"] = hub.max_min_controller.skipped_resets
+    power_series = getattr(hub.sensors, 'power_series', None)
+    if power_series is not None:
+        ret["power_series"] = power_series.diagnostics()
+        ret["house_power_series"] = hub.sensors.house_power_series.diagnostics()
+    power_average = getattr(hub.sensors, 'power_sensor_moving_average_5', None)
+    if power_average is not None:
+        ret["power_windows"] = {w: asdict(power_average.stats(w)) for w in power_average.windows}
+    if hub.site is not None:
+        ret["site"] = hub.site.diagnostics()
+    if getattr(hub, 'price_source', None) is not None:
+        ret["price_source"] = hub.price_source.diagnostics()
+    return ret
@@ -22,7 +22,7 @@ MAX_CHARGE = 'Max Charge'
 async def async_setup_entry(
     hass: HomeAssistant, config_entry, async_add_entities
 ):  # pylint:disable=unused-argument
-    hub: HomeAssistantHub = hass.data[DOMAIN]['hub']
+    hub: HomeAssistantHub = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
     inputnumbers = [{'name': MAX_CHARGE, 'entity': '_max_charge'}]
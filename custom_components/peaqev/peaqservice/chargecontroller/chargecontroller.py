@@ -139,7 +139,7 @@ class ChargeController(IChargeController):
 
     async def _should_start_charging(self) -> bool:
         aux_stop = self.hub.events.aux_stop
-        dont_defer_nonhour = not defer_start(self.hub.non_hours)
+        dont_defer_nonhour = not defer_start(self.hub.snapshot.slots)
         timer_is_override = getattr(self.hub.hours.timer, 'is_override', True)
         is_free_charge = await self.hub.async_free_charge()
         is_below_treshold = await self.async_below_startthreshold()
@@ -1,11 +1,18 @@
+from __future__ import annotations
+
 import logging
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.models.slot_index import \
+        SlotIndex
 
 _LOGGER = logging.getLogger(__name__)
 
-def defer_start(non_hours: list) -> bool:
+def defer_start(slots: SlotIndex) -> bool:
     """Defer starting if next hour is a non-hour and minute is 50 or greater, to avoid short running times."""
-    if (datetime.now() + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0) in non_hours:
-        if datetime.now().minute >= 50:
-            return True
+    now = datetime.now()
+    if now.minute >= 50:
+        return slots.is_non_hour((now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0))
     return False
@@ -50,7 +50,7 @@ class ChargeControllerLite(IChargeController):
             if (self.hub.totalhourlyenergy.value < self.hub.current_peak_dynamic or await self.hub.async_free_charge()) and not self.hub.events.aux_stop:
                 ret = (
                     ChargeControllerStates.Start
-                    if not defer_start(self.hub.hours.non_hours)
+                    if not defer_start(self.hub.snapshot.slots)
                     else ChargeControllerStates.Stop
                 )
             else:
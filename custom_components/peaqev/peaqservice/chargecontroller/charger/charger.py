@@ -199,7 +199,7 @@ class Charger:
                 ):
                     serviceparams = await async_set_chargerparams(
                         calls,
-                        await self.controller.hub.threshold.async_allowed_current(),
+                        await self.controller.hub.async_allowed_current(),
                     )
                     if (
                         not self.model.disable_current_updates
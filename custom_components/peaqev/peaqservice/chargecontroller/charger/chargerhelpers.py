@@ -63,12 +63,12 @@ class ChargerHelpers:
     def _currents_match(self) -> bool:
         return (
             self.charger.controller.hub.sensors.amp_meter.value
-            == self.charger.controller.hub.threshold.allowed_current()
+            == self.charger.controller.hub.allowed_current()
         )  # todo: composition
 
     def _too_late_to_increase(self) -> bool:
         return (
             datetime.now().minute >= 55
-            and self.charger.controller.hub.threshold.allowed_current()
+            and self.charger.controller.hub.allowed_current()
             > self.charger.controller.hub.sensors.amp_meter.value
         )  # todo: composition
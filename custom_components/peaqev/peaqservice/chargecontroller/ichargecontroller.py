@@ -134,6 +134,8 @@ class IChargeController:
                         old_state=self.status_type, new_state=status_type
                     )
                     self.model.status_type = status_type
+                    if self.hub.options.price.price_aware:  # todo: strategy should handle this
+                        await self.hub.observer.async_broadcast(ObserverTypes.ResetMaxMinChargeSensor)
                     if self.model.charger_type is not ChargerType.NoCharger: #todo: strategy should handle this
                         await self.hub.observer.async_broadcast(ObserverTypes.ProcessCharger)
                 await self._aux_check_running_charger_mismatch(status_type)
@@ -281,8 +283,9 @@ class IChargeController:
         self.hub.observer.add(
             ObserverTypes.UpdateLatestChargerStart, self.async_update_latest_charger_start
         )
+        # stage 1: reads hub.enabled, which the hub's own UpdateChargerEnabled subscriber sets
         self.hub.observer.add(
-            ObserverTypes.UpdateChargerEnabled, self.async_update_latest_charger_start
+            ObserverTypes.UpdateChargerEnabled, self.async_update_latest_charger_start, stage=1
         )
         self.hub.observer.add(ObserverTypes.HubInitialized, self._check_initialized)
         self.hub.observer.add(ObserverTypes.TimerActivated, self.async_set_status)
@@ -74,3 +74,40 @@ class LookupKeys(Enum):
     SAVINGS_TOTAL = auto()
     EXPORT_SAVINGS_DATA = auto()
     SCHEDULES = auto()
+
+SNAPSHOT_TICK = 1
+"""seconds a HubSnapshot is shared between readers before it is retaken"""
+SLOT_MINUTES = 15
+SLOT_COUNT = 2 * 24 * 60 // SLOT_MINUTES
+"""quarter-hour slots of today and tomorrow in a SlotIndex"""
+
+PRICE_FRESHNESS_BUDGET = 60
+"""seconds a spotprice copy may age before it is refreshed"""
+PRICE_CHECK_INTERVAL = 10
+PRICE_SLOT_MINUTES = [0, 15, 30, 45]
+PRICE_SLOT_OFFSET_SECONDS = 2
+PRICE_PUBLICATION_HOURS = [13, 14]
+"""day-ahead prices are published early afternoon. Retried every PRICE_PUBLICATION_RETRY_MINUTES within these hours"""
+PRICE_PUBLICATION_RETRY_MINUTES = 5
+PRICE_SOURCES = 'peaqev_price_sources'
+"""hass.data key of the spotprice readers shared between hubs"""
+
+
+class PriceRefreshReason(Enum):
+    Slot = "slot boundary"
+    Publication = "price publication"
+    PriceEntity = "price entity changed"
+    Stale = "freshness budget exceeded"
+    Uninitialized = "hours not initialized"
+
+class EntityTopic(Enum):
+    Power = 'power'
+    Hub = 'hub'
+    Prices = 'prices'
+
+ENTITY_TICK = 60
+"""seconds between refreshes of every entity, for values that only move with the clock"""
+ENTITY_POWER_INTERVAL = 4
+"""minimum seconds between refreshes of the power entities, the poll interval they had before"""
+ENTITY_STAGE = 2
+"""observer stage of the entity refresh, after the subscribers that change what the entities show"""
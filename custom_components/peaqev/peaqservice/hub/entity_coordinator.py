@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable
+
+from homeassistant.helpers.event import async_track_time_interval
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.const import (
+    ENTITY_POWER_INTERVAL, ENTITY_STAGE, ENTITY_TICK, EntityTopic)
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
+
+_LOGGER = logging.getLogger(__name__)
+
+TOPIC_BROADCASTS: dict[EntityTopic, tuple[ObserverTypes, ...]] = {
+    EntityTopic.Power: (
+        ObserverTypes.PowerCanaryDead,
+        ObserverTypes.PowerCanaryWarning,
+    ),
+    EntityTopic.Hub: (
+        ObserverTypes.HubInitialized,
+        ObserverTypes.CarConnected,
+        ObserverTypes.CarDisconnected,
+        ObserverTypes.CarDone,
+        ObserverTypes.UpdateChargerEnabled,
+        ObserverTypes.UpdateChargerDone,
+        ObserverTypes.UpdateLatestChargerStart,
+        ObserverTypes.AuxStopChanged,
+        ObserverTypes.MaxMinLimiterChanged,
+        ObserverTypes.TimerActivated,
+        ObserverTypes.SchedulerCreated,
+        ObserverTypes.SchedulerCancelled,
+        ObserverTypes.KillswitchDead,
+        ObserverTypes.ProcessChargeController,
+        ObserverTypes.UpdatePeak,
+    ),
+    EntityTopic.Prices: (
+        ObserverTypes.SpotpriceInitialized,
+        ObserverTypes.PricesChanged,
+        ObserverTypes.MonthlyAveragePriceChanged,
+        ObserverTypes.AdjustedAveragePriceChanged,
+        ObserverTypes.DailyAveragePriceChanged,
+        ObserverTypes.DynamicMaxPriceChanged,
+    ),
+}
+
+
+class EntityCoordinator:
+    """
+    Refreshes the hub's entities instead of Home Assistant polling them. Entities subscribe to topics.
+    Handled state changes and observer broadcasts mark the subscribers of their topic, and one task per loop
+    iteration refreshes the marked entities. State is written only when state, attributes, icon or availability moved.
+    Power readings and canary broadcasts mark the power entities at most once per ingestion window or ENTITY_POWER_INTERVAL,
+    whichever is longer, with a trailing refresh so the latest reading is always shown.
+    Every ENTITY_TICK seconds all entities are refreshed for values that only move with the clock.
+    """
+    def __init__(self, hub: HomeAssistantHub):
+        self.hub = hub
+        self._topics: dict[EntityTopic, list] = {topic: [] for topic in EntityTopic}
+        self._entities: list = []
+        self._written: dict[int, tuple] = {}
+        self._dirty: dict[int, object] = {}
+        self._flush: asyncio.Task | None = None
+        self._unsub_tick: Callable | None = None
+        self.power_interval: float = max(getattr(hub.options, 'ingestion_window', 0), ENTITY_POWER_INTERVAL)
+        self._power_marked_at: float | None = None
+        self._power_due: asyncio.TimerHandle | None = None
+        self.notifies: Counter = Counter()
+        self.refreshes: int = 0
+        self.writes: int = 0
+        for topic, commands in TOPIC_BROADCASTS.items():
+            for command in commands:
+                hub.observer.add(command, self._on_broadcast_handler(topic), stage=ENTITY_STAGE)
+
+    def _on_broadcast_handler(self, topic: EntityTopic) -> Callable:
+        match topic:
+            case EntityTopic.Power:
+                return self._on_power_broadcast
+            case EntityTopic.Prices:
+                return self._on_price_broadcast
+        return self._on_hub_broadcast
+
+    def _on_power_broadcast(self) -> None:
+        """canary broadcasts refresh every power entity, so they share the power interval with the readings"""
+        self.notify(EntityTopic.Power)
+
+    def _on_hub_broadcast(self) -> None:
+        self.notify(EntityTopic.Hub)
+
+    def _on_price_broadcast(self) -> None:
+        self.notify(EntityTopic.Prices)
+
+    def start(self) -> None:
+        self._unsub_tick = async_track_time_interval(
+            self.hub.state_machine, self._async_on_tick, timedelta(seconds=ENTITY_TICK)
+        )
+
+    def stop(self) -> None:
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+        if self._power_due is not None:
+            self._power_due.cancel()
+            self._power_due = None
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+
+    def add(self, entity, topics: frozenset[EntityTopic]) -> Callable[[], None]:
+        """Subscribes the entity and refreshes it once. Returns the callable that unsubscribes it"""
+        self._entities.append(entity)
+        for topic in topics:
+            self._topics[topic].append(entity)
+        self._mark([entity])
+        return lambda: self.remove(entity)
+
+    def remove(self, entity) -> None:
+        for entities in [self._entities, *self._topics.values()]:
+            if entity in entities:
+                entities.remove(entity)
+        self._written.pop(id(entity), None)
+        self._dirty.pop(id(entity), None)
+
+    def notify(self, topic: EntityTopic) -> None:
+        self.notifies[topic] += 1
+        if topic is EntityTopic.Power:
+            self._throttle_power()
+            return
+        self._mark(self._topics[topic])
+
+    def _throttle_power(self) -> None:
+        if self._power_due is not None:
+            return
+        now = time.monotonic()
+        if self._power_marked_at is None or now - self._power_marked_at >= self.power_interval:
+            self._mark_power()
+        else:
+            self._power_due = self.hub.state_machine.loop.call_later(
+                self._power_marked_at + self.power_interval - now, self._mark_power
+            )
+
+    def _mark_power(self) -> None:
+        self._power_due = None
+        self._power_marked_at = time.monotonic()
+        self._mark(self._topics[EntityTopic.Power])
+
+    def notify_state_change(self, entity_id: str) -> None:
+        power_entities = (
+            getattr(self.hub.options, 'powersensor', None),
+            getattr(getattr(self.hub.sensors, 'carpowersensor', None), 'entity', None),
+        )
+        self.notify(EntityTopic.Power if entity_id in power_entities else EntityTopic.Hub)
+
+    async def _async_on_tick(self, *args) -> None:
+        self._mark(self._entities)
+
+    def _mark(self, entities: list) -> None:
+        for entity in entities:
+            self._dirty[id(entity)] = entity
+        if self._dirty and (self._flush is None or self._flush.done()):
+            """done() covers a flush that ran to the end while it was being created"""
+            self._flush = self.hub.state_machine.async_create_task(self.async_flush(), name='peaqev entities')
+
+    async def async_flush(self) -> None:
+        try:
+            while self._dirty:
+                dirty, self._dirty = self._dirty, {}
+                for entity in dirty.values():
+                    await self.async_refresh(entity)
+        finally:
+            self._flush = None
+
+    async def async_refresh(self, entity) -> None:
+        self.refreshes += 1
+        try:
+            if hasattr(entity, 'async_update'):
+                await entity.async_update()
+            fingerprint = (
+                entity.state,
+                entity.extra_state_attributes,
+                entity.icon,
+                entity.available,
+            )
+        except Exception as e:
+            _LOGGER.debug(f'Unable to refresh {entity.name}: {e}')
+            return
+        if self._written.get(id(entity)) == fingerprint:
+            return
+        self._written[id(entity)] = _copy(fingerprint)
+        self.writes += 1
+        entity.async_write_ha_state()
+
+    def diagnostics(self) -> dict:
+        return {
+            "entities": len(self._entities),
+            "subscribers": {k.value: len(v) for k, v in self._topics.items()},
+            "notifies": {k.value: v for k, v in self.notifies.items()},
+            "power_interval": self.power_interval,
+            "refreshes": self.refreshes,
+            "writes": self.writes,
+        }
+
+
+def _copy(fingerprint: tuple) -> tuple:
+    """attributes are often rebuilt in place, a shallow copy keeps the comparison honest"""
+    state, attributes, icon, available = fingerprint
+    if isinstance(attributes, dict):
+        attributes = {k: list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v for k, v in attributes.items()}
+    return state, attributes, icon, available
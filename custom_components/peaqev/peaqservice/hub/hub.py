@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import time
 import traceback
+from contextlib import nullcontext
 from datetime import datetime
 from functools import partial
 from typing import Callable
@@ -18,6 +19,7 @@ from peaqevcore.services.hourselection.initializers.hoursbase import Hours
 from peaqevcore.services.prediction.prediction import Prediction
 from peaqevcore.services.threshold.thresholdbase import ThresholdBase
 
+from custom_components.peaqev.const import DOMAIN
 from custom_components.peaqev.peaqservice.chargecontroller.ichargecontroller import \
     IChargeController
 from custom_components.peaqev.peaqservice.chargertypes.icharger_type import \
@@ -25,36 +27,42 @@ from custom_components.peaqev.peaqservice.chargertypes.icharger_type import \
 from custom_components.peaqev.peaqservice.chargertypes.models.chargertypes_enum import \
     ChargerType
 from custom_components.peaqev.peaqservice.hub.const import LookupKeys
+from custom_components.peaqev.peaqservice.hub.entity_coordinator import \
+    EntityCoordinator
 from custom_components.peaqev.peaqservice.hub.factories.hourselection_factory import \
     HourselectionFactory
 from custom_components.peaqev.peaqservice.hub.hub_events import HubEvents
 from custom_components.peaqev.peaqservice.hub.models.hub_model import HubModel
 from custom_components.peaqev.peaqservice.hub.models.hub_options import \
     HubOptions
-from custom_components.peaqev.peaqservice.hub.models.initializer_types import \
-    InitializerTypes
+from custom_components.peaqev.peaqservice.hub.models.hub_snapshot import (
+    SNAPSHOT_FIELDS, HubSnapshot)
+from custom_components.peaqev.peaqservice.hub.models.lookup_entry import \
+    LookupEntry
 from custom_components.peaqev.peaqservice.hub.observer.iobserver_coordinator import \
     IObserver
+from custom_components.peaqev.peaqservice.hub.readiness import HubReadiness
 from custom_components.peaqev.peaqservice.hub.sensors.hub_sensors_base import \
     HubSensorsBase
 from custom_components.peaqev.peaqservice.hub.servicecalls import ServiceCalls
 from custom_components.peaqev.peaqservice.hub.state_changes.istate_changes import \
     StateChangesBase
+from custom_components.peaqev.peaqservice.powertools.gainloss.const import (
+    MONTHLY_COST_SENSOR, MONTHLY_ENERGY_SENSOR)
 from custom_components.peaqev.peaqservice.powertools.ipower_tools import \
     IPowerTools
+from custom_components.peaqev.peaqservice.powertools.site_allocator.site_allocator import \
+    SiteAllocator
 from custom_components.peaqev.peaqservice.util.constants import \
     CHARGERCONTROLLER
 from custom_components.peaqev.peaqservice.util.extensionmethods import (
-    async_iscoroutine, log_once_per_minute, nametoid)
+    log_once_per_minute, nametoid)
 from custom_components.peaqev.peaqservice.util.schedule_options_handler import \
     SchedulerOptionsHandler
 
 _LOGGER = logging.getLogger(__name__)
 
-class HubInitializer:
-    initialized_log_last_logged = 0
-    not_ready_list_old_state = 0
-    _initialized: bool = False
+_REQUIRED = object()
 
 class HomeAssistantHub:
     hub_id = 1337
@@ -69,41 +77,58 @@ class HomeAssistantHub:
     spotprice: SpotPriceBase
     events :HubEvents
     power: IPowerTools #is interface only
-    initialized_log_last_logged = 0
-    not_ready_list_old_state = 0
-    _initialized: bool = False
 
     def __init__(self, hass: HomeAssistant, options: HubOptions, domain: str, observer: IObserver):
         self.model = HubModel(domain, hass)
         self.hubname = domain.capitalize()
+        if domain != DOMAIN:
+            self.hub_id = domain
         self.state_machine = hass
         self.options: HubOptions = options
-        self._is_initialized = False
+        self._sensor_lookup: dict[LookupKeys, LookupEntry] = {}
+        self._sensor_lookup_source: tuple = (None, None, None, None)
+        self._snapshot: HubSnapshot | None = None
         self.observer = observer
+        self.site: SiteAllocator | None = None
         self._set_observers()
+        self.readiness = HubReadiness(self)
+        self.entity_coordinator = EntityCoordinator(self)
 
     async def async_setup(self):
         trackers = await self.async_setup_tracking()
         async_track_state_change_event(self.state_machine, trackers, self._async_on_change)
+        self.entity_coordinator.start()
+        self.readiness.check()
+
+    def stop(self) -> None:
+        self.observer.stop()
+        self.states.stop()
+        self.entity_coordinator.stop()
+        if self.site is not None:
+            self.sensors.detach()
+            self.power.power_canary.detach()
+            self.site.remove(self)
+
+    def allowed_current(self) -> int:
+        """The threshold's current, capped by the share of the main fuse this charger gets when it has siblings"""
+        amps = self.threshold.allowed_current()
+        return self.site.allocate(self, amps) if self.site is not None else amps
+
+    async def async_allowed_current(self) -> int:
+        amps = await self.threshold.async_allowed_current()
+        return self.site.allocate(self, amps) if self.site is not None else amps
 
     @property
     def enabled(self) -> bool:
         return self.sensors.charger_enabled.value
 
     @property
-    def non_hours(self) -> list:
-        return self.hours.non_hours
+    def non_hours(self) -> tuple:
+        return self.snapshot.non_hours
 
     @property
     def is_initialized(self) -> bool:
-        if self._is_initialized:
-            return True
-        if self.check_initializer():
-            _LOGGER.debug('init hub is done')
-            self.observer.activate(ObserverTypes.HubInitialized)
-            self._is_initialized = True
-            return True
-        return False
+        return self.readiness.is_ready
 
     @property
     def watt_cost(self) -> int:
@@ -115,7 +140,7 @@ class HomeAssistantHub:
 
     @property
     def current_peak_dynamic(self):
-        return self.sensors.current_peak.observed_peak
+        return self.snapshot.current_peak
 
     @property
     def charger_done(self) -> bool:
@@ -126,8 +151,8 @@ class HomeAssistantHub:
     @property
     def purchased_average_month(self) -> float:
         try:
-            month_draw = self.state_machine.states.get('sensor.peaqev_energy_including_car_monthly')
-            month_cost = self.state_machine.states.get('sensor.peaqev_energy_cost_integral_monthly')
+            month_draw = self.state_machine.states.get(MONTHLY_ENERGY_SENSOR.format(self.model.domain))
+            month_cost = self.state_machine.states.get(MONTHLY_COST_SENSOR.format(self.model.domain))
             if month_cost and month_draw:
                 try:
                     return round(float(month_cost.state) / float(month_draw.state),3)
@@ -141,7 +166,7 @@ class HomeAssistantHub:
     def savings_month(self) -> float:
         """Accumulated savings for the month against spotprice avg. ie can fluctuate"""
         try:
-            month_draw = self.state_machine.states.get('sensor.peaqev_energy_including_car_monthly')
+            month_draw = self.state_machine.states.get(MONTHLY_ENERGY_SENSOR.format(self.model.domain))
             month_diff = self.spotprice.average_month - self.purchased_average_month
             if month_draw:
                 return round(float(month_draw.state) * month_diff,3)
@@ -155,13 +180,36 @@ class HomeAssistantHub:
         old_state = event.data['old_state']
         new_state = event.data['new_state']
         if entity_id is not None:
+            if not self._is_relevant_change(entity_id, old_state, new_state):
+                self.model.state_changes_skipped[entity_id] += 1
+                return
+            self.model.state_changes_handled[entity_id] += 1
             try:
-                if old_state is None or old_state != new_state:
+                trace = self.observer.trace
+                with trace.state_change(entity_id, new_state.state) if trace else nullcontext():
                     await self.states.async_update_sensor(entity_id, new_state.state)
             except Exception as e:
                 tb = traceback.format_exc()  # Get the full traceback
                 msg = f'Unable to handle data-update: {entity_id} {old_state}|{new_state}. Exception: {e}\n{tb}'
                 _LOGGER.error(msg)
+            self.entity_coordinator.notify_state_change(entity_id)
+            if not self.readiness.is_ready:
+                self.readiness.check()
+
+    def _is_relevant_change(self, entity_id: str, old_state, new_state) -> bool:
+        """Only the state value matters, the attribute when the carpowersensor reads from one,
+        and every attribute of the spotprice entity, whose sources publish today's and tomorrow's prices there.
+        Other attribute-only and last_reported/last_updated changes are dropped here."""
+        if new_state is None:
+            return False
+        if old_state is None or old_state.state != new_state.state:
+            return True
+        if entity_id == getattr(getattr(self, 'spotprice', None), 'entity', None):
+            return old_state.attributes != new_state.attributes
+        carpowersensor = getattr(self.sensors, 'carpowersensor', None)
+        if carpowersensor is not None and carpowersensor.use_attribute and entity_id == carpowersensor.entity:
+            return old_state.attributes.get(carpowersensor.attribute) != new_state.attributes.get(carpowersensor.attribute)
+        return False
 
     # async def async_state_changed(self, entity_id, old_state, new_state):
     #     if entity_id is not None:
@@ -186,7 +234,7 @@ class HomeAssistantHub:
         pass
 
     async def async_is_caution_hour(self) -> bool:
-        return str(datetime.now().hour) in [str(h) for h in self.hours.caution_hours]
+        return self.snapshot.slots.is_caution_hour_of_day(datetime.now().hour)
 
     def _check_max_min_total_charge(self, ret: dict) -> None:
         pass
@@ -195,12 +243,16 @@ class HomeAssistantHub:
         ret = {}
         if not self.is_initialized:
             return ret
+        snapshot = self.snapshot
         for arg in args:
-            func: Callable = self._request_sensor_lookup().get(arg, None)
-            if await async_iscoroutine(func):
-                ret[arg] = await func()
+            if arg in SNAPSHOT_FIELDS:
+                ret[arg] = snapshot.get(arg)
+                continue
+            entry: LookupEntry = self._request_sensor_lookup().get(arg, None)
+            if entry.is_coroutine:
+                ret[arg] = await entry.func()
             else:
-                ret[arg] = func()
+                ret[arg] = entry.func()
         self._check_max_min_total_charge(ret)
         if len(ret) == 1:
             val = list(ret.values())[0]
@@ -209,73 +261,90 @@ class HomeAssistantHub:
             return val
         return ret
 
-    def _request_sensor_lookup(self) -> dict[LookupKeys, Callable]:
-        """Proxies the request to the correct sensor."""
+    def _request_sensor_lookup(self) -> dict[LookupKeys, LookupEntry]:
+        """
+        Proxies the request to the correct sensor. Built once, the getters resolve their objects when called.
+        Replacing sensors, hours, spotprice or chargecontroller retakes the snapshot.
+        """
+        if not self._sensor_lookup:
+            self._sensor_lookup = {k: LookupEntry(v) for k, v in self._build_sensor_lookup().items()}
+        source = (
+            getattr(self, 'sensors', None),
+            getattr(self, 'hours', None),
+            getattr(self, 'spotprice', None),
+            getattr(self, 'chargecontroller', None),
+        )
+        if any(a is not b for a, b in zip(source, self._sensor_lookup_source)):
+            self._sensor_lookup_source = source
+            self._snapshot = None
+        return self._sensor_lookup
+
+    @property
+    def snapshot(self) -> HubSnapshot:
+        """Shared view of prices, hours, peak and status. Taken at most once per SNAPSHOT_TICK"""
+        lookup = self._request_sensor_lookup()
+        now = time.monotonic()
+        if self._snapshot is None or self._snapshot.is_stale(now):
+            self._snapshot = HubSnapshot.create(lookup, now)
+        return self._snapshot
+
+    def invalidate_snapshot(self) -> None:
+        self._snapshot = None
+
+    def _read(self, path: str, default=_REQUIRED):
+        """Resolves a dotted attribute path from the hub at call time, so replaced inner objects are never held on to"""
+        *parents, name = path.split('.')
+        obj = self
+        for parent in parents:
+            obj = getattr(obj, parent)
+        if default is _REQUIRED:
+            return getattr(obj, name)
+        return getattr(obj, name, default)
+
+    async def _async_read_call(self, path: str):
+        return await self._read(path)()
+
+    def _build_sensor_lookup(self) -> dict[LookupKeys, Callable]:
+        read, call = self._read, self._async_read_call
         return {
-            LookupKeys.CHARGER_DONE: partial(getattr, self.sensors.charger_done, 'value'),
-            LookupKeys.CHARGEROBJECT_VALUE:    partial(
-                getattr, self.sensors.chargerobject, 'value'
-            ),
-            LookupKeys.HOUR_STATE:             partial(getattr, self.hours, 'state', 'unknown'),
-            LookupKeys.PRICES:                 partial(getattr, self.hours, 'prices', []),
-            LookupKeys.PRICES_TOMORROW:        partial(getattr, self.hours, 'prices_tomorrow', []),
-            LookupKeys.NON_HOURS:              partial(getattr, self.hours, 'non_hours', []),
-            LookupKeys.FUTURE_HOURS:           partial(getattr, self.hours, 'future_hours', []),
-            LookupKeys.CAUTION_HOURS:          partial(getattr, self.hours, 'caution_hours', []),
-            LookupKeys.DYNAMIC_CAUTION_HOURS:  partial(
-                getattr, self.hours, 'dynamic_caution_hours', {}
-            ),
-            LookupKeys.SPOTPRICE_SOURCE:       partial(getattr, self.spotprice, 'source', 'unknown'),
-            LookupKeys.AVERAGE_SPOTPRICE_DATA: partial(getattr, self.spotprice, 'average_data'),
-            LookupKeys.AVERAGE_STDEV_DATA:     partial(getattr, self.spotprice, 'average_stdev_data'),
-            LookupKeys.USE_CENT:               partial(getattr, self.spotprice.model, 'use_cent'),
-            LookupKeys.CURRENT_PEAK:           partial(getattr, self.sensors.current_peak, 'observed_peak'),
-            LookupKeys.AVERAGE_KWH_PRICE:      partial(self.hours.async_get_average_kwh_price),
-            LookupKeys.MAX_CHARGE:             partial(self.hours.async_get_total_charge),
-            LookupKeys.AVERAGE_WEEKLY:         partial(getattr, self.spotprice, 'average_weekly'),
-            LookupKeys.AVERAGE_MONTHLY:        partial(getattr, self.spotprice, 'average_month'),
-            LookupKeys.AVERAGE_30:             partial(getattr, self.spotprice, 'average_30'),
-            LookupKeys.CURRENCY:               partial(getattr, self.spotprice, 'currency'),
-            LookupKeys.OFFSETS:                partial(getattr, self.hours, 'offsets', {}),
-            LookupKeys.IS_PRICE_AWARE:         partial(getattr, self.options.price, 'price_aware'),
-            LookupKeys.IS_SCHEDULER_ACTIVE: partial(
-                getattr, self.hours.scheduler, 'scheduler_active', False
-            ),
-            LookupKeys.SCHEDULES: partial(
-                getattr, self.hours.scheduler, 'schedules', {}
-            ),
-            LookupKeys.CHARGECONTROLLER_STATUS: partial(
-                getattr, self.chargecontroller, 'status_string'
-            ),
-            LookupKeys.MAX_PRICE: partial(getattr, self.hours, 'absolute_top_price'),
-            LookupKeys.MIN_PRICE: partial(getattr, self.hours, 'min_price'),
-            LookupKeys.SAVINGS_PEAK: partial(
-                getattr, self.chargecontroller.savings, 'savings_peak'
-            ),
-            LookupKeys.SAVINGS_TRADE: partial(
-                getattr, self.chargecontroller.savings, 'savings_trade'
-            ),
-            LookupKeys.SAVINGS_TOTAL: partial(
-                getattr, self.chargecontroller.savings, 'savings_total'
-            ),
-            LookupKeys.EXPORT_SAVINGS_DATA: partial(
-                self.chargecontroller.savings.async_export_data
-            ),
+            LookupKeys.CHARGER_DONE:            partial(read, 'sensors.charger_done.value'),
+            LookupKeys.CHARGEROBJECT_VALUE:     partial(read, 'sensors.chargerobject.value'),
+            LookupKeys.HOUR_STATE:              partial(read, 'hours.state', 'unknown'),
+            LookupKeys.PRICES:                  partial(read, 'hours.prices', []),
+            LookupKeys.PRICES_TOMORROW:         partial(read, 'hours.prices_tomorrow', []),
+            LookupKeys.NON_HOURS:               partial(read, 'hours.non_hours', []),
+            LookupKeys.FUTURE_HOURS:            partial(read, 'hours.future_hours', []),
+            LookupKeys.CAUTION_HOURS:           partial(read, 'hours.caution_hours', []),
+            LookupKeys.DYNAMIC_CAUTION_HOURS:   partial(read, 'hours.dynamic_caution_hours', {}),
+            LookupKeys.SPOTPRICE_SOURCE:        partial(read, 'spotprice.source', 'unknown'),
+            LookupKeys.AVERAGE_SPOTPRICE_DATA:  partial(read, 'spotprice.average_data'),
+            LookupKeys.AVERAGE_STDEV_DATA:      partial(read, 'spotprice.average_stdev_data'),
+            LookupKeys.USE_CENT:                partial(read, 'spotprice.model.use_cent'),
+            LookupKeys.CURRENT_PEAK:            partial(read, 'sensors.current_peak.observed_peak'),
+            LookupKeys.AVERAGE_KWH_PRICE:       partial(call, 'hours.async_get_average_kwh_price'),
+            LookupKeys.MAX_CHARGE:              partial(call, 'hours.async_get_total_charge'),
+            LookupKeys.AVERAGE_WEEKLY:          partial(read, 'spotprice.average_weekly'),
+            LookupKeys.AVERAGE_MONTHLY:         partial(read, 'spotprice.average_month'),
+            LookupKeys.AVERAGE_30:              partial(read, 'spotprice.average_30'),
+            LookupKeys.CURRENCY:                partial(read, 'spotprice.currency'),
+            LookupKeys.OFFSETS:                 partial(read, 'hours.offsets', {}),
+            LookupKeys.IS_PRICE_AWARE:          partial(read, 'options.price.price_aware'),
+            LookupKeys.IS_SCHEDULER_ACTIVE:     partial(read, 'hours.scheduler.scheduler_active', False),
+            LookupKeys.SCHEDULES:               partial(read, 'hours.scheduler.schedules', {}),
+            LookupKeys.CHARGECONTROLLER_STATUS: partial(read, 'chargecontroller.status_string'),
+            LookupKeys.MAX_PRICE:               partial(read, 'hours.absolute_top_price'),
+            LookupKeys.MIN_PRICE:               partial(read, 'hours.min_price'),
+            LookupKeys.SAVINGS_PEAK:            partial(read, 'chargecontroller.savings.savings_peak'),
+            LookupKeys.SAVINGS_TRADE:           partial(read, 'chargecontroller.savings.savings_trade'),
+            LookupKeys.SAVINGS_TOTAL:           partial(read, 'chargecontroller.savings.savings_total'),
+            LookupKeys.EXPORT_SAVINGS_DATA:     partial(call, 'chargecontroller.savings.async_export_data'),
         }
 
     def now_is_non_hour(self) -> bool:
-        now = datetime.now().replace(minute=0, second=0, microsecond=0)
-        non_hours = self._request_sensor_lookup().get(LookupKeys.NON_HOURS, None)
-        if non_hours is None:
-            return False
-        return now in non_hours()
+        return self.snapshot.slots.is_non_hour(datetime.now())
 
     def now_is_caution_hour(self) -> bool:
-        now = datetime.now().replace(minute=0, second=0, microsecond=0)
-        caution_hours = self._request_sensor_lookup().get(LookupKeys.DYNAMIC_CAUTION_HOURS, None)
-        if caution_hours is None:
-            return False
-        return now in caution_hours().keys()
+        return self.snapshot.slots.caution_permittance(datetime.now()) is not None
 
     async def async_free_charge(self) -> bool:
         """Returns true if free charge is enabled, which means that peaks are currently not tracked"""
@@ -313,52 +382,6 @@ class HomeAssistantHub:
         )
         return ret
 
-    def check_initializer(self):
-        if self._initialized:
-            return True
-        else:
-            return self._check
-
-    def _check(self) -> bool:
-        init_types = {InitializerTypes.Hours: self.hours.is_initialized}
-        if self.options.price.price_aware:
-            init_types[InitializerTypes.SpotPrice] = self.spotprice.is_initialized
-        if hasattr(self.sensors, 'carpowersensor'):
-            init_types[InitializerTypes.CarPowerSensor] = self.sensors.carpowersensor.is_initialized
-        if hasattr(self.sensors, 'chargerobject_switch'):
-            init_types[
-                InitializerTypes.ChargerObjectSwitch
-            ] = self.sensors.chargerobject_switch.is_initialized
-        if hasattr(self.sensors, 'power'):
-            init_types[InitializerTypes.Power] = self.sensors.power.is_initialized
-        if hasattr(self.sensors, 'chargerobject'):
-            init_types[InitializerTypes.ChargerObject] = self.sensors.chargerobject.is_initialized
-        init_types[InitializerTypes.ChargerType] = self.chargertype.is_initialized
-        if all(init_types.values()):
-            self._initialized = True
-            _LOGGER.info('Hub is ready to use.')
-            _LOGGER.debug(
-                f'Hub is initialized with {self.options.price.cautionhour_type} as cautionhourtype.'
-            )
-            return True
-        return self.scramble_not_initialized(init_types)
-
-    def scramble_not_initialized(self, init_types) -> bool:
-        not_ready = [r.value for r in init_types if init_types[r] is False]
-        if any(
-                [
-                    len(not_ready) != self.not_ready_list_old_state,
-                    self.initialized_log_last_logged - time.time() > 30,
-                ]
-        ):
-            _LOGGER.debug(f'Hub is awaiting {not_ready} before being ready to use.')
-            self.not_ready_list_old_state = len(not_ready)
-            self.initialized_log_last_logged = time.time()
-        if [InitializerTypes.ChargerObject, InitializerTypes.ChargerType] in not_ready:
-            if self.chargertype.async_setup():
-                self.chargertype.is_initialized = True
-        return False
-
     async def async_init_hours(self):
         self.hours = await HourselectionFactory.async_create(self)
         if self.options.price.price_aware:
@@ -428,6 +451,7 @@ class HomeAssistantHub:
             list(self.sensors.locale.data.query_model.peaks.p.values())
         )
         if checkval != self.sensors.current_peak.observed_peak:
+            self.invalidate_snapshot()
             _LOGGER.info('observed peak updated to %s', self.sensors.current_peak.observed_peak)
 
     async def async_update_charger_done(self, val):
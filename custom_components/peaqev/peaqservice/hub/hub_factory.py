@@ -24,10 +24,14 @@ from custom_components.peaqev.peaqservice.hub.price_aware_hub import \
 from custom_components.peaqev.peaqservice.hub.sensors.hubsensors_factory import \
     HubSensorsFactory
 from custom_components.peaqev.peaqservice.hub.servicecalls import ServiceCalls
+from custom_components.peaqev.peaqservice.hub.shared_price_source import \
+    SharedPriceSource
 from custom_components.peaqev.peaqservice.hub.state_changes.state_changes_factory import \
     StateChangesFactory
 from custom_components.peaqev.peaqservice.powertools.powertools_factory import \
     PowerToolsFactory
+from custom_components.peaqev.peaqservice.powertools.site_allocator.site_allocator import \
+    SiteAllocator
 
 
 class HubFactory:
@@ -54,15 +58,20 @@ class HubFactory:
         hub.prediction = Prediction(hub)
         hub.servicecalls = ServiceCalls(hub, observer)
         hub.states = await StateChangesFactory.async_create(hub)
-        hub.spotprice = SpotPriceFactory.create(
-            hub=hub,
-            observer=observer,
-            system=PeaqSystem.PeaqEv,
-            test=False,
-            is_active=hub.options.price.price_aware,
-            custom_sensor=hub.options.price.custom_sensor,
-            spotprice_type=hub.options.price.spotprice_type,
-        )
+        if isinstance(hub, PriceAwareHub):
+            hub.price_source = await SharedPriceSource.async_join(hub)
+            hub.spotprice = hub.price_source.spotprice
+        else:
+            hub.spotprice = SpotPriceFactory.create(
+                hub=hub,
+                observer=observer,
+                system=PeaqSystem.PeaqEv,
+                test=False,
+                is_active=hub.options.price.price_aware,
+                custom_sensor=hub.options.price.custom_sensor,
+                spotprice_type=hub.options.price.spotprice_type,
+            )
         hub.power = await PowerToolsFactory.async_create(hub)
+        hub.site = SiteAllocator.join(hub)
         hub.events = HubEvents(hub, hub.state_machine)
         return hub
@@ -19,6 +19,8 @@ class MaxMinController:
         self._override_max_charge = None
         self._original_total_charge = 0
         self._max_min_limiter: float = 0
+        self._inputs: tuple | None = None
+        self.skipped_resets: int = 0
         self.override_max_charge: bool = False
         if not hub.options.peaqev_lite:
             self.hub.observer.add(ObserverTypes.CarDisconnected, self.async_null_max_charge)
@@ -28,6 +30,7 @@ class MaxMinController:
             self.hub.observer.add(ObserverTypes.UpdateChargerEnabled, self.async_null_max_charge)
             self.hub.observer.add(ObserverTypes.MaxMinLimiterChanged, self.async_update_maxmin_core)
             self.hub.observer.add(ObserverTypes.ResetMaxMinChargeSensor, self.async_try_reset_max_charge_sensor)
+            self.hub.observer.add(ObserverTypes.HubInitialized, self.async_try_reset_max_charge_sensor)
 
 
     @property
@@ -43,6 +46,29 @@ class MaxMinController:
                 return self.hub.options.max_charge
         return self._original_total_charge
 
+    @property
+    def entity_id(self) -> str:
+        return f'number.{self.hub.model.domain}_max_charge'
+
+    @property
+    def original_total_charge(self) -> float:
+        return self._original_total_charge
+
+    @original_total_charge.setter
+    def original_total_charge(self, val: float):
+        if val != self._original_total_charge:
+            self._original_total_charge = val
+            self.hub.observer.broadcast(ObserverTypes.ResetMaxMinChargeSensor)
+
+    def _current_inputs(self) -> tuple:
+        """Everything the max charge sensor depends on. The sensor is only reset when this changes."""
+        return (
+            self._override_max_charge,
+            self.hub.options.max_charge,
+            self._original_total_charge,
+            self.hub.chargecontroller.status_type,
+        )
+
     @property
     def remaining_charge(self) -> float:
         if not self.active:
@@ -98,12 +124,17 @@ class MaxMinController:
             await self.async_reset_max_charge_sensor()
 
     async def async_try_reset_max_charge_sensor(self) -> None:
+        if self._current_inputs() == self._inputs:
+            self.skipped_resets += 1
+            return
         if not self.override_max_charge:
             await self.async_reset_max_charge_sensor()
+
     async def async_reset_max_charge_sensor(self) -> None:
         if self.active:
+            self._inputs = self._current_inputs()
             try:
-                state = self.hub.state_machine.states.get('number.peaqev_max_charge')
+                state = self.hub.state_machine.states.get(self.entity_id)
                 if state is not None:
                     if (
                         int(float(state.state)) == int(float(self.max_charge))
@@ -128,7 +159,7 @@ class MaxMinController:
                 'number',
                 'set_value',
                 {
-                    'entity_id': 'number.peaqev_max_charge',
+                    'entity_id': self.entity_id,
                     'value': int(val),
                 },
             )
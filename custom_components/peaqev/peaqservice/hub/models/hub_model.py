@@ -1,3 +1,4 @@
+from collections import Counter
 from dataclasses import dataclass, field
 
 from homeassistant.core import HomeAssistant
@@ -11,6 +12,9 @@ class HubModel:
     domain: str
     hass: HomeAssistant
     chargingtracker_entities: list = field(default_factory=lambda: [])
+    state_changes_handled: Counter = field(default_factory=Counter)
+    state_changes_skipped: Counter = field(default_factory=Counter)
+    price_version: int = 0
     peak_breached: EventProperty = field(init=False)
 
     def __post_init__(self):
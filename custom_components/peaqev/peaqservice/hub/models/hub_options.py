@@ -41,6 +41,10 @@ class HubOptions:
     gainloss: bool = False
     max_charge: int = 0
     use_peak_history: bool = False
+    ingestion_window: float = 0
+    """seconds. 0 runs the decision pipeline on every power reading"""
+    charger_priority: int = 0
+    """chargers behind the same main fuse with a higher priority get their share of the headroom first"""
 
     def __post_init__(self):
         self.charger = Charger()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from types import MappingProxyType
+
+from custom_components.peaqev.peaqservice.hub.const import (SNAPSHOT_TICK,
+                                                            LookupKeys)
+from custom_components.peaqev.peaqservice.hub.models.lookup_entry import \
+    LookupEntry
+from custom_components.peaqev.peaqservice.hub.models.slot_index import \
+    SlotIndex
+
+SNAPSHOT_FIELDS: dict[LookupKeys, str] = {
+    LookupKeys.PRICES: 'prices',
+    LookupKeys.PRICES_TOMORROW: 'prices_tomorrow',
+    LookupKeys.FUTURE_HOURS: 'future_hours',
+    LookupKeys.NON_HOURS: 'non_hours',
+    LookupKeys.CAUTION_HOURS: 'caution_hours',
+    LookupKeys.DYNAMIC_CAUTION_HOURS: 'dynamic_caution_hours',
+    LookupKeys.CURRENT_PEAK: 'current_peak',
+    LookupKeys.CURRENCY: 'currency',
+    LookupKeys.USE_CENT: 'use_cent',
+    LookupKeys.HOUR_STATE: 'hour_state',
+    LookupKeys.CHARGECONTROLLER_STATUS: 'chargecontroller_status',
+}
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value
+
+
+@dataclass(frozen=True)
+class HubSnapshot:
+    """What the sensors and the chargecontroller read during one update cycle, taken at once and never mutated"""
+    taken_at: float
+    prices: tuple | None = None
+    prices_tomorrow: tuple | None = None
+    future_hours: tuple = ()
+    non_hours: tuple = ()
+    caution_hours: tuple = ()
+    dynamic_caution_hours: MappingProxyType = MappingProxyType({})
+    current_peak: float | None = None
+    currency: str | None = None
+    use_cent: bool = False
+    hour_state: str = 'unknown'
+    chargecontroller_status: str | None = None
+
+    @staticmethod
+    def create(lookup: dict[LookupKeys, LookupEntry], taken_at: float) -> HubSnapshot:
+        return HubSnapshot(
+            taken_at=taken_at,
+            **{name: _freeze(lookup[key]()) for key, name in SNAPSHOT_FIELDS.items()},
+        )
+
+    @cached_property
+    def slots(self) -> SlotIndex:
+        """Built on first use, at most once per snapshot"""
+        return SlotIndex.create(
+            datetime.now(), self.non_hours, self.dynamic_caution_hours, self.caution_hours, self.prices
+        )
+
+    def is_stale(self, now: float) -> bool:
+        return now - self.taken_at >= SNAPSHOT_TICK
+
+    def get(self, key: LookupKeys):
+        return getattr(self, SNAPSHOT_FIELDS[key])
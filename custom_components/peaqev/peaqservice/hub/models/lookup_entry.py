@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+from custom_components.peaqev.peaqservice.util.extensionmethods import \
+    iscoroutine
+
+
+@dataclass(frozen=True)
+class LookupEntry:
+    """A sensor getter in the hub's lookup table, with its coroutine-ness resolved when the table is built."""
+    func: Callable
+    is_coroutine: bool = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'is_coroutine', iscoroutine(self.func))
+
+    def __call__(self):
+        return self.func()
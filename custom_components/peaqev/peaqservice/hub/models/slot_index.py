@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from custom_components.peaqev.peaqservice.hub.const import (SLOT_COUNT,
+                                                            SLOT_MINUTES)
+
+
+def _slot(start: datetime, dt: datetime) -> int | None:
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    slot = int((dt - start).total_seconds() // (SLOT_MINUTES * 60))
+    if 0 <= slot < SLOT_COUNT:
+        return slot
+    return None
+
+
+MAX_HOURLY_PRICES = 25
+"""prices in a day of hourly prices, the day summer time ends"""
+
+
+def _span(prices) -> int:
+    """Slots one non-hour or caution entry covers, from the resolution of today's prices: 23-25 hourly or 92-100 quarterly"""
+    return 1 if prices is not None and len(prices) > MAX_HOURLY_PRICES else 60 // SLOT_MINUTES
+
+
+@dataclass(frozen=True)
+class SlotIndex:
+    """Non-hours and caution-hours of today and tomorrow, indexed by quarter so lookups never scan the hour lists"""
+    start: datetime
+    non_hours: bytes
+    caution: tuple[float | None, ...]
+    caution_hours_of_day: frozenset[str]
+
+    @staticmethod
+    def create(now: datetime, non_hours, dynamic_caution_hours, caution_hours, prices=None) -> SlotIndex:
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        _non_hours = bytearray(SLOT_COUNT)
+        _caution: list[float | None] = [None] * SLOT_COUNT
+        span = _span(prices)
+        for dt in non_hours or ():
+            if (slot := _slot(start, dt)) is not None:
+                end = min(slot + span, SLOT_COUNT)
+                _non_hours[slot:end] = b'\x01' * (end - slot)
+        for dt, permittance in (dynamic_caution_hours or {}).items():
+            if (slot := _slot(start, dt)) is not None:
+                end = min(slot + span, SLOT_COUNT)
+                _caution[slot:end] = [permittance] * (end - slot)
+        return SlotIndex(
+            start=start,
+            non_hours=bytes(_non_hours),
+            caution=tuple(_caution),
+            caution_hours_of_day=frozenset(str(h) for h in caution_hours or ()),
+        )
+
+    def is_non_hour(self, dt: datetime) -> bool:
+        slot = _slot(self.start, dt)
+        return slot is not None and self.non_hours[slot] == 1
+
+    def caution_permittance(self, dt: datetime) -> float | None:
+        """Permittance of a dynamic caution hour, None when dt is not one"""
+        slot = _slot(self.start, dt)
+        if slot is None:
+            return None
+        return self.caution[slot]
+
+    def is_caution_hour_of_day(self, hour: int) -> bool:
+        return str(hour) in self.caution_hours_of_day
@@ -1,2 +1,53 @@
+from enum import Enum
+
+from peaqevcore.common.models.observer_types import ObserverTypes
+
 COMMAND_WAIT = 3
 TIMEOUT = 10
+DISPATCH_INTERVAL = 1
+DISPATCH_RETRY_MARGIN = 0.05
+LATENCY_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1, 3, 10, 30)
+
+
+class DispatchMode(Enum):
+    Event = "event"
+    Interval = "interval"
+
+
+class EvictionReason(Enum):
+    Throttled = "expired while throttled"
+    NoSubscribers = "expired without subscribers"
+
+
+class CommandPriority(Enum):
+    """Critical commands bypass queue and throttle. Normal is dispatched before Low."""
+    Critical = 0
+    Normal = 1
+    Low = 2
+
+
+COMMAND_PRIORITY = {
+    ObserverTypes.PowerCanaryDead: CommandPriority.Critical,
+    ObserverTypes.PowerCanaryWarning: CommandPriority.Critical,
+    ObserverTypes.KillswitchDead: CommandPriority.Critical,
+    ObserverTypes.MonthlyAveragePriceChanged: CommandPriority.Low,
+    ObserverTypes.DailyAveragePriceChanged: CommandPriority.Low,
+    ObserverTypes.ResetMaxMinChargeSensor: CommandPriority.Low,
+}
+
+SUBSCRIBER_TIMEOUT = 30
+
+
+class FanoutMode(Enum):
+    """
+    Serial awaits every subscriber in turn under one lock, which keeps commands that share hub state ordered.
+    Concurrent runs each stage of subscribers in a TaskGroup and only serialises runs of the same command.
+    Either way each subscriber has its timeout and a failing one does not stop the others.
+    """
+    Serial = "serial"
+    Concurrent = "concurrent"
+
+
+class SubscriberFailure(Enum):
+    Timeout = "timed out"
+    Error = "raised"
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from abc import abstractmethod
 from asyncio import Lock
-from typing import Callable
+from collections import defaultdict
+from itertools import groupby
 
 from peaqevcore.common.models.observer_types import ObserverTypes
 
 from custom_components.peaqev.peaqservice.hub.observer.const import (
-    COMMAND_WAIT, TIMEOUT)
+    COMMAND_PRIORITY, COMMAND_WAIT, DISPATCH_RETRY_MARGIN, SUBSCRIBER_TIMEOUT,
+    TIMEOUT, CommandPriority, EvictionReason, FanoutMode, SubscriberFailure)
 from custom_components.peaqev.peaqservice.hub.observer.models.command import \
     Command
 from custom_components.peaqev.peaqservice.hub.observer.models.observer_model import \
     ObserverModel
+from custom_components.peaqev.peaqservice.hub.observer.models.subscriber import \
+    Subscriber
+from custom_components.peaqev.peaqservice.hub.trace.trace_recorder import \
+    TraceRecorder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,9 +32,14 @@ class IObserver:
     When broadcasting, you may use one argument that the of-course needs to correspond to your receiving function.
     """
 
-    def __init__(self):
+    def __init__(self, fanout_mode: FanoutMode = FanoutMode.Serial):
         self.model = ObserverModel()
+        self.fanout_mode = fanout_mode
         self._lock = Lock()
+        self._command_locks: dict[ObserverTypes, Lock] = defaultdict(Lock)
+        self._tasks: set[asyncio.Task] = set()
+        self._critical_in_flight: set[tuple] = set()
+        self.trace: TraceRecorder | None = None
 
     def activate(self, init_broadcast: ObserverTypes = None) -> None:
         self.model.active = True
@@ -37,6 +49,10 @@ class IObserver:
     def deactivate(self) -> None:
         self.model.active = False
 
+    def stop(self) -> None:
+        """Release any dispatch machinery held by the observer."""
+        pass
+
     def _check_and_convert_enum_type(self, command) -> ObserverTypes:
         if isinstance(command, str):
             try:
@@ -48,85 +64,216 @@ class IObserver:
                 return ObserverTypes.Test
         return command
 
-    def add(self, command: ObserverTypes | str, func):
+    def add(
+        self,
+        command: ObserverTypes | str,
+        func,
+        stage: int = 0,
+        timeout: float | None = None,
+        blocking: bool = False,
+    ):
         command = self._check_and_convert_enum_type(command)
+        subscriber = Subscriber(func, stage, timeout, blocking)
         if command in self.model.subscribers.keys():
-            self.model.subscribers[command].append(func)
+            self.model.subscribers[command].append(subscriber)
+            self.model.subscribers[command].sort(key=lambda s: s.stage)
         else:
-            self.model.subscribers[command] = [func]
+            self.model.subscribers[command] = [subscriber]
+
+    @staticmethod
+    def _is_critical(command: ObserverTypes) -> bool:
+        return COMMAND_PRIORITY.get(command) is CommandPriority.Critical
 
     async def async_broadcast(self, command: ObserverTypes | str, argument=None):
         command = self._check_and_convert_enum_type(command)
+        if self._is_critical(command):
+            self.model.command_stats[command].broadcasts += 1
+            if self.trace is not None:
+                self.trace.record_broadcast(command, argument)
+            await self.async_deliver(Command(command, None, argument))
+            return
         self.broadcast(command, argument)
         if len(self.model.broadcast_queue) > 10:
             await self.async_dispatch()
 
     def broadcast(self, command: ObserverTypes | str, argument=None):
         command = self._check_and_convert_enum_type(command)
+        self.model.command_stats[command].broadcasts += 1
+        if self.trace is not None:
+            self.trace.record_broadcast(command, argument)
+        if self._is_critical(command):
+            self._schedule_delivery(Command(command, None, argument))
+            return
         _expiration = time.time() + TIMEOUT
         cc = Command(command, _expiration, argument)
-        if cc not in self.model.broadcast_queue:
-            self.model.broadcast_queue.append(cc)
+        queued = self.model.broadcast_queue.get(cc.key)
+        if queued is None:
+            self.model.broadcast_queue[cc.key] = cc
+        else:
+            queued.expiration = _expiration
+            self.model.command_stats[command].coalesced += 1
+        self._signal_dispatch()
+
+    def _create_task(self, coro, name: str) -> None:
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _schedule_delivery(self, command: Command) -> None:
+        """Deliver a critical command from sync code without waiting for the dispatcher."""
+        if self._claim_critical(command):
+            self._create_task(self._async_deliver_claimed(command), f'peaqev observer {command.command.name}')
+
+    async def async_deliver(self, command: Command) -> None:
+        """Runs the subscribers of a critical command right away. No queue, throttle or lock."""
+        if self._claim_critical(command):
+            await self._async_deliver_claimed(command)
+
+    def _claim_critical(self, command: Command) -> bool:
+        """A critical command already in flight with the same argument is coalesced into that delivery"""
+        if command.command not in self.model.subscribers.keys():
+            return False
+        if command.key in self._critical_in_flight:
+            self.model.command_stats[command.command].coalesced += 1
+            return False
+        self._critical_in_flight.add(command.key)
+        return True
+
+    async def _async_deliver_claimed(self, command: Command) -> None:
+        try:
+            started = self._record_dispatched(command)
+            if self.fanout_mode is FanoutMode.Concurrent:
+                await self.async_fanout(command)
+            else:
+                for sub in self.model.subscribers[command.command]:
+                    await self._async_call_isolated(sub, command)
+            self._record_latency(command, started)
+        finally:
+            self._critical_in_flight.discard(command.key)
+
+    def _record_dispatched(self, command: Command) -> float:
+        now = time.monotonic()
+        stats = self.model.command_stats[command.command]
+        stats.dispatched += 1
+        stats.queue_wait.add(now - command.enqueued_at)
+        return now
+
+    def _record_latency(self, command: Command, started: float) -> None:
+        now = time.monotonic()
+        self.model.lane_latency[command.priority].add(now - command.enqueued_at)
+        self.model.command_stats[command.command].run.add(now - started)
+
+    def _signal_dispatch(self) -> None:
+        """Called after every enqueue. Event-driven observers wake their dispatcher here."""
+        pass
+
+    def seconds_until_next_broadcast(self) -> float | None:
+        """Time until the first throttled command with subscribers may be dispatched. None if there is nothing to wait for."""
+        now = time.time()
+        waits = [
+            COMMAND_WAIT - (now - self.model.wait_queue.get(q.command, 0))
+            for q in self.model.broadcast_queue.values()
+            if q.command in self.model.subscribers.keys()
+        ]
+        if not waits:
+            return None
+        return max(min(waits), 0) + DISPATCH_RETRY_MARGIN
 
     async def async_dispatch(self, *args):
+        self._evict_expired()
         q: Command
-        for q in self.model.broadcast_queue:
+        for q in sorted(self.model.broadcast_queue.values(), key=lambda c: c.priority.value):
             if q.command in self.model.subscribers.keys():
                 await self.async_dequeue_and_broadcast(q)
 
+    def _evict_expired(self) -> None:
+        now = time.time()
+        for key, q in list(self.model.broadcast_queue.items()):
+            if q.is_expired(now):
+                del self.model.broadcast_queue[key]
+                self.model.command_stats[q.command].evicted += 1
+                if q.command in self.model.subscribers.keys():
+                    self.model.evictions[EvictionReason.Throttled] += 1
+                else:
+                    self.model.evictions[EvictionReason.NoSubscribers] += 1
+
     async def async_dequeue_and_broadcast(self, command: Command):
         if await self.async_ok_to_broadcast(command.command):
+            self.model.broadcast_queue.pop(command.key, None)
+            if self.fanout_mode is FanoutMode.Concurrent:
+                """don't let a slow command hold up the rest of the queue"""
+                self._create_task(
+                    self._async_fanout_locked(command), f'peaqev observer {command.command.name}'
+                )
+                return
             async with self._lock:
                 # _LOGGER.debug(
                 #     f"ready to broadcast: {command.command.name} with params: {command.argument}"
                 # )
-                for func in self.model.subscribers.get(command.command, []):
-                    await self.async_broadcast_separator(func, command)
-                if command in self.model.broadcast_queue:
-                    self.model.broadcast_queue.remove(command)
-        # else:
-        #     _LOGGER.debug(
-        #         f"not able to broadcast: {command.command.name} with params: {command.argument}"
-        #     )
+                started = self._record_dispatched(command)
+                for sub in self.model.subscribers.get(command.command, []):
+                    await self._async_call_isolated(sub, command)
+            self._record_latency(command, started)
+        else:
+            self.model.command_stats[command.command].throttled += 1
+
+    async def _async_fanout_locked(self, command: Command) -> None:
+        """Deliveries of the same command never overlap, different commands do."""
+        async with self._command_locks[command.command]:
+            started = self._record_dispatched(command)
+            await self.async_fanout(command)
+        self._record_latency(command, started)
+
+    async def async_fanout(self, command: Command) -> None:
+        for _, stage in groupby(self.model.subscribers.get(command.command, []), key=lambda s: s.stage):
+            async with asyncio.TaskGroup() as tg:
+                for sub in stage:
+                    tg.create_task(self._async_call_isolated(sub, command))
+
+    async def _async_call_isolated(self, sub: Subscriber, command: Command) -> None:
+        try:
+            async with asyncio.timeout(sub.timeout or SUBSCRIBER_TIMEOUT):
+                await self._async_call_timed(sub, command)
+        except TimeoutError:
+            self.model.failures[SubscriberFailure.Timeout] += 1
+            _LOGGER.warning(f'Subscriber {sub.func} timed out on {command.command.name}')
+        except Exception as e:
+            self.model.failures[SubscriberFailure.Error] += 1
+            _LOGGER.error(f'Subscriber {sub.func} failed on {command.command.name}: {e}')
+
+    async def _async_call_timed(self, sub: Subscriber, command: Command) -> None:
+        started = time.monotonic()
+        try:
+            await self.async_broadcast_separator(sub, command)
+        finally:
+            self.model.subscriber_time[sub.name].add(time.monotonic() - started)
+
+    def diagnostics(self) -> dict:
+        return {
+            "fanout_mode": self.fanout_mode.value,
+            "queue_depth": len(self.model.broadcast_queue),
+            "queued": [q.command.name for q in self.model.broadcast_queue.values()],
+            "evictions": {k.name: v for k, v in self.model.evictions.items()},
+            "failures": {k.name: v for k, v in self.model.failures.items()},
+            "lanes": {k.name: v.as_dict() for k, v in self.model.lane_latency.items()},
+            "commands": {k.name: v.as_dict() for k, v in self.model.command_stats.items()},
+            "subscribers": {k: v.as_dict() for k, v in self.model.subscriber_time.items()},
+        }
 
     @abstractmethod
-    async def async_broadcast_separator(self, func, command):
+    async def async_broadcast_separator(self, sub: Subscriber, command: Command):
         pass
 
     @staticmethod
-    def _call_func(func: Callable, command: Command) -> None:
-        if command.argument is not None:
-            if isinstance(command.argument, dict):
-                try:
-                    func(**command.argument)
-                except TypeError:
-                    func()
-            else:
-                try:
-                    func(command.argument)
-                except TypeError:
-                    func()
-        else:
-            func()
+    def _call_func(sub: Subscriber, command: Command) -> None:
+        sub.call(command.argument)
 
     @staticmethod
-    async def async_call_func(func: Callable, command: Command) -> None:
+    async def async_call_func(sub: Subscriber, command: Command) -> None:
         try:
-            if command.argument is not None:
-                if isinstance(command.argument, dict):
-                    try:
-                        await func(**command.argument)
-                    except TypeError:
-                        await func()
-                else:
-                    try:
-                        await func(command.argument)
-                    except TypeError:
-                        await func()
-            else:
-                await func()
+            await sub.call(command.argument)
         except Exception as e:
-            _LOGGER.error(f'async_call_func for {func} with command {command}: {e}')
+            _LOGGER.error(f'async_call_func for {sub.func} with command {command}: {e}')
 
     async def async_ok_to_broadcast(self, command) -> bool:
         if command not in self.model.wait_queue.keys():
@@ -1,15 +1,48 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Hashable
 
 from peaqevcore.common.models.observer_types import ObserverTypes
 
+from custom_components.peaqev.peaqservice.hub.observer.const import (
+    COMMAND_PRIORITY, CommandPriority)
+
+
+def hashable_argument(argument) -> Hashable:
+    """Turns a broadcast argument into something that can be used as part of a dict key."""
+    if isinstance(argument, dict):
+        return frozenset((k, hashable_argument(v)) for k, v in argument.items())
+    if isinstance(argument, (list, tuple)):
+        return tuple(hashable_argument(a) for a in argument)
+    if isinstance(argument, (set, frozenset)):
+        return frozenset(hashable_argument(a) for a in argument)
+    try:
+        hash(argument)
+        return argument
+    except TypeError:
+        return id(argument)
+
 
 @dataclass
 class Command:
     command: ObserverTypes
     expiration: float = None
     argument: any = None
+    key: tuple = field(init=False, repr=False)
+    priority: CommandPriority = field(init=False, repr=False)
+    enqueued_at: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.key = (self.command, hashable_argument(self.argument))
+        self.priority = COMMAND_PRIORITY.get(self.command, CommandPriority.Normal)
+        self.enqueued_at = time.monotonic()
 
     def __eq__(self, other):
         if all([self.command == other.command, self.argument == other.argument]):
             return True
         return False
+
+    def is_expired(self, now: float) -> bool:
+        return self.expiration is not None and self.expiration < now
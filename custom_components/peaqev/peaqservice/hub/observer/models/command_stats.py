@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+
+from custom_components.peaqev.peaqservice.hub.observer.models.latency_stats import \
+    LatencyStats
+
+
+@dataclass
+class CommandStats:
+    broadcasts: int = 0
+    coalesced: int = 0
+    dispatched: int = 0
+    throttled: int = 0
+    evicted: int = 0
+    queue_wait: LatencyStats = field(default_factory=LatencyStats)
+    """enqueue to dispatch"""
+    run: LatencyStats = field(default_factory=LatencyStats)
+    """dispatch to all subscribers done"""
+
+    def as_dict(self) -> dict:
+        return {
+            "broadcasts": self.broadcasts,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "throttled": self.throttled,
+            "evicted": self.evicted,
+            "queue_wait": self.queue_wait.as_dict(),
+            "run": self.run.as_dict(),
+        }
@@ -0,0 +1,40 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from custom_components.peaqev.peaqservice.hub.observer.const import \
+    LATENCY_BUCKETS
+
+
+@dataclass
+class LatencyStats:
+    count: int = 0
+    total: float = 0
+    max: float = 0
+    last: float = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    """buckets[i] counts samples <= LATENCY_BUCKETS[i], the last one everything slower"""
+
+    @property
+    def mean(self) -> float:
+        if self.count == 0:
+            return 0
+        return self.total / self.count
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 6),
+            "max": round(self.max, 6),
+            "last": round(self.last, 6),
+            "histogram": {
+                **{f"<={b}s": n for b, n in zip(LATENCY_BUCKETS, self.buckets)},
+                f">{LATENCY_BUCKETS[-1]}s": self.buckets[-1],
+            },
+        }
@@ -1,12 +1,34 @@
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.observer.const import \
+    CommandPriority
 from custom_components.peaqev.peaqservice.hub.observer.models.command import \
     Command
+from custom_components.peaqev.peaqservice.hub.observer.models.command_stats import \
+    CommandStats
+from custom_components.peaqev.peaqservice.hub.observer.models.latency_stats import \
+    LatencyStats
+from custom_components.peaqev.peaqservice.hub.observer.models.subscriber import \
+    Subscriber
 
 
 @dataclass
 class ObserverModel:
-    subscribers: dict = field(default_factory=lambda: {})
-    broadcast_queue: list[Command] = field(default_factory=lambda: [])
+    subscribers: dict[ObserverTypes, list[Subscriber]] = field(default_factory=lambda: {})
+    broadcast_queue: dict[tuple, Command] = field(default_factory=lambda: {})
     wait_queue: dict[str, float] = field(default_factory=lambda: {})
+    evictions: Counter = field(default_factory=Counter)
+    failures: Counter = field(default_factory=Counter)
+    lane_latency: dict[CommandPriority, LatencyStats] = field(
+        default_factory=lambda: {p: LatencyStats() for p in CommandPriority}
+    )
+    command_stats: defaultdict[ObserverTypes, CommandStats] = field(
+        default_factory=lambda: defaultdict(CommandStats)
+    )
+    subscriber_time: defaultdict[str, LatencyStats] = field(
+        default_factory=lambda: defaultdict(LatencyStats)
+    )
     active: bool = False
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
+
+
+@dataclass
+class Subscriber:
+    """Lower stages finish before higher stages start. Subscribers within a stage may run concurrently.
+    The calling convention is inspected once when subscribing, so dispatch is a direct call.
+    Sync subscribers run inline on the event loop unless marked blocking, then they go to the executor."""
+    func: Callable
+    stage: int = 0
+    timeout: float | None = None
+    blocking: bool = False
+    name: str = field(init=False)
+    is_coroutine: bool = field(init=False)
+    takes_positional: bool = field(init=False)
+    keywords: frozenset = field(init=False, repr=False)
+    takes_var_keywords: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        inner = self.func
+        while isinstance(inner, partial):
+            inner = inner.func
+        self.name = getattr(inner, '__qualname__', repr(inner))
+        self.is_coroutine = inspect.iscoroutinefunction(inner)
+        try:
+            params = inspect.signature(self.func).parameters.values()
+        except (TypeError, ValueError):
+            """builtins without a signature: trust the caller"""
+            self.takes_positional, self.keywords, self.takes_var_keywords = True, frozenset(), True
+            return
+        self.takes_positional = any(
+            p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL) for p in params
+        )
+        self.keywords = frozenset(
+            p.name for p in params if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+        )
+        self.takes_var_keywords = any(p.kind is p.VAR_KEYWORD for p in params)
+
+    def call(self, argument=None):
+        """Returns the coroutine for async subscribers, the result otherwise."""
+        if argument is None:
+            return self.func()
+        if isinstance(argument, dict):
+            if self.takes_var_keywords or argument.keys() <= self.keywords:
+                return self.func(**argument)
+            return self.func()
+        if self.takes_positional:
+            return self.func(argument)
+        return self.func()
@@ -1,32 +1,104 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from datetime import timedelta
 
 from homeassistant.helpers.event import async_track_time_interval
 
+from custom_components.peaqev.peaqservice.hub.observer.const import (
+    DISPATCH_INTERVAL, DispatchMode, FanoutMode)
 from custom_components.peaqev.peaqservice.hub.observer.iobserver_coordinator import \
     IObserver
 from custom_components.peaqev.peaqservice.hub.observer.models.command import \
     Command
-from custom_components.peaqev.peaqservice.util.extensionmethods import \
-    async_iscoroutine
+from custom_components.peaqev.peaqservice.hub.observer.models.subscriber import \
+    Subscriber
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class Observer(IObserver):
-    def __init__(self, hass):
-        super().__init__()
+    def __init__(
+        self,
+        hass,
+        dispatch_mode: DispatchMode = DispatchMode.Event,
+        fanout_mode: FanoutMode = FanoutMode.Serial,
+    ):
+        super().__init__(fanout_mode)
         self.hass = hass
-        async_track_time_interval(
-            self.hass, self.async_dispatch, timedelta(seconds=1)
-        )
+        self.dispatch_mode = dispatch_mode
+        self._wakeup = asyncio.Event()
+        self._retry_handle: asyncio.TimerHandle | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._unsub_interval = None
+        if dispatch_mode is DispatchMode.Interval:
+            """compatibility: poll the queue once per DISPATCH_INTERVAL"""
+            self._unsub_interval = async_track_time_interval(
+                self.hass, self.async_dispatch, timedelta(seconds=DISPATCH_INTERVAL)
+            )
+        else:
+            self._dispatcher = self.hass.async_create_background_task(
+                self._async_dispatch_loop(), name='peaqev observer dispatcher'
+            )
+
+    def stop(self) -> None:
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        if self._retry_handle is not None:
+            self._retry_handle.cancel()
+            self._retry_handle = None
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+    def diagnostics(self) -> dict:
+        return {"dispatch_mode": self.dispatch_mode.value, **super().diagnostics()}
+
+    def _create_task(self, coro, name: str) -> None:
+        self.hass.async_create_task(coro, name=name)
 
-    async def async_broadcast_separator(self, func, command: Command):
-        if await async_iscoroutine(func):
-            await self.async_call_func(func=func, command=command),
+    def _schedule_delivery(self, command: Command) -> None:
+        if self.hass.loop_thread_id == threading.get_ident():
+            super()._schedule_delivery(command)
         else:
+            self.hass.loop.call_soon_threadsafe(self._schedule_delivery, command)
+
+    def _signal_dispatch(self) -> None:
+        if self._dispatcher is None:
+            return
+        if self.hass.loop_thread_id == threading.get_ident():
+            self._wakeup.set()
+        else:
+            self.hass.loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _async_dispatch_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                await self.async_dispatch()
+            except Exception as e:
+                _LOGGER.error(f'Observer dispatch failed: {e}')
+            self._schedule_retry()
+
+    def _schedule_retry(self) -> None:
+        """Wake again when the first throttled command is allowed through, instead of ticking while idle."""
+        if self._retry_handle is not None:
+            self._retry_handle.cancel()
+            self._retry_handle = None
+        delay = self.seconds_until_next_broadcast()
+        if delay is not None:
+            self._retry_handle = self.hass.loop.call_later(delay, self._wakeup.set)
+
+    async def async_broadcast_separator(self, sub: Subscriber, command: Command):
+        if sub.is_coroutine:
+            await self.async_call_func(sub, command)
+        elif sub.blocking:
             await self.hass.async_add_executor_job(
-                self._call_func, func, command
+                self._call_func, sub, command
             )
+        else:
+            self._call_func(sub, command)
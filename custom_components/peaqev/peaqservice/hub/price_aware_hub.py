@@ -3,7 +3,6 @@ from datetime import datetime
 
 from homeassistant.core import HomeAssistant
 
-from custom_components.peaqev.peaqservice.hub.const import LookupKeys
 from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
 from custom_components.peaqev.peaqservice.hub.max_min_controller import \
     MaxMinController
@@ -11,6 +10,10 @@ from custom_components.peaqev.peaqservice.hub.models.hub_options import \
     HubOptions
 from custom_components.peaqev.peaqservice.hub.observer.iobserver_coordinator import \
     IObserver
+from custom_components.peaqev.peaqservice.hub.price_refresh import \
+    PriceRefreshScheduler
+from custom_components.peaqev.peaqservice.hub.shared_price_source import \
+    SharedPriceSource
 from custom_components.peaqev.peaqservice.util.schedule_options_handler import \
     SchedulerOptionsHandler
 
@@ -21,28 +24,40 @@ class PriceAwareHub(HomeAssistantHub):
         super().__init__(hass, options, domain, observer)
         self.max_min_controller = MaxMinController(self)
         self._scheduler_options_handler = SchedulerOptionsHandler(self)
+        self.price_source: SharedPriceSource | None = None
 
     @property
     def scheduler_options_handler(self) -> SchedulerOptionsHandler:
         return self._scheduler_options_handler
 
+    @property
+    def price_refresh(self) -> PriceRefreshScheduler:
+        return self.price_source.price_refresh
+
     @property
     def current_peak_dynamic(self):
         """Dynamically calculated peak to adhere to caution-hours"""
+        snapshot = self.snapshot
         if self.hours.scheduler.active:
-            return self.sensors.current_peak.observed_peak
-        dynamic_caution_hours: dict = self._request_sensor_lookup().get(LookupKeys.DYNAMIC_CAUTION_HOURS, {})()
-        if len(dynamic_caution_hours) > 0:
-            if self.now_is_caution_hour() and not getattr(self.hours.timer, 'is_override', False):
-                return self.sensors.current_peak.observed_peak * dynamic_caution_hours.get(datetime.now().replace(minute=0, second=0, microsecond=0), 1)
-        return self.sensors.current_peak.observed_peak
+            return snapshot.current_peak
+        permittance = snapshot.slots.caution_permittance(datetime.now())
+        if permittance is not None and not getattr(self.hours.timer, 'is_override', False):
+            return snapshot.current_peak * permittance
+        return snapshot.current_peak
 
     async def async_is_caution_hour(self) -> bool:
         return False
 
     async def async_update_spotprice(self) -> None:
-        await self.spotprice.async_update_spotprice()
+        await self.price_source.async_refresh_from_entity()
+
+    async def async_setup(self):
+        await super().async_setup()
+        self.price_source.start()
 
+    def stop(self) -> None:
+        super().stop()
+        self.price_source.remove(self)
 
     @property
     def watt_cost(self) -> int:
@@ -60,6 +75,8 @@ class PriceAwareHub(HomeAssistantHub):
 
     async def async_update_prices(self, prices: list) -> None:
         await self.hours.async_update_prices(prices[0], prices[1])
+        self.model.price_version += 1
+        self.invalidate_snapshot()
         if self.max_min_controller.is_on:
             await self.hours.async_update_max_min(
                 max_charge=self.max_min_controller.max_charge,
@@ -78,5 +95,5 @@ class PriceAwareHub(HomeAssistantHub):
 
     def _check_max_min_total_charge(self, ret:dict) -> None:
         if 'max_charge' in ret.keys():
-            self.max_min_controller._original_total_charge = ret['max_charge'][0]
+            self.max_min_controller.original_total_charge = ret['max_charge'][0]
             # todo: 247
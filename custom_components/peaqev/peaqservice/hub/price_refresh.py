@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.event import (async_track_time_change,
+                                         async_track_time_interval)
+
+from custom_components.peaqev.peaqservice.hub.const import (
+    PRICE_CHECK_INTERVAL, PRICE_FRESHNESS_BUDGET, PRICE_PUBLICATION_HOURS,
+    PRICE_PUBLICATION_RETRY_MINUTES, PRICE_SLOT_MINUTES,
+    PRICE_SLOT_OFFSET_SECONDS, PriceRefreshReason)
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.shared_price_source import \
+        SharedPriceSource
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PriceRefreshScheduler:
+    """
+    Keeps the spotprice fresh on its own clock, so power events never pay for a price refresh.
+    Wakes at slot boundaries and publication time, on changes of the price entity and
+    whenever the copy is older than the freshness budget.
+    """
+    def __init__(self, hub: SharedPriceSource, state_machine, freshness_budget: float = PRICE_FRESHNESS_BUDGET):
+        self._hub = hub
+        self.state_machine = state_machine
+        self.freshness_budget = freshness_budget
+        self.latest_refresh: float = 0
+        self.refreshes: Counter = Counter()
+        self._refreshing: bool = False
+        self._pending: PriceRefreshReason | None = None
+        self._unsubs: list = []
+
+    def start(self) -> None:
+        self._unsubs = [
+            async_track_time_change(
+                self.state_machine, self._async_on_slot, minute=PRICE_SLOT_MINUTES, second=PRICE_SLOT_OFFSET_SECONDS
+            ),
+            async_track_time_change(
+                self.state_machine,
+                self._async_on_publication,
+                hour=PRICE_PUBLICATION_HOURS,
+                minute=list(range(0, 60, PRICE_PUBLICATION_RETRY_MINUTES)),
+                second=PRICE_SLOT_OFFSET_SECONDS,
+            ),
+            async_track_time_interval(
+                self.state_machine, self._async_on_check, timedelta(seconds=PRICE_CHECK_INTERVAL)
+            ),
+        ]
+
+    @property
+    def is_running(self) -> bool:
+        return len(self._unsubs) > 0
+
+    def stop(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.latest_refresh
+
+    async def _async_on_slot(self, *args) -> None:
+        await self.async_refresh(PriceRefreshReason.Slot)
+
+    async def _async_on_publication(self, *args) -> None:
+        await self.async_refresh(PriceRefreshReason.Publication)
+
+    async def _async_on_check(self, *args) -> None:
+        if not self._hub.prices_initialized:
+            await self.async_refresh(PriceRefreshReason.Uninitialized)
+        elif self.age > self.freshness_budget:
+            await self.async_refresh(PriceRefreshReason.Stale)
+
+    async def async_refresh(self, reason: PriceRefreshReason) -> None:
+        """
+        A refresh asked for while one runs is not dropped, the source may already hold newer prices
+        than the running one read. Such requests coalesce into one more refresh when it is done.
+        """
+        if self._refreshing:
+            self._pending = reason
+            return
+        self._refreshing = True
+        try:
+            while reason is not None:
+                await self._async_refresh(reason)
+                reason, self._pending = self._pending, None
+        finally:
+            self._refreshing = False
+
+    async def _async_refresh(self, reason: PriceRefreshReason) -> None:
+        try:
+            await self._hub.spotprice.async_update_spotprice()
+            self.latest_refresh = time.time()
+            self.refreshes[reason] += 1
+        except Exception as e:
+            _LOGGER.error(f'Unable to refresh spotprice ({reason.value}): {e}')
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Callable
+
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.models.initializer_types import \
+    InitializerTypes
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HubReadiness:
+    """
+    Tracks the components the hub waits for before it is initialized.
+    Pending components are probed when something that may have made them ready happens:
+    setup, a tracked state change, spotprice initialization or new prices. Once all have
+    reported, is_ready flips and HubInitialized is broadcast. Nothing is probed after that.
+    """
+    def __init__(self, hub: HomeAssistantHub):
+        self._hub = hub
+        self.started: float = time.monotonic()
+        self.is_ready: bool = False
+        self.ready_after: dict[InitializerTypes, float] = {}
+        self._pending: dict[InitializerTypes, Callable[[], bool]] | None = None
+        hub.observer.add(ObserverTypes.SpotpriceInitialized, self.async_check)
+        hub.observer.add(ObserverTypes.PricesChanged, self.async_check, stage=1)
+
+    @property
+    def pending(self) -> list[InitializerTypes]:
+        return list(self._pending or [])
+
+    def _required(self) -> dict[InitializerTypes, Callable[[], bool]]:
+        hub = self._hub
+        ret = {InitializerTypes.Hours: lambda: hub.hours.is_initialized}
+        if hub.options.price.price_aware:
+            ret[InitializerTypes.SpotPrice] = lambda: hub.spotprice.is_initialized
+        for init_type, attr in [
+            (InitializerTypes.CarPowerSensor, 'carpowersensor'),
+            (InitializerTypes.ChargerObjectSwitch, 'chargerobject_switch'),
+            (InitializerTypes.Power, 'power'),
+            (InitializerTypes.ChargerObject, 'chargerobject'),
+        ]:
+            if hasattr(getattr(hub, 'sensors', None), attr):
+                ret[init_type] = lambda a=attr: getattr(hub.sensors, a).is_initialized
+        ret[InitializerTypes.ChargerType] = lambda: hub.chargertype.is_initialized
+        return ret
+
+    async def async_check(self, *args) -> bool:
+        return self.check()
+
+    def check(self) -> bool:
+        if self.is_ready:
+            return True
+        if self._pending is None:
+            self._pending = self._required()
+        for init_type, probe in list(self._pending.items()):
+            if self._probe(probe):
+                del self._pending[init_type]
+                self.ready_after[init_type] = round(time.monotonic() - self.started, 3)
+                _LOGGER.debug(f'{init_type.value} is ready after {self.ready_after[init_type]}s.')
+        if self._pending:
+            return False
+        self.is_ready = True
+        _LOGGER.info('Hub is ready to use.')
+        _LOGGER.debug(
+            f'Hub is initialized with {self._hub.options.price.cautionhour_type} as cautionhourtype.'
+        )
+        self._hub.observer.activate(ObserverTypes.HubInitialized)
+        return True
+
+    @staticmethod
+    def _probe(probe: Callable[[], bool]) -> bool:
+        try:
+            return bool(probe())
+        except AttributeError:
+            """component not created yet"""
+            return False
+
+    def diagnostics(self) -> dict:
+        return {
+            "ready": self.is_ready,
+            "pending": [p.value for p in self.pending],
+            "ready_after": {k.value: v for k, v in self.ready_after.items()},
+        }
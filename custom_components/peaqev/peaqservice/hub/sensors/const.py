@@ -12,3 +12,7 @@ POWER_TREND_SENSOR = "power_trend"
 AMP_METER_SENSOR = "amp_meter"
 CHARGEROBJECT_SENSOR = "chargerobject"
 CHARGEROBJECT_SWITCH_SENSOR = "chargerobject_switch"
+POWER_AVERAGE_WINDOWS = {"1min": 60, "15min": 900, "hour": 3600}
+"""served next to the 5 minute power average from the same readings"""
+HOUSE_POWER_SERIES_CAPACITY = 600
+"""the average consumption sensors keep no readings, this is only for the ingestion rate"""
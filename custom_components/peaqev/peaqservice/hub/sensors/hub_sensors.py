@@ -3,8 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from functools import partial
 
-from peaqevcore.common.average import Average
-from peaqevcore.common.trend import Gradient
 from peaqevcore.models.hub.hubmember import HubMember
 from peaqevcore.models.hub.power import Power
 
@@ -15,6 +13,12 @@ from custom_components.peaqev.peaqservice.hub.models.hub_options import \
 from custom_components.peaqev.peaqservice.hub.sensors.const import *
 from custom_components.peaqev.peaqservice.hub.sensors.hub_sensors_base import \
     HubSensorsBase
+from custom_components.peaqev.peaqservice.hub.sensors.models.average import \
+    Average
+from custom_components.peaqev.peaqservice.hub.sensors.models.power_series import (
+    PowerSeries, SeriesTrend)
+from custom_components.peaqev.peaqservice.powertools.site_allocator.site_allocator import \
+    SiteAllocator
 from custom_components.peaqev.peaqservice.util.extensionmethods import nametoid
 
 
@@ -24,12 +28,17 @@ class HubSensors(HubSensorsBase):
     powersensormovingaverage24: HubMember = field(init=False)
     power_sensor_moving_average_5: Average = field(init=False)
     power: Power = field(init=False)
-    power_trend: Gradient = field(init=False)
+    power_trend: SeriesTrend = field(init=False)
+    power_series: PowerSeries = field(init=False)
+    house_power_series: PowerSeries = field(init=False)
 
     async def async_setup(
         self, options: HubOptions, state_machine, domain: str, chargerobject
     ):
         await self.async_setup_base(options, state_machine, domain, chargerobject)
+        self.power_series = SiteAllocator.get(state_machine, options.powersensor).power_series
+        """total power is appended here once per site, the averages and the trend of every hub on it are views"""
+        self.house_power_series = PowerSeries(HOUSE_POWER_SERIES_CAPACITY)
 
         regular_sensors: dict = {
             POWERSNSRMOVINGAVERAGE_SENSOR: partial(
@@ -42,7 +51,9 @@ class HubSensors(HubSensorsBase):
                 Average,
                 max_age=300,
                 max_samples=300,
-                precision=0
+                precision=0,
+                windows=POWER_AVERAGE_WINDOWS,
+                series=self.power_series,
             ), #not lite
             POWERSNSRMOVINGAVERAGE24_SENSOR: partial(
                 HubMember,
@@ -56,7 +67,8 @@ class HubSensors(HubSensorsBase):
                 powersensor_includes_car=options.powersensor_includes_car,
             ),
             POWER_TREND_SENSOR: partial(
-                Gradient,
+                SeriesTrend,
+                series=self.power_series,
                 max_age=300,
                 max_samples=300,
                 precision=0
@@ -67,3 +79,9 @@ class HubSensors(HubSensorsBase):
         if not options.peaqev_lite:
             sensors.update(regular_sensors)
         self._set_sensors(sensors)
+
+    def detach(self) -> None:
+        """the site's series outlives the hub, so its views must let go of it"""
+        for view in (getattr(self, 'power_sensor_moving_average_5', None), getattr(self, 'power_trend', None)):
+            if view is not None:
+                view.detach()
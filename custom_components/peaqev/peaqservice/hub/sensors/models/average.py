@@ -1,44 +1,67 @@
+from __future__ import annotations
+
 import time
-from statistics import mean
+from dataclasses import dataclass
+
+from custom_components.peaqev.peaqservice.hub.sensors.models.power_series import (
+    POWER_SERIES_CAPACITY, PowerSeries, SeriesWindow)
+
+DEFAULT_WINDOW = 'default'
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    mean: float
+    min: float
+    max: float
+    count: int
 
 
 class Average:
-    def __init__(self, max_age: int, max_samples: int, precision: int = 2):
-        self._readings = []
-        self._average = 0
-        self._max_age = max_age
-        self._max_samples = max_samples
+    """
+    Streaming average over max_age seconds and at most max_samples readings.
+    Extra windows, given as name: max_age, are views on the same readings.
+    Given a shared series the readings come from whoever appends to it, otherwise add_reading fills a private one.
+    """
+    def __init__(
+            self,
+            max_age: int,
+            max_samples: int,
+            precision: int = 2,
+            windows: dict[str, int] | None = None,
+            series: PowerSeries | None = None
+    ):
         self._precision = precision
-        self._latest_update = 0
+        if series is None:
+            series = (
+                PowerSeries(POWER_SERIES_CAPACITY, span=max(max_age, *windows.values())) if windows
+                else PowerSeries(max_samples)
+            )
+        self.series = series
+        self._windows: dict[str, SeriesWindow] = {DEFAULT_WINDOW: SeriesWindow(series, max_age, max_samples)}
+        for name, age in (windows or {}).items():
+            self._windows[name] = SeriesWindow(series, age)
 
     @property
     def average(self) -> float:
-        self._set_average()
-        return round(self._average, self._precision)
+        return round(self._windows[DEFAULT_WINDOW].mean, self._precision)
+
+    @property
+    def windows(self) -> list[str]:
+        return list(self._windows)
 
-    def _set_average(self):
-        try:
-            self._average = mean([x[1] for x in self._readings])
-        except ZeroDivisionError:
-            self._average = 0
+    def stats(self, window: str = DEFAULT_WINDOW) -> WindowStats:
+        w = self._windows[window]
+        if not w.count:
+            return WindowStats(0, 0, 0, 0)
+        return WindowStats(w.mean, w.min, w.max, w.count)
 
     def readings(self) -> list:
-        return self._readings
-
-    def _remove_from_list(self):
-        """Removes overflowing number of samples and old samples from the list."""
-        while len(self._readings) > self._max_samples:
-            self._readings.pop(0)
-        gen = (
-            x for x in self._readings if time.time() - int(x[0]) > self._max_age
-        )
-        for i in gen:
-            if len(self._readings) > 1:
-                # Always keep one reading
-                self._readings.remove(i)
+        return [(int(t), val) for t, val in self._windows[DEFAULT_WINDOW].readings()]
 
     def add_reading(self, val: float):
-        self._readings.append((int(time.time()), round(val, 3)))
-        self._latest_update = time.time()
-        self._remove_from_list()
-        self._set_average()
\ No newline at end of file
+        self.series.append(round(val, 3), int(time.time()))
+
+    def detach(self) -> None:
+        for w in self._windows.values():
+            w.detach()
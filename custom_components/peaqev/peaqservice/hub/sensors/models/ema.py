@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import math
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.sensors.models.power_series import \
+        PowerSeries
+
 BASEFACTOR = 4.9204
+SAMPLE_SECONDS = 4
+"""the poll interval the smoothing factor was tuned for, used to turn it into a time constant"""
+
 
 class EMA:
+    """
+    Time-weighted exponential moving average. A reading holds until the next one, and the weight of an interval
+    depends on its length, so unevenly spaced readings give the same average as evenly spaced ones.
+    Attached to a series it is a view on it and calls on_change whenever the rounded average moves.
+    """
     def __init__(self, len_avg, smoothing_exp=1, precision=0):
         self._precision = precision
-        self.smoothing_factor = self.set_smoothing_factor(len_avg, smoothing_exp)
+        self.time_constant = self.set_time_constant(len_avg, smoothing_exp)
         self._latest_average = None
+        self._latest_sample: float | None = None
+        self._latest_time: float = 0
         self._imported_average_ready = False
+        self.series: PowerSeries | None = None
+        self.on_change: Callable[[float], None] | None = None
 
     @property
     def imported_average(self) -> bool:
@@ -21,13 +42,35 @@ class EMA:
     def latest_average(self) -> float:
         return round(self._latest_average, self._precision)
 
-    def set_smoothing_factor(self, len_avg, smoothing_exp) -> float:
-        ret = (BASEFACTOR / len_avg) / smoothing_exp
-        return ret
+    @staticmethod
+    def set_time_constant(len_avg, smoothing_exp) -> float:
+        """the time constant giving the smoothing (BASEFACTOR / len_avg) / smoothing_exp had per SAMPLE_SECONDS"""
+        return len_avg * smoothing_exp * SAMPLE_SECONDS / BASEFACTOR
 
-    def average(self, sample) -> float:
+    def average(self, sample, t: float | None = None) -> float:
+        t = time.time() if t is None else t
         if self._latest_average is None:
             self._latest_average = sample
-        alpha = self.smoothing_factor
-        self._latest_average = alpha * sample + (1 - alpha) * self._latest_average
+        elif self._latest_sample is not None:
+            alpha = 1 - math.exp(-max(t - self._latest_time, 0) / self.time_constant)
+            self._latest_average += alpha * (self._latest_sample - self._latest_average)
+        self._latest_sample = sample
+        self._latest_time = t
         return self.latest_average
+
+    def attach(self, series: PowerSeries, on_change: Callable[[float], None]) -> Callable[[], None]:
+        """Returns the callable that detaches it again"""
+        self.series = series
+        self.on_change = on_change
+        series.register(self)
+        return partial(series.unregister, self)
+
+    def add(self, index: int) -> None:
+        before = None if self._latest_average is None else self.latest_average
+        ret = self.average(self.series.value_at(index), self.series.time_at(index))
+        if ret != before and self.on_change is not None:
+            self.on_change(ret)
+
+    def drop_until(self, index: int) -> None:
+        """keeps no readings of its own"""
+        pass
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections import deque
+
+POWER_SERIES_CAPACITY = 4096
+"""readings a series starts out with, 64 kB"""
+POWER_SERIES_MAX_CAPACITY = 65536
+"""readings a series grows to at most, 1 MB. An hour of readings at up to 18 per second"""
+
+
+class PowerSeries:
+    """
+    The readings of one power sensor as (timestamp, value) in two array('d') rings.
+    Readings get an ever-growing index. Views read the slots they need and are told about every append,
+    so the series is the only place readings are stored and the only place they come in.
+    A full ring doubles, up to POWER_SERIES_MAX_CAPACITY, as long as it holds less than span seconds of readings,
+    so the longest view stays whole however fast the sensor reports.
+    """
+    def __init__(self, capacity: int = POWER_SERIES_CAPACITY, span: float = 0):
+        self.capacity = capacity
+        self.span = span
+        self._times = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+        self._count: int = 0
+        self._first: int = 0
+        """the oldest index still valid after the ring was last grown"""
+        self._views: list = []
+        """anything with add(index) and drop_until(index)"""
+
+    @property
+    def count(self) -> int:
+        """readings appended so far, which is also the index of the next one"""
+        return self._count
+
+    @property
+    def oldest_index(self) -> int:
+        return max(self._first, self._count - self.capacity)
+
+    @property
+    def held_seconds(self) -> float:
+        if self._count == 0:
+            return 0
+        return self.time_at(self._count - 1) - self.time_at(self.oldest_index)
+
+    def register(self, view) -> None:
+        self._views.append(view)
+
+    def unregister(self, view) -> None:
+        if view in self._views:
+            self._views.remove(view)
+
+    def time_at(self, index: int) -> float:
+        return self._times[index % self.capacity]
+
+    def value_at(self, index: int) -> float:
+        return self._values[index % self.capacity]
+
+    def append(self, val: float, t: float | None = None) -> None:
+        index = self._count
+        t = time.time() if t is None else t
+        if index - self.capacity >= self._first and self._should_grow(t):
+            self._grow()
+        if index - self.capacity >= self._first:
+            """the slot about to be written still holds index - capacity, views must let go of it first"""
+            for view in self._views:
+                view.drop_until(index - self.capacity + 1)
+        slot = index % self.capacity
+        self._times[slot] = t
+        self._values[slot] = val
+        self._count += 1
+        for view in self._views:
+            view.add(index)
+
+    def _should_grow(self, t: float) -> bool:
+        return self.capacity < POWER_SERIES_MAX_CAPACITY and t - self.time_at(self.oldest_index) < self.span
+
+    def _grow(self) -> None:
+        """indices stay the same, only their slots move, so views are not affected"""
+        capacity = min(self.capacity * 2, POWER_SERIES_MAX_CAPACITY)
+        times = array('d', bytes(8 * capacity))
+        values = array('d', bytes(8 * capacity))
+        first = self.oldest_index
+        for i in range(first, self._count):
+            times[i % capacity] = self.time_at(i)
+            values[i % capacity] = self.value_at(i)
+        self._times, self._values, self.capacity, self._first = times, values, capacity, first
+
+    def readings_per_minute(self) -> float:
+        stored = self._count - self.oldest_index
+        if stored < 2:
+            return 0
+        span = self.held_seconds
+        return round((stored - 1) * 60 / span, 2) if span > 0 else 0
+
+    def diagnostics(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "span": self.span,
+            "stored": self._count - self.oldest_index,
+            "held_seconds": round(self.held_seconds),
+            "ingested": self._count,
+            "readings_per_minute": self.readings_per_minute(),
+            "views": len(self._views),
+        }
+
+
+class SeriesWindow:
+    """
+    The readings of a series within max_age seconds and at most max_samples of them, as a range of indices.
+    Readings at or below ignore are skipped. Keeps a running sum for the mean and monotonic index deques for min and max,
+    so adding and evicting are amortized O(1). The newest `keep` readings stay regardless of age.
+    """
+    def __init__(self, series: PowerSeries, max_age: int, max_samples: int | None = None, keep: int = 1, ignore: float | None = None):
+        self.series = series
+        self._max_age = max_age
+        self._max_samples = max_samples
+        self._keep = keep
+        self._ignore = ignore
+        self._head: int = series.count
+        self._end: int = series.count
+        self._adds: int = 0
+        self._reset()
+        series.register(self)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0
+
+    @property
+    def min(self) -> float:
+        return self.series.value_at(self._mins[0]) if self._mins else 0
+
+    @property
+    def max(self) -> float:
+        return self.series.value_at(self._maxs[0]) if self._maxs else 0
+
+    def readings(self) -> list:
+        return [
+            (self.series.time_at(i), self.series.value_at(i))
+            for i in range(self._head, self._end) if self._accepts(self.series.value_at(i))
+        ]
+
+    def add(self, index: int) -> None:
+        self._end = index + 1
+        val = self.series.value_at(index)
+        if not self._accepts(val):
+            return
+        self._include(index, val)
+        if self._max_samples is not None:
+            while self._count > self._max_samples:
+                self._pop_head()
+        oldest = time.time() - self._max_age
+        while self._count > self._keep and self.series.time_at(self._head) < oldest:
+            self._pop_head()
+        self._adds += 1
+        if self._adds >= self._count:
+            """rebuild from scratch once per window length so float rounding in the running sums can't build up"""
+            self._resync()
+
+    def detach(self) -> None:
+        self.series.unregister(self)
+
+    def drop_until(self, index: int) -> None:
+        while self._head < min(index, self._end):
+            self._pop_head()
+        self._head = max(self._head, index)
+
+    def _accepts(self, val: float) -> bool:
+        return self._ignore is None or val > self._ignore
+
+    def _reset(self) -> None:
+        self._count: int = 0
+        self._sum: float = 0
+        self._mins: deque[int] = deque()
+        self._maxs: deque[int] = deque()
+
+    def _resync(self) -> None:
+        self._adds = 0
+        self._reset()
+        for i in range(self._head, self._end):
+            val = self.series.value_at(i)
+            if self._accepts(val):
+                self._include(i, val)
+
+    def _include(self, index: int, val: float) -> None:
+        self._count += 1
+        self._sum += val
+        values = self.series
+        while self._mins and values.value_at(self._mins[-1]) >= val:
+            self._mins.pop()
+        self._mins.append(index)
+        while self._maxs and values.value_at(self._maxs[-1]) <= val:
+            self._maxs.pop()
+        self._maxs.append(index)
+
+    def _exclude(self, index: int, val: float) -> None:
+        self._count -= 1
+        self._sum -= val
+        if self._mins and self._mins[0] == index:
+            self._mins.popleft()
+        if self._maxs and self._maxs[0] == index:
+            self._maxs.popleft()
+
+    def _pop_head(self) -> None:
+        index = self._head
+        self._head += 1
+        val = self.series.value_at(index)
+        if self._accepts(val):
+            self._exclude(index, val)
+
+
+class SeriesTrend(SeriesWindow):
+    """Least squares slope of the window in units per hour, from running sums of t, v, t*v and t*t."""
+    def __init__(self, series: PowerSeries, max_age: int, max_samples: int | None = None, precision: int = 2):
+        self._precision = precision
+        super().__init__(series, max_age, max_samples, keep=2)
+
+    @property
+    def samples(self) -> int:
+        return self._count
+
+    @property
+    def gradient(self) -> float:
+        n = self._count
+        denominator = n * self._sxx - self._sx ** 2
+        if n < 2 or math.isclose(denominator, 0, abs_tol=1e-12):
+            return 0
+        return round((n * self._sxy - self._sx * self._sum) / denominator, self._precision)
+
+    def _hours(self, index: int) -> float:
+        """hours since the first reading after the last reset, which keeps the squares small enough for the running sums"""
+        t = self.series.time_at(index)
+        if self._origin is None:
+            self._origin = t
+        return (t - self._origin) / 3600
+
+    def _reset(self) -> None:
+        """a resync moves the origin up to the oldest reading, so the sums stay small however long it runs"""
+        super()._reset()
+        self._origin: float | None = None
+        self._sx: float = 0
+        self._sxy: float = 0
+        self._sxx: float = 0
+
+    def _include(self, index: int, val: float) -> None:
+        super()._include(index, val)
+        x = self._hours(index)
+        self._sx += x
+        self._sxy += x * val
+        self._sxx += x * x
+
+    def _exclude(self, index: int, val: float) -> None:
+        super()._exclude(index, val)
+        x = self._hours(index)
+        self._sx -= x
+        self._sxy -= x * val
+        self._sxx -= x * x
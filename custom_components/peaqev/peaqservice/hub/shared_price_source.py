@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from peaqevcore.common.models.observer_types import ObserverTypes
+from peaqevcore.common.models.peaq_system import PeaqSystem
+from peaqevcore.common.spotprice.spotprice_factory import SpotPriceFactory
+from peaqevcore.common.spotprice.spotpricebase import SpotPriceBase
+
+from custom_components.peaqev.peaqservice.hub.const import (
+    PRICE_SOURCES, PriceRefreshReason)
+from custom_components.peaqev.peaqservice.hub.price_refresh import \
+    PriceRefreshScheduler
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.models.hub_options import \
+        HubOptions
+    from custom_components.peaqev.peaqservice.hub.price_aware_hub import \
+        PriceAwareHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SharedPriceSource:
+    """
+    One spotprice reader for all hubs that read the same price entity.
+    Stands in as the hub of the spotprice: its broadcasts and new prices are passed on to every member hub,
+    and a single PriceRefreshScheduler keeps it fresh for all of them.
+    """
+    def __init__(self, state_machine, key: tuple):
+        self.state_machine = state_machine
+        self.key = key
+        self.members: list[PriceAwareHub] = []
+        self.spotprice: SpotPriceBase | None = None
+        self.price_refresh = PriceRefreshScheduler(self, state_machine)
+        self.deduplicated: int = 0
+        self._refreshed_state = None
+
+    @staticmethod
+    async def async_join(hub: PriceAwareHub) -> SharedPriceSource:
+        sources: dict = hub.state_machine.data.setdefault(PRICE_SOURCES, {})
+        key = (hub.options.price.spotprice_type, hub.options.price.custom_sensor)
+        if key not in sources:
+            sources[key] = SharedPriceSource(hub.state_machine, key)
+        await sources[key].async_add(hub)
+        return sources[key]
+
+    @property
+    def observer(self) -> SharedPriceSource:
+        return self
+
+    @property
+    def options(self) -> HubOptions:
+        """The spotprice turns price awareness off here when it finds no price entity. todo: composition"""
+        return self.members[0].options
+
+    @property
+    def prices_initialized(self) -> bool:
+        return all(hub.hours.is_initialized for hub in self.members)
+
+    async def async_add(self, hub: PriceAwareHub) -> None:
+        self.members.append(hub)
+        if self.spotprice is None:
+            self.spotprice = SpotPriceFactory.create(
+                hub=self,
+                observer=self,
+                system=PeaqSystem.PeaqEv,
+                test=False,
+                is_active=True,
+                custom_sensor=hub.options.price.custom_sensor,
+                spotprice_type=hub.options.price.spotprice_type,
+            )
+            return
+        hub.options.price.price_aware = self.options.price.price_aware
+        if self.spotprice.is_initialized:
+            """the initial prices went out before this hub joined"""
+            await hub.async_update_prices(self.spotprice.callback_export_prices())
+            await hub.observer.async_broadcast(ObserverTypes.SpotpriceInitialized)
+
+    def remove(self, hub: PriceAwareHub) -> None:
+        if hub in self.members:
+            self.members.remove(hub)
+        if not self.members:
+            self.price_refresh.stop()
+            self.state_machine.data.get(PRICE_SOURCES, {}).pop(self.key, None)
+
+    def start(self) -> None:
+        if not self.price_refresh.is_running:
+            self.price_refresh.start()
+
+    async def async_broadcast(self, command: ObserverTypes, argument=None) -> None:
+        for hub in list(self.members):
+            await hub.observer.async_broadcast(command, argument)
+
+    async def async_update_prices(self, prices: list) -> None:
+        for hub in list(self.members):
+            await hub.async_update_prices(prices)
+
+    async def async_refresh_from_entity(self) -> None:
+        """Every member reports a change of the price entity. Only the first report of a new state refreshes."""
+        entity = self.spotprice.entity if self.spotprice is not None else None
+        state = self.state_machine.states.get(entity) if entity else None
+        if state is not None and state is self._refreshed_state:
+            self.deduplicated += 1
+            return
+        self._refreshed_state = state
+        await self.price_refresh.async_refresh(PriceRefreshReason.PriceEntity)
+
+    def diagnostics(self) -> dict:
+        return {
+            "members": [hub.model.domain for hub in self.members],
+            "deduplicated": self.deduplicated,
+            "refreshes": {k.name: v for k, v in self.price_refresh.refreshes.items()},
+        }
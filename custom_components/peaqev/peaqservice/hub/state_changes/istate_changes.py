@@ -13,39 +13,76 @@ from custom_components.peaqev.peaqservice.chargertypes.models.chargertypes_enum
 if TYPE_CHECKING:
     from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
 
+import asyncio
 import logging
+import time
 from abc import abstractmethod
+from collections import defaultdict
 from datetime import datetime
+from typing import Awaitable, Callable
+
+from custom_components.peaqev.peaqservice.hub.observer.models.latency_stats import \
+    LatencyStats
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class StateChangesBase:
-    latest_spotprice_update = WaitTimer(timeout=60)
     latest_outlet_update = WaitTimer(timeout=10)
 
     def __init__(self, hub: HomeAssistantHub):
         self.hub = hub
+        self.handler_time: defaultdict[str, LatencyStats] = defaultdict(LatencyStats)
+        self._dispatch_table: dict[str, Callable[[any], Awaitable[bool | None]]] = {}
+        self._dispatch_source: tuple = (None, None)
+        self._batched_entities: frozenset = frozenset()
+        self._pending: dict[str, any] = {}
+        self._pending_session: bool = False
+        self._window_task: asyncio.Task | None = None
+        self.coalesced_updates: int = 0
+        self._scheduler_inputs: tuple | None = None
+        self.scheduler_updates_skipped: int = 0
 
     async def async_update_sensor(self, entity, value):
         update_session = await self.async_update_sensor_internal(entity, value)
-        await self.hub.observer.async_broadcast(ObserverTypes.ProcessChargeController)
-        if self.hub.options.price.price_aware:  # todo: strategy should handle this
-            await self.hub.observer.async_broadcast(ObserverTypes.ResetMaxMinChargeSensor)
-            if entity != self.hub.spotprice.entity and (
-                not self.hub.hours.is_initialized
-                or self.latest_spotprice_update.is_timeout()
-            ):
-                """tweak to provoke spotprice to update more often"""
-                self.latest_spotprice_update.update()
-                await self.hub.spotprice.async_update_spotprice()
+        if self.hub.options.ingestion_window > 0 and entity in self.batched_entities:
+            """every sample has fed power, canary and trend above. The decisions run once per window"""
+            if entity in self._pending:
+                self.coalesced_updates += 1
+            self._pending[entity] = value
+            self._pending_session = self._pending_session or update_session
+            if self._window_task is None:
+                self._window_task = self.hub.state_machine.async_create_task(
+                    self._async_close_window(), name='peaqev ingestion window'
+                )
+            return
+        await self.async_process_update((entity,), update_session)
+
+    def stop(self) -> None:
+        """drops a window that is still open, its readings have already fed power, canary and trend"""
+        if self._window_task is not None:
+            self._window_task.cancel()
+            self._window_task = None
+        self._pending, self._pending_session = {}, False
+
+    async def _async_close_window(self) -> None:
+        await asyncio.sleep(self.hub.options.ingestion_window)
+        entities, update_session = tuple(self._pending), self._pending_session
+        self._pending, self._pending_session = {}, False
+        self._window_task = None
+        try:
+            await self.async_process_update(entities, update_session)
+        except Exception as e:
+            _LOGGER.error(f'Unable to process batched update for {entities}: {e}')
 
+    async def async_process_update(self, entities: tuple, update_session: bool) -> None:
+        await self.hub.observer.async_broadcast(ObserverTypes.ProcessChargeController)
         await self.async_handle_sensor_attribute()
         await self.async_update_session_parameters(update_session)
 
         if all(
             [
-                entity in self.hub.model.chargingtracker_entities,
+                any(e in self.hub.model.chargingtracker_entities for e in entities),
                 self.hub.is_initialized,
                 self.hub.chargertype is not ChargerType.NoCharger,  # todo: strategy should handle this
             ]
@@ -69,6 +106,10 @@ class StateChangesBase:
                         float(self.hub.spotprice.state)
                     )
             if getattr(self.hub.hours.scheduler, 'schedule_created', False):
+                inputs = self._get_scheduler_inputs()
+                if inputs == self._scheduler_inputs:
+                    self.scheduler_updates_skipped += 1
+                    return
                 dto = UpdateSchedulerDTO(
                     moving_avg24=self.hub.sensors.powersensormovingaverage24.value,
                     peak=self.hub.current_peak_dynamic,
@@ -78,9 +119,46 @@ class StateChangesBase:
                     chargecontroller_state=self.hub.chargecontroller.status_type
                 )
                 await self.hub.hours.scheduler.async_update_facade(dto)
+                self._scheduler_inputs = inputs
         except Exception as e:
             _LOGGER.exception(f'Unable to update session parameters: {e}')
 
+    def _get_scheduler_inputs(self) -> tuple:
+        """
+        Everything the scheduler facade depends on. The current minute is part of it since
+        the scheduler checks its departure time on every update.
+        """
+        scheduler = self.hub.hours.scheduler
+        return (
+            self.hub.sensors.powersensormovingaverage24.value,
+            self.hub.current_peak_dynamic,
+            self.hub.chargecontroller.session.session_energy,
+            self.hub.model.price_version,
+            self.hub.chargecontroller.status_type,
+            scheduler.model.departuretime,
+            scheduler.model.desired_charge,
+            datetime.now().replace(second=0, microsecond=0),
+        )
+
+    async def async_update_power(self, carpowersensor_value, config_sensor_value) -> None:
+        """Updates total and house power. House power is pushed to the average consumption sensors from here"""
+        await self.hub.sensors.power.async_update(
+            carpowersensor_value=carpowersensor_value,
+            config_sensor_value=config_sensor_value,
+        )
+        if hasattr(self.hub.sensors, 'house_power_series'):
+            house = self.hub.sensors.power.house.value
+            if house is not None:
+                self.hub.sensors.house_power_series.append(float(house))
+
+    def _update_total_power(self) -> None:
+        """every power path that computes a total puts it in the site's series the canary, averages and trend read"""
+        if self.hub.site is None or self.hub.site.feeds(self.hub):
+            self.hub.sensors.power_series.append(self.hub.sensors.power.total.value)
+        self.hub.power.power_canary.total_power = (
+            self.hub.sensors.power.total.value
+        )
+
     async def async_handle_sensor_attribute(self) -> None:
         if hasattr(self.hub.sensors, 'carpowersensor'):
             if self.hub.sensors.carpowersensor.use_attribute:  # todo: strategy should handle this
@@ -91,7 +169,7 @@ class StateChangesBase:
                     ).attributes.get(entity.attribute)
                     if val is not None:
                         self.hub.sensors.carpowersensor.value = val
-                        await self.hub.sensors.power.async_update(
+                        await self.async_update_power(
                             carpowersensor_value=self.hub.sensors.carpowersensor.value,
                             config_sensor_value=None,
                         )
@@ -121,8 +199,55 @@ class StateChangesBase:
             except Exception as e:
                 _LOGGER.error(f'Unable to update max_min: {e}')
 
-    @abstractmethod
     async def async_update_sensor_internal(self, entity, value) -> bool:
+        handler = self.dispatch_table.get(entity)
+        if handler is None:
+            return False
+        started = time.monotonic()
+        try:
+            return bool(await handler(value))
+        finally:
+            self.handler_time[entity].add(time.monotonic() - started)
+
+    @property
+    def dispatch_table(self) -> dict:
+        """entity_id -> handler. Rebuilt only when the hub's sensors are re-created or the spotprice entity is found"""
+        sensors = getattr(self.hub, 'sensors', None)
+        spotprice_entity = self.spotprice_entity
+        if sensors is not self._dispatch_source[0] or spotprice_entity != self._dispatch_source[1]:
+            self._dispatch_table = self._build_dispatch_table()
+            self._dispatch_source = (sensors, spotprice_entity)
+        return self._dispatch_table
+
+    @property
+    def batched_entities(self) -> frozenset:
+        """high-frequency power meters, whose decisions are taken once per ingestion window"""
+        self.dispatch_table  # rebuilds _batched_entities together with the table when needed
+        return self._batched_entities
+
+    def _build_dispatch_table(self) -> dict:
+        table = {}
+        if getattr(self.hub, 'sensors', None) is None:
+            return table
+        self._batched_entities = frozenset(
+            e for e in (getattr(self.hub.options, 'powersensor', None), self._entity('carpowersensor')) if e
+        )
+        for entity, handler in self._routes():
+            if entity:
+                """first route wins, like the first matching case did"""
+                table.setdefault(entity, handler)
+        return table
+
+    def _entity(self, sensor: str) -> str | None:
+        return getattr(getattr(self.hub.sensors, sensor, None), 'entity', None)
+
+    @property
+    def spotprice_entity(self) -> str | None:
+        return getattr(getattr(self.hub, 'spotprice', None), 'entity', None)
+
+    @abstractmethod
+    def _routes(self) -> list[tuple[str, Callable[[any], Awaitable[bool | None]]]]:
+        """(entity_id, handler) pairs in priority order. A handler returns True when the session should update"""
         pass
 
     @abstractmethod
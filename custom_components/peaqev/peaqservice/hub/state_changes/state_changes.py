@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -25,55 +24,60 @@ class StateChanges(StateChangesBase):
 
     async def async_update_sensor_internal(self, entity, value) -> bool:
         try:
-            update_session = False
-            match entity:
-                case self.hub.options.powersensor:
-                    await self.async_handle_powersensor(value)
-                    update_session = True
-                case self.hub.sensors.carpowersensor.entity:
-                    await self.async_handle_carpowersensor(value)
-                    await self.async_handle_outlet_updates()
-                    update_session = True
-                case self.hub.sensors.chargerobject.entity:
-                    await self.hub.async_set_chargerobject_value(value)
-                case self.hub.sensors.chargerobject_switch.entity:
-                    await self.async_update_chargerobject_switch(value)
-                case self.hub.sensors.totalhourlyenergy.entity:
-                    await self.async_update_total_energy_and_peak(value)
-                case self.hub.sensors.powersensormovingaverage.entity:
-                    self.hub.sensors.powersensormovingaverage.value = value
-                case self.hub.sensors.powersensormovingaverage24.entity:
-                    self.hub.sensors.powersensormovingaverage24.value = value
-                case self.hub.spotprice.entity:
-                    await self.hub.async_update_spotprice()
-                    update_session = True
-            return update_session
+            return await super().async_update_sensor_internal(entity, value)
         except Exception as e:
             _LOGGER.error(f'async_update_sensor_internal for {entity}: {e}')
             return False
 
+    def _routes(self) -> list:
+        return [
+            (self.hub.options.powersensor, self._async_on_powersensor),
+            (self._entity('carpowersensor'), self._async_on_carpowersensor),
+            (self._entity('chargerobject'), self.hub.async_set_chargerobject_value),
+            (self._entity('chargerobject_switch'), self.async_update_chargerobject_switch),
+            (self._entity('totalhourlyenergy'), self.async_update_total_energy_and_peak),
+            (self._entity('powersensormovingaverage'), self._async_on_moving_average),
+            (self._entity('powersensormovingaverage24'), self._async_on_moving_average24),
+            (self.spotprice_entity, self._async_on_spotprice),
+        ]
+
+    async def _async_on_powersensor(self, value) -> bool:
+        await self.async_handle_powersensor(value)
+        return True
+
+    async def _async_on_carpowersensor(self, value) -> bool:
+        await self.async_handle_carpowersensor(value)
+        await self.async_handle_outlet_updates()
+        return True
+
+    async def _async_on_moving_average(self, value) -> None:
+        self.hub.sensors.powersensormovingaverage.value = value
+
+    async def _async_on_moving_average24(self, value) -> None:
+        self.hub.sensors.powersensormovingaverage24.value = value
+
+    async def _async_on_spotprice(self, value) -> bool:
+        await self.hub.async_update_spotprice()
+        return True
+
     async def async_handle_powersensor(self, value) -> None:
-        await self.hub.sensors.power.async_update(
+        await self.async_update_power(
             carpowersensor_value=self.hub.sensors.carpowersensor.value,
             config_sensor_value=value
         )
-        self.hub.power.power_canary.total_power = (
-            self.hub.sensors.power.total.value
-        )
-        self.hub.sensors.power_trend.add_reading(self.hub.sensors.power.total.value, time.time())
+        self._update_total_power()
 
     async def async_handle_carpowersensor(self, value) -> None:
         if self.hub.sensors.carpowersensor.use_attribute:
             return
         else:
             self.hub.sensors.carpowersensor.value = value
-            await self.hub.sensors.power.async_update(
+            await self.async_update_power(
                 carpowersensor_value=self.hub.sensors.carpowersensor.value,
                 config_sensor_value=None,
             )
-        self.hub.power.power_canary.total_power = (
-            self.hub.sensors.power.total.value
-        )
+        self._update_total_power()
+
     async def async_handle_outlet_updates(self):
         if self.hub.chargertype.type is ChargerType.Outlet:
             old_state = await self.hub.async_request_sensor_data(LookupKeys.CHARGEROBJECT_VALUE)
@@ -95,23 +99,22 @@ class StateChangesLite(StateChangesBase):
         self.hub = hub
         super().__init__(hub)
 
-    async def async_update_sensor_internal(self, entity, value) -> bool:
-        match entity:
-            case self.hub.sensors.carpowersensor.entity:
-                if self.hub.sensors.carpowersensor.use_attribute:
-                    pass
-                else:
-                    self.hub.sensors.carpowersensor.value = value
-                    await self._handle_outlet_updates()
-            case self.hub.sensors.chargerobject.entity:
-                await self.hub.async_set_chargerobject_value(value)
-            case self.hub.sensors.chargerobject_switch.entity:
-                await self.async_update_chargerobject_switch(value)
-            case self.hub.sensors.totalhourlyenergy.entity:
-                await self.async_update_total_energy_and_peak(value)
-            case self.hub.spotprice.entity:
-                await self.hub.async_update_spotprice()
-        return False
+    def _routes(self) -> list:
+        return [
+            (self._entity('carpowersensor'), self._async_on_carpowersensor),
+            (self._entity('chargerobject'), self.hub.async_set_chargerobject_value),
+            (self._entity('chargerobject_switch'), self.async_update_chargerobject_switch),
+            (self._entity('totalhourlyenergy'), self.async_update_total_energy_and_peak),
+            (self.spotprice_entity, self._async_on_spotprice),
+        ]
+
+    async def _async_on_carpowersensor(self, value) -> None:
+        if not self.hub.sensors.carpowersensor.use_attribute:
+            self.hub.sensors.carpowersensor.value = value
+            await self._handle_outlet_updates()
+
+    async def _async_on_spotprice(self, value) -> None:
+        await self.hub.async_update_spotprice()
 
     async def _handle_outlet_updates(self):
         if self.hub.chargertype.type is ChargerType.Outlet:
@@ -134,31 +137,34 @@ class StateChangesNoCharger(StateChangesBase):
         self.hub = hub
         super().__init__(hub)
 
-    async def async_update_sensor_internal(self, entity, value) -> bool:
-        update_session = False
-        match entity:
-            case self.hub.options.powersensor:
-                if isinstance(value, (float, int)):
-                    await self.hub.sensors.power.async_update(
-                        carpowersensor_value=0, config_sensor_value=value
-                    )
-                    update_session = True
-                    self.hub.power.power_canary.total_power = (
-                        self.hub.sensors.power.total.value
-                    )
-                    self.hub.sensors.power_trend.add_reading(self.hub.sensors.power.total.value, time.time())
-                    self.hub.sensors.power_sensor_moving_average_5.add_reading(self.hub.sensors.power.total.value)
-            case self.hub.sensors.totalhourlyenergy.entity:
-                await self.async_update_total_energy_and_peak(value)
-            case self.hub.sensors.powersensormovingaverage.entity:
-                _LOGGER.debug(f'trying to update powersensormovingaverage with {value}')
-                self.hub.sensors.powersensormovingaverage.value = value
-            case self.hub.sensors.powersensormovingaverage24.entity:
-                self.hub.sensors.powersensormovingaverage24.value = value
-            case self.hub.spotprice.entity:
-                await self.hub.async_update_spotprice()
-                update_session = True
-        return update_session
+    def _routes(self) -> list:
+        return [
+            (self.hub.options.powersensor, self._async_on_powersensor),
+            (self._entity('totalhourlyenergy'), self.async_update_total_energy_and_peak),
+            (self._entity('powersensormovingaverage'), self._async_on_moving_average),
+            (self._entity('powersensormovingaverage24'), self._async_on_moving_average24),
+            (self.spotprice_entity, self._async_on_spotprice),
+        ]
+
+    async def _async_on_powersensor(self, value) -> bool:
+        if isinstance(value, (float, int)):
+            await self.async_update_power(
+                carpowersensor_value=0, config_sensor_value=value
+            )
+            self._update_total_power()
+            return True
+        return False
+
+    async def _async_on_moving_average(self, value) -> None:
+        _LOGGER.debug(f'trying to update powersensormovingaverage with {value}')
+        self.hub.sensors.powersensormovingaverage.value = value
+
+    async def _async_on_moving_average24(self, value) -> None:
+        self.hub.sensors.powersensormovingaverage24.value = value
+
+    async def _async_on_spotprice(self, value) -> bool:
+        await self.hub.async_update_spotprice()
+        return True
 
 
 class StateChangesLiteNoCharger(StateChangesBase):
@@ -166,10 +172,11 @@ class StateChangesLiteNoCharger(StateChangesBase):
         self.hub = hub
         super().__init__(hub)
 
-    async def async_update_sensor_internal(self, entity, value) -> bool:
-        match entity:
-            case self.hub.sensors.totalhourlyenergy.entity:
-                await self.async_update_total_energy_and_peak(value)
-            case self.hub.spotprice.entity:
-                await self.hub.async_update_spotprice()
-        return False
+    def _routes(self) -> list:
+        return [
+            (self._entity('totalhourlyenergy'), self.async_update_total_energy_and_peak),
+            (self.spotprice_entity, self._async_on_spotprice),
+        ]
+
+    async def _async_on_spotprice(self, value) -> None:
+        await self.hub.async_update_spotprice()
@@ -0,0 +1,12 @@
+from enum import Enum
+
+TRACE_FILENAME = '{}_trace.jsonl'
+TRACE_FLUSH_SIZE = 200
+TRACE_MAX_BUFFER = 10000
+TRACE_MAX_EVENTS = 200000
+"""events a trace records before it stops itself, roughly 20 MB of json lines"""
+
+
+class TraceKind(Enum):
+    Broadcast = "b"
+    StateChange = "s"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.trace.const import (
+    TRACE_FLUSH_SIZE, TRACE_MAX_BUFFER, TRACE_MAX_EVENTS, TraceKind)
+
+_LOGGER = logging.getLogger(__name__)
+
+_in_state_change: ContextVar[bool] = ContextVar('peaqev_trace_in_state_change', default=False)
+
+
+class TraceRecorder:
+    """
+    Appends observer broadcasts and hub state changes to a json-lines file.
+    Lines are buffered and written in batches, on the executor when running inside HA.
+    Broadcasts caused by a traced state change are marked nested (n=1), so a replay
+    that drives the state changes can skip them. Recording stops by itself after max_events.
+    """
+    def __init__(
+            self,
+            path: str,
+            hass=None,
+            flush_size: int = TRACE_FLUSH_SIZE,
+            max_buffer: int = TRACE_MAX_BUFFER,
+            max_events: int = TRACE_MAX_EVENTS,
+    ):
+        self.path = path
+        self.hass = hass
+        self.flush_size = flush_size
+        self.max_buffer = max_buffer
+        self.max_events = max_events
+        self.full: bool = False
+        self.recorded: int = 0
+        self.dropped: int = 0
+        self._buffer: list[str] = []
+        self._writing: bool = False
+        self._file_lock = threading.Lock()
+
+    def record_broadcast(self, command: ObserverTypes, argument=None) -> None:
+        event = {'t': time.time(), 'k': TraceKind.Broadcast.value, 'c': command.name}
+        if argument is not None:
+            event['a'] = argument
+        if _in_state_change.get():
+            event['n'] = 1
+        self._append(event)
+
+    @contextmanager
+    def state_change(self, entity_id: str, value):
+        self._append({'t': time.time(), 'k': TraceKind.StateChange.value, 'e': entity_id, 'v': value})
+        token = _in_state_change.set(True)
+        try:
+            yield
+        finally:
+            _in_state_change.reset(token)
+
+    def _append(self, event: dict) -> None:
+        if self.full:
+            self.dropped += 1
+            return
+        if len(self._buffer) >= self.max_buffer:
+            """writer is behind, don't let the trace grow without bounds"""
+            self.dropped += 1
+            return
+        self._buffer.append(json.dumps(event, default=str, separators=(',', ':')))
+        self.recorded += 1
+        if self.recorded >= self.max_events:
+            self.full = True
+            _LOGGER.warning(f'Trace to {self.path} reached {self.max_events} events and stopped recording')
+            self.flush()
+        elif len(self._buffer) >= self.flush_size and not self._writing:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self.hass is not None and self.hass.loop_thread_id != threading.get_ident():
+            """broadcast may be called off the loop, executor jobs are only scheduled from it"""
+            self.hass.loop.call_soon_threadsafe(self.flush)
+            return
+        lines, self._buffer = self._buffer, []
+        if self.hass is None:
+            self._write(lines)
+            return
+        self._writing = True
+        self.hass.async_add_executor_job(self._write, lines).add_done_callback(self._write_done)
+
+    def _write_done(self, *args) -> None:
+        self._writing = False
+
+    def _write(self, lines: list[str]) -> None:
+        try:
+            with self._file_lock, open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            _LOGGER.error(f'Unable to write trace to {self.path}: {e}')
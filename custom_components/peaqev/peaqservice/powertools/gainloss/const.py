@@ -1,7 +1,7 @@
 CONSUMPTION = "consumption"
 COST = "cost"
 INVALID_STATES = [None, "unknown", "unavailable"]
-DAILY_ENERGY_SENSOR = "sensor.peaqev_energy_including_car_daily"
-MONTHLY_ENERGY_SENSOR = "sensor.peaqev_energy_including_car_monthly"
-DAILY_COST_SENSOR = "sensor.peaqev_energy_cost_integral_daily"
-MONTHLY_COST_SENSOR = "sensor.peaqev_energy_cost_integral_monthly"
+DAILY_ENERGY_SENSOR = "sensor.{}_energy_including_car_daily"
+MONTHLY_ENERGY_SENSOR = "sensor.{}_energy_including_car_monthly"
+DAILY_COST_SENSOR = "sensor.{}_energy_cost_integral_daily"
+MONTHLY_COST_SENSOR = "sensor.{}_energy_cost_integral_monthly"
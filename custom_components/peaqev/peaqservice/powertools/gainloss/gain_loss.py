@@ -12,7 +12,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class GainLoss(IGainLoss):
     def __init__(self, hub):
-        super().__init__()
+        super().__init__(hub.model.domain)
         self._hub = hub
         self._hub.observer.add(ObserverTypes.MonthlyAveragePriceChanged, self._update_monthly_average)
         self._hub.observer.add(ObserverTypes.DailyAveragePriceChanged, self._update_daily_average)
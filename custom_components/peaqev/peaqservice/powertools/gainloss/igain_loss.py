@@ -3,13 +3,15 @@ from abc import abstractmethod
 
 from peaqevcore.models.locale.enums.time_periods import TimePeriods
 
+from custom_components.peaqev.const import DOMAIN
 from custom_components.peaqev.peaqservice.powertools.gainloss.const import *
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class IGainLoss:
-    def __init__(self):
+    def __init__(self, domain: str = DOMAIN):
+        self._domain = domain
         self._daily_average: float|None = None
         self._monthly_average: float|None = None
 
@@ -92,8 +94,7 @@ class IGainLoss:
             ]
         )
 
-    @staticmethod
-    async def async_get_entity(time_period: TimePeriods, resulttype: str):
+    async def async_get_entity(self, time_period: TimePeriods, resulttype: str):
         ret = {
             TimePeriods.Daily: {
                 CONSUMPTION: DAILY_ENERGY_SENSOR,
@@ -104,4 +105,4 @@ class IGainLoss:
                 COST: MONTHLY_COST_SENSOR,
             },
         }
-        return ret.get(time_period).get(resulttype)
+        return ret.get(time_period).get(resulttype).format(self._domain)
@@ -28,9 +28,18 @@ class IPowerCanary:
             fuse=Fuses.parse_from_config(fuse_type),
             allow_amp_adjustment=allow_amp_adjustment,
         )
-        self._total_power = SmoothAverage(max_age=60, max_samples=30, ignore=0)
+        self._total_power = SmoothAverage(
+            max_age=60,
+            max_samples=30,
+            ignore=0,
+            series=getattr(getattr(hub, 'sensors', None), 'power_series', None)
+        )
         self._validate()
 
+    def detach(self) -> None:
+        """stops reading the site's power series"""
+        self._total_power.detach()
+
     @property
     @abstractmethod
     def alive(self) -> bool:
@@ -82,7 +91,8 @@ class IPowerCanary:
     @total_power.setter
     def total_power(self, value) -> None:
         if self.enabled:
-            self._total_power.add_reading(float(value))
+            if self._total_power.owns_series:
+                self._total_power.add_reading(float(value))
             self.check_current_percentage()
 
     @property
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ChargerDemand:
+    key: str
+    priority: int
+    min_watts: float
+    """the lowest current a charger can be set to. It is granted even when the budget is short"""
+    max_watts: float
@@ -0,0 +1,2 @@
+SITE_ALLOCATORS = 'peaqev_site_allocators'
+"""hass.data key of the allocators, one per main fuse"""
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+from itertools import groupby
+from typing import TYPE_CHECKING
+
+from custom_components.peaqev.peaqservice.hub.sensors.const import \
+    POWER_AVERAGE_WINDOWS
+from custom_components.peaqev.peaqservice.hub.sensors.models.power_series import \
+    PowerSeries
+from custom_components.peaqev.peaqservice.powertools.site_allocator.charger_demand import \
+    ChargerDemand
+from custom_components.peaqev.peaqservice.powertools.site_allocator.const import \
+    SITE_ALLOCATORS
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def split_budget(budget: float, demands: list[ChargerDemand]) -> dict[str, float]:
+    """
+    Chargers get their minimum in priority order. When the budget can't cover the next minimum, that charger and all
+    below it are paused at 0 W. What is left goes to the highest priority first, split evenly within a priority.
+    """
+    ordered = sorted(demands, key=lambda d: -d.priority)
+    ret = {d.key: 0.0 for d in demands}
+    remaining = budget
+    served = []
+    for d in ordered:
+        if d.min_watts > remaining:
+            break
+        ret[d.key] = d.min_watts
+        remaining -= d.min_watts
+        served.append(d)
+    for _, tier in groupby(served, key=lambda d: d.priority):
+        tier = sorted(tier, key=lambda d: d.max_watts - d.min_watts)
+        for i, d in enumerate(tier):
+            """the smallest needs are filled first, their unused share goes to the rest"""
+            extra = min(d.max_watts - d.min_watts, remaining / (len(tier) - i))
+            ret[d.key] += extra
+            remaining -= extra
+    return ret
+
+
+class SiteAllocator:
+    """
+    Splits the headroom of one main fuse between the chargers behind it. Hubs that read the same mains power sensor are one site.
+    Each charger asks for the current its own threshold allows. The budget is what the chargers draw now plus the smaller of
+    the headroom their thresholds see under the peak and the headroom left under fuse_max * cutoff_threshold.
+    The site also holds the total power series. Its first member appends to it, every member's averages, trend and canary
+    are views on it.
+    """
+    def __init__(self, state_machine, key: str):
+        self.state_machine = state_machine
+        self.key = key
+        self.members: list[HomeAssistantHub] = []
+        self.latest: dict[str, int] = {}
+        self.power_series = PowerSeries(span=max(POWER_AVERAGE_WINDOWS.values()))
+
+    @staticmethod
+    def get(state_machine, key: str) -> SiteAllocator:
+        """The site of a mains power sensor. Hubs set up their views on its series before they join."""
+        sites: dict = state_machine.data.setdefault(SITE_ALLOCATORS, {})
+        if key not in sites:
+            sites[key] = SiteAllocator(state_machine, key)
+        return sites[key]
+
+    @staticmethod
+    def join(hub: HomeAssistantHub) -> SiteAllocator | None:
+        key = getattr(hub.options, 'powersensor', None)
+        if hub.options.peaqev_lite or not key:
+            return None
+        site = SiteAllocator.get(hub.state_machine, key)
+        site.members.append(hub)
+        return site
+
+    def feeds(self, hub: HomeAssistantHub) -> bool:
+        """Only one member appends to the series, the others see the same reading of the same sensor"""
+        return bool(self.members) and self.members[0] is hub
+
+    def remove(self, hub: HomeAssistantHub) -> None:
+        if hub in self.members:
+            self.members.remove(hub)
+        self.latest.pop(hub.model.domain, None)
+        if not self.members:
+            self.state_machine.data.get(SITE_ALLOCATORS, {}).pop(self.key, None)
+
+    def allocate(self, hub: HomeAssistantHub, wished_amps: int) -> int:
+        """The current this hub's charger may use. A charger alone at its site gets what it wished for."""
+        active = [m for m in self.members if self._is_charging(m)]
+        if hub not in active or len(active) < 2:
+            return wished_amps
+        demands = []
+        draws = 0.0
+        headroom: float | None = None
+        for m in active:
+            amps = wished_amps if m is hub else m.threshold.allowed_current()
+            currents: dict = m.threshold.currents
+            draw = self._draw(m)
+            wish = max(self._watts(currents, amps, draw), min(currents))
+            draws += draw
+            headroom = wish - draw if headroom is None else min(headroom, wish - draw)
+            demands.append(ChargerDemand(m.model.domain, m.options.charger_priority, min(currents), wish))
+        fuse_headroom = self._fuse_headroom(hub)
+        if fuse_headroom is not None:
+            headroom = min(headroom, fuse_headroom)
+        shares = split_budget(draws + headroom, demands)
+        ret = self._amps(hub.threshold.currents, shares[hub.model.domain])
+        self.latest[hub.model.domain] = ret
+        return ret
+
+    @staticmethod
+    def _is_charging(hub: HomeAssistantHub) -> bool:
+        try:
+            return hub.chargecontroller.charger.model.running and hasattr(hub.sensors, 'carpowersensor')
+        except AttributeError:
+            return False
+
+    @staticmethod
+    def _draw(hub: HomeAssistantHub) -> float:
+        try:
+            return float(hub.sensors.carpowersensor.value or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _watts(currents: dict, amps: int, default: float) -> float:
+        for watts, a in currents.items():
+            if a == amps:
+                return watts
+        return default
+
+    @staticmethod
+    def _amps(currents: dict, watts: float) -> int:
+        """a paused charger gets 0 A rather than the smallest step it can't afford"""
+        fitting = [a for w, a in currents.items() if w <= watts]
+        return max(fitting) if fitting else 0
+
+    @staticmethod
+    def _fuse_headroom(hub: HomeAssistantHub) -> float | None:
+        canary = hub.power.power_canary
+        if not canary.enabled or canary.model.fuse_max == 0:
+            return None
+        return canary.model.fuse_max * canary.model.cutoff_threshold - hub.sensors.power.total.value
+
+    def diagnostics(self) -> dict:
+        return {
+            "members": [m.model.domain for m in self.members],
+            "feeder": self.members[0].model.domain if self.members else None,
+            "allocated_amps": dict(self.latest),
+        }
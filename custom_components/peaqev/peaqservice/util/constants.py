@@ -14,6 +14,7 @@ CONSUMPTION_INTEGRAL_NAME = 'Energy excluding car'
 CONSUMPTION_TOTAL_NAME = 'Energy including car'
 THRESHOLD = 'Threshold'
 HUB = 'Hub'
+OBSERVER = 'Observer'
 SMARTOUTLET = 'SmartOutlet'
 
 """Chargertype helpers"""
@@ -31,7 +31,21 @@ def log_once_per_minute(msg, level):
         _LOGGER.error(f'Error in log_once_per_minute: {e}')
 
 
-async def async_iscoroutine(object):
+def iscoroutine(object) -> bool:
     while isinstance(object, partial):
         object = object.func
     return inspect.iscoroutinefunction(object)
+
+
+async def async_iscoroutine(object):
+    return iscoroutine(object)
+
+
+def next_hub_slug(domain: str, taken: set) -> str:
+    """The first hub keeps the bare domain, later ones are numbered from 2."""
+    if domain not in taken:
+        return domain
+    i = 2
+    while f'{domain}_{i}' in taken:
+        i += 1
+    return f'{domain}_{i}'
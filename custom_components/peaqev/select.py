@@ -14,7 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(
     hass: HomeAssistant, config_entry, async_add_entities
 ):  # pylint:disable=unused-argument
-    hub: HomeAssistantHub = hass.data[DOMAIN]['hub']
+    hub: HomeAssistantHub = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
     if hub.options.price.price_aware and not hub.options.peaqev_lite:
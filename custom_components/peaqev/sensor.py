@@ -1,6 +1,5 @@
 """Platform for sensor integration."""
 import logging
-from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -23,6 +22,8 @@ from custom_components.peaqev.sensors.hourcontroller_sensor import \
 from custom_components.peaqev.sensors.integration_sensor import (
     PeaqIntegrationCostSensor, PeaqIntegrationSensor)
 from custom_components.peaqev.sensors.moneydata_sensor import MoneyDataSensor
+from custom_components.peaqev.sensors.observer_sensor import \
+    ObserverDiagnosticSensor
 from custom_components.peaqev.sensors.peak_sensor import PeaqPeakSensor
 from custom_components.peaqev.sensors.power.amp_sensor import PeaqAmpSensor
 from custom_components.peaqev.sensors.power.power_cost_sensor import \
@@ -45,7 +46,6 @@ from custom_components.peaqev.sensors.utility_sensor import (
     UtilityMeterDTO, async_create_single_utility)
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(seconds=4)
 ENERGY_COST_INTEGRAL = 'energy_cost_integral'
 
 
@@ -54,7 +54,7 @@ async def async_setup_entry(
 ):
     """Add sensors for passed config_entry in HA."""
 
-    hub = hass.data[DOMAIN]['hub']
+    hub = hass.data[DOMAIN][config.entry_id]
     hass.async_create_task(async_setup(hub, config, hass, async_add_entities))
 
 
@@ -74,7 +74,10 @@ async def async_setup(hub, config, hass, async_add_entities):
     utility_meters = []
     integration_sensors = []
     average_sensors = []
-    sensors = [ChargerControllerSensor(hub, config.entry_id)]
+    sensors = [
+        ChargerControllerSensor(hub, config.entry_id),
+        ObserverDiagnosticSensor(hub, config.entry_id),
+    ]
 
     gainloss_dict = await async_add_gainloss_sensors(hub, config)
     sensors.extend(gainloss_dict['sensors'])
@@ -155,7 +158,7 @@ async def async_setup(hub, config, hass, async_add_entities):
                 integration_sensors.append(
                     PeaqIntegrationSensor(
                         hub,
-                        f'sensor.{DOMAIN}_{hub.sensors.power.house.id}',
+                        f'sensor.{hub.model.domain}_{hub.sensors.power.house.id}',
                         f'{ex.nametoid(CONSUMPTION_INTEGRAL_NAME)}',
                         config.entry_id,
                     )
@@ -180,7 +183,7 @@ async def async_setup(hub, config, hass, async_add_entities):
             integration_sensors.append(
                 PeaqIntegrationSensor(
                     hub,
-                    f'sensor.{DOMAIN}_{hub.sensors.power.total.id}',
+                    f'sensor.{hub.model.domain}_{hub.sensors.power.total.id}',
                     f'{ex.nametoid(CONSUMPTION_TOTAL_NAME)}',
                     config.entry_id,
                 )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from custom_components.peaqev.peaqservice.hub.sensors.models.ema import EMA
@@ -23,8 +24,10 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PeaqAverageSensor(SensorEntity, RestoreEntity):
+    """Time-weighted average of house power. The hub pushes every reading, the state is written when the rounded average changes"""
     device_class = SensorDeviceClass.POWER
     unit_of_measurement = UnitOfPower.WATT
+    _attr_should_poll = False
 
     def __init__(self, hub: HomeAssistantHub, entry_id, name, max_age):
         self.hub = hub
@@ -38,17 +41,10 @@ class PeaqAverageSensor(SensorEntity, RestoreEntity):
     def state(self):
         return self._state
 
-    async def async_update(self) -> None:
-        data = self.hub.state_machine.states.get(self.hub.sensors.power.house.entity)
-        if data:
-            try:
-                floatdata = float(data.state)
-                if isinstance(floatdata, float):
-                    self._state = self._avg.average(floatdata)
-                else:
-                    _LOGGER.debug(f'Could not convert {data.state} to float.')
-            except:
-                pass
+    @callback
+    def _async_on_average(self, value: float) -> None:
+        self._state = value
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         state = await super().async_get_last_state()
@@ -56,6 +52,9 @@ class PeaqAverageSensor(SensorEntity, RestoreEntity):
         if state:
             self._state = float(state.state)
             self._avg.imported_average = float(state.state)
+        series = getattr(self.hub.sensors, 'house_power_series', None)
+        if series is not None:
+            self.async_on_remove(self._avg.attach(series, self._async_on_average))
 
     @property
     def device_info(self):
@@ -9,11 +9,15 @@ from homeassistant.const import PERCENTAGE
 from peaqevcore.models.locale.enums.time_periods import TimePeriods
 
 from custom_components.peaqev.const import DOMAIN
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import POWERCONTROLS
 from custom_components.peaqev.peaqservice.util.extensionmethods import nametoid
+from custom_components.peaqev.sensors.sensorbase import CoordinatedEntity
 
 
-class GainLossSensor(SensorEntity):
+class GainLossSensor(CoordinatedEntity, SensorEntity):
+    update_topics = frozenset({EntityTopic.Prices})
+
     def __init__(self, hub: HomeAssistantHub, entry_id, timeperiod: TimePeriods):
         self.hub = hub
         self._entry_id = entry_id
@@ -7,7 +7,8 @@ if TYPE_CHECKING:
 
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from custom_components.peaqev.peaqservice.hub.const import LookupKeys
+from custom_components.peaqev.peaqservice.hub.const import (EntityTopic,
+                                                            LookupKeys)
 from custom_components.peaqev.peaqservice.util.constants import HOURCONTROLLER
 from custom_components.peaqev.sensors.money_sensor_helpers import *
 from custom_components.peaqev.sensors.sensorbase import SensorBase
@@ -15,6 +16,7 @@ from custom_components.peaqev.sensors.sensorbase import SensorBase
 _LOGGER = logging.getLogger(__name__)
 
 class HourControllerSensor(SensorBase, RestoreEntity):
+    update_topics = frozenset({EntityTopic.Hub, EntityTopic.Prices})
     """Special sensor which is only created if priceaware is true"""
     def __init__(self, hub: HomeAssistantHub, entry_id):
         name = f'{hub.hubname} {HOURCONTROLLER}'
@@ -111,6 +113,7 @@ class HourControllerSensor(SensorBase, RestoreEntity):
         return attr_dict
 
     async def async_added_to_hass(self):
+        await super().async_added_to_hass()
         state = await super().async_get_last_state()
         _LOGGER.debug('last state of %s = %s', self._attr_name, state)
         if state:
@@ -71,6 +71,7 @@ class MoneyDataSensor(MoneyDevice, RestoreEntity):
         return attr_dict
 
     async def async_added_to_hass(self):
+        await super().async_added_to_hass()
         state = await super().async_get_last_state()
         _LOGGER.debug('last state of %s = %s', self._attr_name, state)
         if state:
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
+
+from homeassistant.const import EntityCategory
+
+from custom_components.peaqev.peaqservice.util.constants import OBSERVER
+from custom_components.peaqev.sensors.sensorbase import SensorBase
+
+SLOWEST_SUBSCRIBERS = 5
+
+
+class ObserverDiagnosticSensor(SensorBase):
+    """Queue depth as state, the heavier numbers are in the diagnostics download"""
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    update_topics = frozenset()
+    """only refreshed on the coordinator tick"""
+
+    def __init__(self, hub: HomeAssistantHub, entry_id):
+        name = f'{hub.hubname} {OBSERVER}'
+        super().__init__(hub, name, entry_id)
+        self._state = None
+        self._attributes = {}
+        self._attr_icon = 'mdi:pulse'
+
+    @property
+    def state(self) -> int:
+        return self._state
+
+    async def async_update(self) -> None:
+        model = self.hub.observer.model
+        self._state = len(model.broadcast_queue)
+        slowest = sorted(model.subscriber_time.items(), key=lambda s: s[1].max, reverse=True)
+        self._attributes = {
+            'lane latency mean': {k.name: round(v.mean, 4) for k, v in model.lane_latency.items()},
+            'lane latency max': {k.name: round(v.max, 4) for k, v in model.lane_latency.items()},
+            'throttled': sum(s.throttled for s in model.command_stats.values()),
+            'coalesced': sum(s.coalesced for s in model.command_stats.values()),
+            'evicted': sum(model.evictions.values()),
+            'subscriber failures': sum(model.failures.values()),
+            'slowest subscribers': {k: round(v.max, 4) for k, v in slowest[:SLOWEST_SUBSCRIBERS]},
+        }
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return self._attributes
@@ -42,7 +42,7 @@ class PeaqPeakSensor(SensorBase, RestoreEntity):
         _peaks_dict = self.hub.sensors.current_peak.current_peaks_dictionary
         if self._peaks_dict != _peaks_dict:
             self._peaks_dict = _peaks_dict
-        self._observed_peak = self.hub.sensors.current_peak.observed_peak
+        self._observed_peak = self.hub.snapshot.current_peak
         self._history = self.hub.sensors.current_peak.history
 
     @property
@@ -77,6 +77,7 @@ class PeaqPeakSensor(SensorBase, RestoreEntity):
         return ret
 
     async def async_added_to_hass(self):
+        await super().async_added_to_hass()
         state = await super().async_get_last_state()
         if state:
             _LOGGER.debug('last state of %s = %s', self._name, state)
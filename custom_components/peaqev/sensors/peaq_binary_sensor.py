@@ -10,11 +10,12 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from peaqevcore.models.hub.const import CHARGERDONE
 
 from custom_components.peaqev.const import DOMAIN
+from custom_components.peaqev.sensors.sensorbase import CoordinatedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class PeaqBinarySensorDone(BinarySensorEntity):
+class PeaqBinarySensorDone(CoordinatedEntity, BinarySensorEntity):
     def __init__(self, hub: HomeAssistantHub) -> None:
         """Initialize a Peaq Binary sensor."""
         self._attr_name = f"{hub.hubname} {CHARGERDONE}"
@@ -9,6 +9,7 @@ import logging
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfElectricCurrent
 
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import ALLOWEDCURRENT
 from custom_components.peaqev.sensors.sensorbase import PowerDevice
 
@@ -16,6 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PeaqAmpSensor(PowerDevice):
+    update_topics = frozenset({EntityTopic.Power, EntityTopic.Hub})
     device_class = SensorDeviceClass.ENERGY
     unit_of_measurement = UnitOfElectricCurrent.AMPERE
 
@@ -35,7 +37,7 @@ class PeaqAmpSensor(PowerDevice):
 
     async def async_update(self) -> None:
         if self.hub.is_initialized:
-            self._state = await self.hub.threshold.async_allowed_current()  # todo: composition
+            self._state = await self.hub.async_allowed_current()
             self._charger_current = self.hub.sensors.amp_meter.value
             self._charger_phases = self.hub.threshold.phases  # todo: composition
             self._all_currents = list(self.hub.threshold.currents.values())  # todo: composition
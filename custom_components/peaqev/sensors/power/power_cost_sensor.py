@@ -9,12 +9,14 @@ import logging
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfPower
 
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.sensors.sensorbase import PowerDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class PeaqPowerCostSensor(PowerDevice):
+    update_topics = frozenset({EntityTopic.Power, EntityTopic.Prices})
     device_class = SensorDeviceClass.POWER
     unit_of_measurement = UnitOfPower.WATT
 
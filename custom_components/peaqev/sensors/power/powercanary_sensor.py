@@ -12,13 +12,15 @@ from homeassistant.const import PERCENTAGE, UnitOfElectricCurrent
 
 import custom_components.peaqev.peaqservice.util.extensionmethods as ex
 from custom_components.peaqev.const import DOMAIN
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import POWERCANARY
+from custom_components.peaqev.sensors.sensorbase import CoordinatedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class PowerCanaryDevice(SensorEntity):
-    should_poll = True
+class PowerCanaryDevice(CoordinatedEntity, SensorEntity):
+    update_topics = frozenset({EntityTopic.Power})
 
     def __init__(self, hub: HomeAssistantHub, name: str, entry_id):
         self.hub = hub
@@ -30,7 +32,7 @@ class PowerCanaryDevice(SensorEntity):
     def device_info(self):
         return {
             "identifiers": {(DOMAIN, self.hub.hub_id, POWERCANARY)},
-            "name": f"{DOMAIN} {POWERCANARY}",
+            "name": f"{self.hub.model.domain} {POWERCANARY}",
             "sw_version": 1,
             "model": f"{self.hub.power.power_canary.fuse}",  # todo: composition
             "manufacturer": "Peaq systems",
@@ -9,6 +9,7 @@ import logging
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfEnergy
 
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import PREDICTION
 from custom_components.peaqev.sensors.sensorbase import PowerDevice
 
@@ -16,6 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PeaqPredictionSensor(PowerDevice):
+    update_topics = frozenset({EntityTopic.Power, EntityTopic.Hub})
     device_class = SensorDeviceClass.ENERGY
     unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
 
@@ -8,14 +8,25 @@ if TYPE_CHECKING:
 from homeassistant.components.sensor import SensorEntity
 
 from custom_components.peaqev.const import DOMAIN
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import (HUB,
                                                                  MONEYCONTROLS,
                                                                  POWERCONTROLS)
 from custom_components.peaqev.peaqservice.util.extensionmethods import nametoid
 
 
-class MoneyDevice(SensorEntity):
-    should_poll = True
+class CoordinatedEntity:
+    """Refreshed by the hub's entity coordinator when one of update_topics changes, and once per tick. Never polled"""
+    _attr_should_poll = False
+    update_topics: frozenset[EntityTopic] = frozenset({EntityTopic.Hub})
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.hub.entity_coordinator.add(self, self.update_topics))
+
+
+class MoneyDevice(CoordinatedEntity, SensorEntity):
+    update_topics = frozenset({EntityTopic.Prices})
 
     def __init__(self, hub:HomeAssistantHub, name: str, entry_id):
         self.hub = hub
@@ -27,7 +38,7 @@ class MoneyDevice(SensorEntity):
     def device_info(self):
         return {
             "identifiers": {(DOMAIN, self.hub.hub_id, MONEYCONTROLS)},
-            "name": f"{DOMAIN} {MONEYCONTROLS}",
+            "name": f"{self.hub.model.domain} {MONEYCONTROLS}",
             "sw_version": 1,
             "manufacturer": "Peaq systems",
         }
@@ -38,8 +49,8 @@ class MoneyDevice(SensorEntity):
         return f"{DOMAIN}_{self._entry_id}_{nametoid(self._attr_name)}"
 
 
-class PowerDevice(SensorEntity):
-    should_poll = True
+class PowerDevice(CoordinatedEntity, SensorEntity):
+    update_topics = frozenset({EntityTopic.Power})
 
     def __init__(self, hub:HomeAssistantHub, name: str, entry_id):
         self.hub = hub
@@ -51,7 +62,7 @@ class PowerDevice(SensorEntity):
     def device_info(self):
         return {
             "identifiers": {(DOMAIN, self.hub.hub_id, POWERCONTROLS)},
-            "name": f"{DOMAIN} {POWERCONTROLS}",
+            "name": f"{self.hub.model.domain} {POWERCONTROLS}",
             "sw_version": 1,
             "manufacturer": "Peaq systems",
         }
@@ -62,8 +73,7 @@ class PowerDevice(SensorEntity):
         return f"{DOMAIN}_{self._entry_id}_{nametoid(self._attr_name)}"
 
 
-class SensorBase(SensorEntity):
-    should_poll = True
+class SensorBase(CoordinatedEntity, SensorEntity):
 
     def __init__(self, hub:HomeAssistantHub, name: str, entry_id):
         """Initialize the sensor."""
@@ -76,7 +86,7 @@ class SensorBase(SensorEntity):
     def device_info(self):
         return {
             "identifiers": {(DOMAIN, self.hub.hub_id)},
-            "name": f"{DOMAIN} {HUB}",
+            "name": f"{self.hub.model.domain} {HUB}",
             "sw_version": 1,
             "model": f"{self.hub.sensors.locale.type} ({self.hub.chargertype.type.value})",  # todo: composition
             "manufacturer": "Peaq systems",
@@ -13,13 +13,15 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 import custom_components.peaqev.peaqservice.util.extensionmethods as ex
 from custom_components.peaqev.const import DOMAIN
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import SESSION
+from custom_components.peaqev.sensors.sensorbase import CoordinatedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class SessionDevice(SensorEntity):
-    should_poll = True
+class SessionDevice(CoordinatedEntity, SensorEntity):
+    update_topics = frozenset({EntityTopic.Power, EntityTopic.Hub})
 
     def __init__(self, hub: HomeAssistantHub, name: str, entry_id):
         self.hub = hub
@@ -31,7 +33,7 @@ class SessionDevice(SensorEntity):
     def device_info(self):
         return {
             "identifiers": {(DOMAIN, self.hub.hub_id, SESSION)},
-            "name": f"{DOMAIN} {SESSION}",
+            "name": f"{self.hub.model.domain} {SESSION}",
             "sw_version": 1,
             "manufacturer": "Peaq systems",
         }
@@ -78,6 +80,7 @@ class PeaqSessionSensor(SessionDevice, RestoreEntity):
         #self._average_weekly = getattr(self.hub.chargecontroller.session.core.average_data, "export")
 
     async def async_added_to_hass(self):
+        await super().async_added_to_hass()
         state = await super().async_get_last_state()
         if state:
             _LOGGER.debug("last state of %s = %s", self._attr_name, state)
@@ -93,6 +96,7 @@ class PeaqSessionSensor(SessionDevice, RestoreEntity):
 
 
 class PeaqSessionCostSensor(SessionDevice, RestoreEntity):
+    update_topics = frozenset({EntityTopic.Power, EntityTopic.Hub, EntityTopic.Prices})
     device_class = SensorDeviceClass.MONETARY
 
     def __init__(self, hub:HomeAssistantHub, entry_id):
@@ -119,6 +123,7 @@ class PeaqSessionCostSensor(SessionDevice, RestoreEntity):
         self._attr_unit_of_measurement = getattr(self.hub.spotprice, "currency")
 
     async def async_added_to_hass(self):
+        await super().async_added_to_hass()
         state = await super().async_get_last_state()
         if state:
             self._state = state.state
@@ -6,11 +6,13 @@ if TYPE_CHECKING:
     from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
 from homeassistant.const import PERCENTAGE
 
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
 from custom_components.peaqev.peaqservice.util.constants import THRESHOLD
 from custom_components.peaqev.sensors.sensorbase import PowerDevice
 
 
 class PeaqThresholdSensor(PowerDevice):
+    update_topics = frozenset({EntityTopic.Power, EntityTopic.Hub})
     def __init__(self, hub: HomeAssistantHub, entry_id):
         name = f"{hub.hubname} {THRESHOLD}"
         super().__init__(hub, name, entry_id)
@@ -37,7 +37,7 @@ class UtilityMeterDTO:
 
 async def async_create_single_utility(hub: HomeAssistantHub, sensor: any, meter_type: TimePeriods, entry_id: any):
     name = f"{hub.hubname} {sensor} {meter_type.value.lower()}"
-    source = f"sensor.{DOMAIN.lower()}_{sensor}"
+    source = f"sensor.{hub.model.domain}_{sensor}"
     this_sensor = f"{source}_{meter_type.value.lower()}"
     unique_id = f"{DOMAIN}_{entry_id}_{nametoid(name)}"
     params = {
@@ -8,11 +8,14 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 import logging
+import os
 from enum import Enum
 
 from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse
 
 from .const import DOMAIN
+from .peaqservice.hub.trace.const import TRACE_FILENAME
+from .peaqservice.hub.trace.trace_recorder import TraceRecorder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,65 +30,98 @@ class ServiceCalls(Enum):
     OVERRIDE_CHARGE_AMOUNT = 'override_charge_amount'
     UPDATE_PEAKS_HISTORY = 'update_peaks_history'
     UPDATE_CURRENT_PEAK = 'update_current_peaks'
+    START_TRACE = 'start_trace'
+    STOP_TRACE = 'stop_trace'
 
 
-async def async_prepare_register_services(hub: HomeAssistantHub, hass: HomeAssistant) -> None:
-    async def async_servicehandler_enable(call: ServiceCall):  # pylint:disable=unused-argument
+CONFIG_ENTRY = 'config_entry'
+
+
+def get_hubs(hass: HomeAssistant, call: ServiceCall) -> list[HomeAssistantHub]:
+    """The hub of the config entry named in the call, or every hub if none is named."""
+    hubs = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(CONFIG_ENTRY)
+    if entry_id is None:
+        return list(hubs.values())
+    if entry_id not in hubs:
+        _LOGGER.warning(f'No peaqev hub is set up for config entry {entry_id}')
+        return []
+    return [hubs[entry_id]]
+
+
+async def async_prepare_register_services(hass: HomeAssistant) -> None:
+    """Services are registered once and shared by all hubs."""
+    if hass.services.has_service(DOMAIN, ServiceCalls.ENABLE.value):
+        return
+
+    async def async_servicehandler_enable(call: ServiceCall):
         _LOGGER.info('Calling {} service'.format(ServiceCalls.ENABLE.value))
-        await hub.servicecalls.async_call_enable_peaq()
+        for hub in get_hubs(hass, call):
+            await hub.servicecalls.async_call_enable_peaq()
 
-    async def async_servicehandler_disable(call: ServiceCall):  # pylint:disable=unused-argument
+    async def async_servicehandler_disable(call: ServiceCall):
         _LOGGER.info('Calling {} service'.format(ServiceCalls.DISABLE.value))
-        await hub.servicecalls.async_call_disable_peaq()
+        for hub in get_hubs(hass, call):
+            await hub.servicecalls.async_call_disable_peaq()
 
-    async def async_servicehandler_override_nonhours(call: ServiceCall):  # pylint:disable=unused-argument
+    async def async_servicehandler_override_nonhours(call: ServiceCall):
         hours = call.data.get('hours')
         _LOGGER.info('Calling {} service'.format(ServiceCalls.OVERRIDE_NONHOURS.value))
-        await hub.servicecalls.async_call_override_nonhours(1 if hours is None else hours)
+        for hub in get_hubs(hass, call):
+            await hub.servicecalls.async_call_override_nonhours(1 if hours is None else hours)
 
-    async def async_servicehandler_scheduler_set(call: ServiceCall):  # pylint:disable=unused-argument
+    async def async_servicehandler_scheduler_set(call: ServiceCall):
         charge_amount = call.data.get('charge_amount')
         departure_time = call.data.get('departure_time')
         schedule_starttime = call.data.get('schedule_starttime')
         override_settings = call.data.get('override_settings')
         _LOGGER.info('Calling {} service'.format(ServiceCalls.SCHEDULER_SET.value))
-        await hub.servicecalls.async_call_schedule_needed_charge(
-            charge_amount=charge_amount,
-            departure_time=departure_time,
-            schedule_starttime=schedule_starttime,
-            override_settings=override_settings,
-        )
+        for hub in get_hubs(hass, call):
+            await hub.servicecalls.async_call_schedule_needed_charge(
+                charge_amount=charge_amount,
+                departure_time=departure_time,
+                schedule_starttime=schedule_starttime,
+                override_settings=override_settings,
+            )
 
     async def async_servicehandler_scheduler_cancel(call: ServiceCall):
         _LOGGER.info('Calling {} service'.format(ServiceCalls.SCHEDULER_CANCEL.value))
-        await hub.servicecalls.async_call_scheduler_cancel()
+        for hub in get_hubs(hass, call):
+            await hub.servicecalls.async_call_scheduler_cancel()
 
     async def async_servicehandler_override_charge_amount(call: ServiceCall):
         _amount = call.data.get('desired_charge_amount')
-        if hub.options.price.price_aware:
-            _LOGGER.info('Calling {} service'.format(ServiceCalls.OVERRIDE_CHARGE_AMOUNT.value))
-            if _amount and _amount > 0:
-                await hub.max_min_controller.async_servicecall_override_charge_amount(_amount)
-            else:
-                await hub.max_min_controller.async_servicecall_reset_charge_amount()
+        for hub in get_hubs(hass, call):
+            if hub.options.price.price_aware:
+                _LOGGER.info('Calling {} service'.format(ServiceCalls.OVERRIDE_CHARGE_AMOUNT.value))
+                if _amount and _amount > 0:
+                    await hub.max_min_controller.async_servicecall_override_charge_amount(_amount)
+                else:
+                    await hub.max_min_controller.async_servicecall_reset_charge_amount()
 
     async def async_servicehandler_update_peaks_history(call: ServiceCall) -> ServiceResponse:
         _LOGGER.info('Calling {} service'.format(ServiceCalls.UPDATE_PEAKS_HISTORY.value))
-        if len(call.data) == 0 or call.data.get('import_dictionary') is None:
+        if call.data.get('import_dictionary') is None:
             return {'result': 'error', 'message': 'No data provided'}
         _import_dict = call.data.get('import_dictionary')
         if not isinstance(_import_dict, dict):
             return {'result': 'error', 'message': 'Invalid data provided'}
-        _result = hub.sensors.current_peak.import_from_service(_import_dict)
+        hubs = get_hubs(hass, call)
+        if not hubs:
+            return {'result': 'error', 'message': 'No hub found'}
+        """peak history belongs to one meter, so only the first hub takes it unless a config entry is given"""
+        _result = hubs[0].sensors.current_peak.import_from_service(_import_dict)
         return _result
 
     async def async_servicehandler_update_current_peaks(call: ServiceCall) -> ServiceResponse:
         _LOGGER.info(f'Calling {ServiceCalls.UPDATE_CURRENT_PEAK.value} service with {call.data}')
         error_result = {'result': 'error', 'message': 'No data provided'}
         _import_dict = call.data.get('import_dictionary', {})
+        hubs = get_hubs(hass, call)
 
-        if not len(_import_dict):
+        if not len(_import_dict) or not hubs:
             return error_result
+        hub = hubs[0]
         if not validate_import_dictionary(_import_dict, hub.sensors.locale.data.query_model.sum_counter.counter):
             return error_result
 
@@ -100,6 +136,29 @@ async def async_prepare_register_services(hub: HomeAssistantHub, hass: HomeAssis
         _result = hub.sensors.current_peak.import_from_service(current_history)
         return {'result': 'success', 'message': 'Imported successfully', 'history-update': _result}
 
+    async def async_servicehandler_start_trace(call: ServiceCall):
+        path = call.data.get('path')
+        if path and os.path.basename(path) == path:
+            """a bare file name goes in the config folder"""
+            path = hass.config.path(path)
+        elif path and not hass.config.is_allowed_path(path):
+            _LOGGER.error(f'{ServiceCalls.START_TRACE.value}: {path} is not in an allowed folder')
+            return
+        for hub in get_hubs(hass, call):
+            hub_path = path or hass.config.path(TRACE_FILENAME.format(hub.model.domain))
+            _LOGGER.info(f'Calling {ServiceCalls.START_TRACE.value} service. Writing to {hub_path}')
+            if hub.observer.trace is not None:
+                hub.observer.trace.flush()
+            hub.observer.trace = TraceRecorder(hub_path, hass)
+
+    async def async_servicehandler_stop_trace(call: ServiceCall):
+        _LOGGER.info(f'Calling {ServiceCalls.STOP_TRACE.value} service')
+        for hub in get_hubs(hass, call):
+            trace, hub.observer.trace = hub.observer.trace, None
+            if trace is not None:
+                trace.flush()
+                _LOGGER.info(f'Trace stopped. {trace.recorded} events recorded, {trace.dropped} dropped')
+
     # Register services
     SERVICES = {
         ServiceCalls.ENABLE: async_servicehandler_enable,
@@ -107,7 +166,9 @@ async def async_prepare_register_services(hub: HomeAssistantHub, hass: HomeAssis
         ServiceCalls.OVERRIDE_NONHOURS: async_servicehandler_override_nonhours,
         ServiceCalls.SCHEDULER_SET: async_servicehandler_scheduler_set,
         ServiceCalls.SCHEDULER_CANCEL: async_servicehandler_scheduler_cancel,
-        ServiceCalls.OVERRIDE_CHARGE_AMOUNT: async_servicehandler_override_charge_amount
+        ServiceCalls.OVERRIDE_CHARGE_AMOUNT: async_servicehandler_override_charge_amount,
+        ServiceCalls.START_TRACE: async_servicehandler_start_trace,
+        ServiceCalls.STOP_TRACE: async_servicehandler_stop_trace,
     }
 
     for service, handler in SERVICES.items():
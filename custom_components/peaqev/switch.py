@@ -1,5 +1,4 @@
 import logging
-from datetime import timedelta
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
@@ -7,22 +6,22 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from peaqevcore.common.models.observer_types import ObserverTypes
 
 from .const import DOMAIN
+from .sensors.sensorbase import CoordinatedEntity
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(seconds=4)
 
 
 async def async_setup_entry(
     hass: HomeAssistant, config_entry, async_add_entities
 ):  # pylint:disable=unused-argument
-    hub = hass.data[DOMAIN]["hub"]
+    hub = hass.data[DOMAIN][config_entry.entry_id]
 
     switches = [{"name": "Charger enabled", "entity": "charger_enabled"}]
 
     async_add_entities(PeaqSwitch(s, hub) for s in switches)
 
 
-class PeaqSwitch(SwitchEntity, RestoreEntity):
+class PeaqSwitch(CoordinatedEntity, SwitchEntity, RestoreEntity):
     def __init__(self, switch, hub) -> None:
         """Initialize a PeaqSwitch."""
         self._switch = switch
@@ -51,15 +50,18 @@ class PeaqSwitch(SwitchEntity, RestoreEntity):
     async def async_turn_on(self):
         await self.hub.observer.async_broadcast(ObserverTypes.UpdateChargerEnabled, True)
         await self.async_update()
+        self.async_write_ha_state()
 
     async def async_turn_off(self):
         await self.hub.observer.async_broadcast(ObserverTypes.UpdateChargerEnabled, False)
         await self.async_update()
+        self.async_write_ha_state()
 
     async def async_update(self):
         self._state = "on" if self.hub.enabled else "off"
 
     async def async_added_to_hass(self):
+        await super().async_added_to_hass()
         state = await super().async_get_last_state()
         if state:
             self._state = state.state
@@ -6,9 +6,9 @@ from custom_components.peaqev.peaqservice.powertools.gainloss.igain_loss import
 
 
 class GainLossTest(IGainLoss):
-    def __init__(self, mock_states = None):
+    def __init__(self, mock_states = None, domain: str = 'peaqev'):
         self._mock_states = mock_states
-        super().__init__()
+        super().__init__(domain)
 
     async def async_get_consumption(self, time_period: TimePeriods) -> float:
         try:
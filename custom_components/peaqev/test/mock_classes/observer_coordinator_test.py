@@ -2,19 +2,23 @@ from __future__ import annotations
 
 import asyncio
 
+from custom_components.peaqev.peaqservice.hub.observer.const import \
+    FanoutMode
 from custom_components.peaqev.peaqservice.hub.observer.iobserver_coordinator import \
     IObserver
-from custom_components.peaqev.peaqservice.util.extensionmethods import \
-    async_iscoroutine
+from custom_components.peaqev.peaqservice.hub.observer.models.subscriber import \
+    Subscriber
 
 
 class ObserverTest(IObserver):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, fanout_mode: FanoutMode = FanoutMode.Serial):
+        super().__init__(fanout_mode)
 
-    async def async_broadcast_separator(self, func, command):
-        if await async_iscoroutine(func):
-            await self.async_call_func(func=func, command=command),
-        else:
+    async def async_broadcast_separator(self, sub: Subscriber, command):
+        if sub.is_coroutine:
+            await self.async_call_func(sub, command)
+        elif sub.blocking:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._call_func, func, command)
+            await loop.run_in_executor(None, self._call_func, sub, command)
+        else:
+            self._call_func(sub, command)
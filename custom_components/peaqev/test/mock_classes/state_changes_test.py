@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.peaqev.peaqservice.chargertypes.models.chargertypes_enum import \
+    ChargerType
+from custom_components.peaqev.peaqservice.hub.state_changes.istate_changes import \
+    StateChangesBase
+
+
+class HubTest:
+    """The parts of HomeAssistantHub that StateChangesBase touches, without sensors or price awareness"""
+    def __init__(self, observer, chargingtracker_entities: list | None = None):
+        self.observer = observer
+        self.options = SimpleNamespace(
+            price=SimpleNamespace(price_aware=False), peaqev_lite=False, ingestion_window=0
+        )
+        self.model = SimpleNamespace(chargingtracker_entities=chargingtracker_entities or [])
+        self.sensors = SimpleNamespace()
+        self.hours = SimpleNamespace(scheduler=None)
+        self.chargecontroller = SimpleNamespace(charger=SimpleNamespace(session_active=False))
+        self.chargertype = ChargerType.NoCharger
+        self.is_initialized = True
+
+
+class StateChangesTest(StateChangesBase):
+    def __init__(self, hub: HubTest):
+        super().__init__(hub)
+        self.updates: list[tuple] = []
+
+    async def async_update_sensor_internal(self, entity, value) -> bool:
+        self.updates.append((entity, value))
+        return False
+
+    async def async_handle_outlet_updates(self):
+        pass
@@ -0,0 +1,54 @@
+import time
+
+from custom_components.peaqev.peaqservice.hub.sensors.models.average import (
+    Average, WindowStats)
+
+
+def test_average_mean_min_max_count():
+    avg = Average(max_age=300, max_samples=300, precision=0)
+    for val in [1000, 3000, 2000, 500.4]:
+        avg.add_reading(val)
+    assert avg.average == 1625
+    assert avg.stats() == WindowStats(mean=1625.1, min=500.4, max=3000, count=4)
+
+
+def test_average_respects_max_samples():
+    avg = Average(max_age=300, max_samples=3)
+    for val in [5, 1, 2, 3]:
+        avg.add_reading(val)
+    assert avg.stats() == WindowStats(mean=2, min=1, max=3, count=3)
+    avg.add_reading(10)
+    assert avg.stats() == WindowStats(mean=5, min=2, max=10, count=3)
+
+
+def test_average_evicts_old_readings_but_keeps_one(monkeypatch):
+    now = time.time()
+    avg = Average(max_age=60, max_samples=300)
+    monkeypatch.setattr(time, 'time', lambda: now - 120)
+    avg.add_reading(100)
+    avg.add_reading(200)
+    monkeypatch.setattr(time, 'time', lambda: now)
+    avg.add_reading(400)
+    assert avg.readings() == [(int(now), 400)]
+    assert avg.stats() == WindowStats(mean=400, min=400, max=400, count=1)
+
+
+def test_average_serves_several_windows(monkeypatch):
+    now = time.time()
+    avg = Average(max_age=300, max_samples=300, windows={"1min": 60, "hour": 3600})
+    monkeypatch.setattr(time, 'time', lambda: now - 600)
+    avg.add_reading(1000)
+    monkeypatch.setattr(time, 'time', lambda: now - 120)
+    avg.add_reading(2000)
+    monkeypatch.setattr(time, 'time', lambda: now)
+    avg.add_reading(3000)
+    assert avg.windows == ['default', '1min', 'hour']
+    assert avg.stats('1min').count == 1
+    assert avg.stats().count == 2
+    assert avg.stats('hour') == WindowStats(mean=2000, min=1000, max=3000, count=3)
+
+
+def test_average_empty():
+    avg = Average(max_age=300, max_samples=300)
+    assert avg.average == 0
+    assert avg.stats() == WindowStats(0, 0, 0, 0)
@@ -0,0 +1,61 @@
+import math
+import time
+
+import pytest
+
+from custom_components.peaqev.peaqservice.hub.sensors.models.ema import EMA
+from custom_components.peaqev.peaqservice.hub.sensors.models.power_series import \
+    PowerSeries
+
+
+def test_first_reading_is_the_average():
+    ema = EMA(300)
+    assert ema.average(1000, 0) == 1000
+
+
+def test_interval_weight_follows_elapsed_time():
+    ema = EMA(300, precision=2)
+    ema.average(0, 0)
+    ema.average(1000, 10)
+    """the 0 held for 10 seconds, the 1000 only counts once time has passed with it"""
+    assert ema.latest_average == 0
+    ret = ema.average(1000, 10 + ema.time_constant)
+    assert ret == pytest.approx(1000 * (1 - math.exp(-1)), abs=0.01)
+
+
+def test_spacing_of_readings_does_not_change_the_average():
+    sparse, dense = EMA(300, precision=2), EMA(300, precision=2)
+    for ema in (sparse, dense):
+        ema.average(0, 0)
+        ema.average(2000, 1)
+    sparse.average(2000, 601)
+    for t in range(2, 602):
+        dense.average(2000, t)
+    assert sparse.latest_average == pytest.approx(dense.latest_average, abs=0.01)
+
+
+def test_time_constant_matches_the_former_poll():
+    assert EMA(300).time_constant == pytest.approx(300 * 4 / 4.9204)
+    assert EMA(86400, 2).time_constant == pytest.approx(86400 * 2 * 4 / 4.9204)
+
+
+def test_imported_average_is_kept_until_time_passes():
+    ema = EMA(300)
+    ema.imported_average = 500
+    assert ema.average(3000, 0) == 500
+
+
+def test_attached_ema_only_reports_rounded_changes():
+    series = PowerSeries(16)
+    ema = EMA(300)
+    changes = []
+    detach = ema.attach(series, changes.append)
+    now = time.time()
+    series.append(1000, now)
+    series.append(1000.2, now + 0.001)
+    series.append(1000, now + 600)
+    assert changes == [1000]
+    detach()
+    series.append(0, now + 1200)
+    assert series.diagnostics()["views"] == 0
+    assert changes == [1000]
@@ -0,0 +1,172 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.const import EntityTopic
+from custom_components.peaqev.peaqservice.hub.entity_coordinator import \
+    EntityCoordinator
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+
+
+class EntityTest:
+    def __init__(self, source: dict, key: str):
+        self.source = source
+        self.key = key
+        self.name = key
+        self.state = None
+        self.extra_state_attributes = None
+        self.icon = None
+        self.available = True
+        self.updates = 0
+        self.writes = 0
+
+    async def async_update(self):
+        self.updates += 1
+        self.state = self.source[self.key]
+
+    def async_write_ha_state(self):
+        self.writes += 1
+
+
+def _coordinator() -> EntityCoordinator:
+    loop = asyncio.get_running_loop()
+    hub = SimpleNamespace(
+        state_machine=SimpleNamespace(
+            loop=loop,
+            async_create_task=lambda coro, name=None: loop.create_task(coro, name=name),
+        ),
+        observer=ObserverTest(),
+        options=SimpleNamespace(powersensor='sensor.power'),
+        sensors=SimpleNamespace(carpowersensor=SimpleNamespace(entity='sensor.car')),
+    )
+    return EntityCoordinator(hub)
+
+
+@pytest.mark.asyncio
+async def test_only_subscribers_of_the_topic_refresh():
+    source = {'power': 100, 'price': 1.0}
+    coordinator = _coordinator()
+    power, price = EntityTest(source, 'power'), EntityTest(source, 'price')
+    coordinator.add(power, frozenset({EntityTopic.Power}))
+    coordinator.add(price, frozenset({EntityTopic.Prices}))
+    await asyncio.sleep(0)
+    assert (power.writes, price.writes) == (1, 1)
+    source['power'] = 200
+    coordinator.notify_state_change('sensor.car')
+    await asyncio.sleep(0)
+    assert (power.updates, price.updates) == (2, 1)
+    assert power.writes == 2
+
+
+@pytest.mark.asyncio
+async def test_unchanged_state_is_not_written():
+    source = {'power': 100}
+    coordinator = _coordinator()
+    entity = EntityTest(source, 'power')
+    coordinator.add(entity, frozenset({EntityTopic.Hub}))
+    await asyncio.sleep(0)
+    for _ in range(5):
+        coordinator.notify_state_change('sensor.charger')
+        await asyncio.sleep(0)
+    assert entity.updates == 6
+    assert entity.writes == 1
+    assert coordinator.diagnostics()["writes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_notifies_coalesce_into_one_refresh():
+    source = {'status': 'idle'}
+    coordinator = _coordinator()
+    entity = EntityTest(source, 'status')
+    coordinator.add(entity, frozenset({EntityTopic.Hub}))
+    await asyncio.sleep(0)
+    for _ in range(10):
+        coordinator.notify_state_change('sensor.charger')
+    await asyncio.sleep(0)
+    assert entity.updates == 2
+    assert coordinator.notifies[EntityTopic.Hub] == 10
+
+
+@pytest.mark.asyncio
+async def test_attribute_changes_in_place_are_written():
+    source = {'prices': 1}
+    coordinator = _coordinator()
+    entity = EntityTest(source, 'prices')
+    entity.extra_state_attributes = {'prices': [1, 2]}
+    coordinator.add(entity, frozenset({EntityTopic.Prices}))
+    await asyncio.sleep(0)
+    entity.extra_state_attributes['prices'].append(3)
+    coordinator.notify(EntityTopic.Prices)
+    await asyncio.sleep(0)
+    assert entity.writes == 2
+
+
+@pytest.mark.asyncio
+async def test_broadcasts_reach_their_topic():
+    source = {'price': 1.0}
+    coordinator = _coordinator()
+    entity = EntityTest(source, 'price')
+    coordinator.add(entity, frozenset({EntityTopic.Prices}))
+    await asyncio.sleep(0)
+    source['price'] = 2.0
+    await coordinator.hub.observer.async_broadcast(ObserverTypes.PricesChanged)
+    await coordinator.hub.observer.async_dispatch()
+    await asyncio.sleep(0)
+    assert entity.state == 2.0
+    assert coordinator.notifies[EntityTopic.Prices] == 1
+
+
+@pytest.mark.asyncio
+async def test_power_readings_are_rate_limited():
+    source = {'power': 100}
+    coordinator = _coordinator()
+    coordinator.power_interval = 0.05
+    entity = EntityTest(source, 'power')
+    coordinator.add(entity, frozenset({EntityTopic.Power}))
+    await asyncio.sleep(0)
+    for val in range(10):
+        source['power'] = val
+        coordinator.notify_state_change('sensor.power')
+        await asyncio.sleep(0)
+    assert entity.updates == 2
+    await asyncio.sleep(0.1)
+    assert entity.updates == 3
+    assert entity.state == 9
+
+
+@pytest.mark.asyncio
+async def test_canary_broadcasts_share_the_power_interval():
+    source = {'power': 100}
+    coordinator = _coordinator()
+    coordinator.power_interval = 0.05
+    entity = EntityTest(source, 'power')
+    coordinator.add(entity, frozenset({EntityTopic.Power}))
+    await asyncio.sleep(0)
+    coordinator.notify(EntityTopic.Power)
+    await asyncio.sleep(0)
+    coordinator.notify(EntityTopic.Power)
+    await asyncio.sleep(0)
+    assert entity.updates == 2
+    await coordinator.hub.observer.async_broadcast(ObserverTypes.PowerCanaryWarning)
+    await coordinator.hub.observer.async_dispatch()
+    await asyncio.sleep(0)
+    assert entity.updates == 2
+    assert coordinator.notifies[EntityTopic.Power] == 3
+    await asyncio.sleep(0.1)
+    assert entity.updates == 3
+
+
+@pytest.mark.asyncio
+async def test_removed_entity_is_left_alone():
+    source = {'power': 100}
+    coordinator = _coordinator()
+    entity = EntityTest(source, 'power')
+    remove = coordinator.add(entity, frozenset({EntityTopic.Power}))
+    remove()
+    coordinator.notify(EntityTopic.Power)
+    await asyncio.sleep(0)
+    assert entity.updates == 0
+    assert coordinator.diagnostics()["entities"] == 0
@@ -9,10 +9,16 @@ from custom_components.peaqev.test.mock_classes.gain_loss_test import \
 @pytest.mark.asyncio
 async def test_gainloss_correct_sensors():
     gainloss = GainLossTest()
-    assert await gainloss.async_get_entity(TimePeriods.Daily, CONSUMPTION) == DAILY_ENERGY_SENSOR
-    assert await gainloss.async_get_entity(TimePeriods.Daily, COST) == DAILY_COST_SENSOR
-    assert await gainloss.async_get_entity(TimePeriods.Monthly, CONSUMPTION) == MONTHLY_ENERGY_SENSOR
-    assert await gainloss.async_get_entity(TimePeriods.Monthly, COST) == MONTHLY_COST_SENSOR
+    assert await gainloss.async_get_entity(TimePeriods.Daily, CONSUMPTION) == DAILY_ENERGY_SENSOR.format('peaqev')
+    assert await gainloss.async_get_entity(TimePeriods.Daily, COST) == DAILY_COST_SENSOR.format('peaqev')
+    assert await gainloss.async_get_entity(TimePeriods.Monthly, CONSUMPTION) == MONTHLY_ENERGY_SENSOR.format('peaqev')
+    assert await gainloss.async_get_entity(TimePeriods.Monthly, COST) == MONTHLY_COST_SENSOR.format('peaqev')
+
+@pytest.mark.asyncio
+async def test_gainloss_sensors_follow_hub_domain():
+    gainloss = GainLossTest(domain='peaqev_2')
+    assert await gainloss.async_get_entity(TimePeriods.Daily, CONSUMPTION) == 'sensor.peaqev_2_energy_including_car_daily'
+    assert await gainloss.async_get_entity(TimePeriods.Monthly, COST) == 'sensor.peaqev_2_energy_cost_integral_monthly'
 
 @pytest.mark.asyncio
 async def test_gainloss_calculate_state_none_none():
@@ -0,0 +1,216 @@
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import State
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.const import (SNAPSHOT_TICK,
+                                                            LookupKeys)
+from custom_components.peaqev.peaqservice.hub.hub import HomeAssistantHub
+from custom_components.peaqev.peaqservice.hub.models.hub_options import \
+    HubOptions
+from custom_components.peaqev.peaqservice.hub.models.initializer_types import \
+    InitializerTypes
+from custom_components.peaqev.peaqservice.hub.models.slot_index import \
+    SlotIndex
+from custom_components.peaqev.peaqservice.util.extensionmethods import \
+    next_hub_slug
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+
+
+def _hub(carpowersensor=None) -> HomeAssistantHub:
+    hub = HomeAssistantHub(MagicMock(), HubOptions(), 'peaqev', ObserverTest())
+    hub.sensors = SimpleNamespace(carpowersensor=carpowersensor) if carpowersensor else SimpleNamespace()
+    hub.states = MagicMock()
+    return hub
+
+
+def _event(entity_id, old_state, new_state):
+    return SimpleNamespace(data={'entity_id': entity_id, 'old_state': old_state, 'new_state': new_state})
+
+
+@pytest.mark.asyncio
+async def test_on_change_skips_attribute_only_changes():
+    hub = _hub()
+    await hub._async_on_change(_event('sensor.power', State('sensor.power', '100'), State('sensor.power', '100', {'a': 1})))
+    assert hub.model.state_changes_skipped['sensor.power'] == 1
+    hub.states.async_update_sensor.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_on_change_handles_value_changes():
+    hub = _hub()
+    await hub._async_on_change(_event('sensor.power', None, State('sensor.power', '100')))
+    await hub._async_on_change(_event('sensor.power', State('sensor.power', '100'), State('sensor.power', '200')))
+    assert hub.model.state_changes_handled['sensor.power'] == 2
+    assert hub.states.async_update_sensor.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_on_change_tracks_carpowersensor_attribute():
+    carpower = SimpleNamespace(entity='sensor.charger', use_attribute=True, attribute='power')
+    hub = _hub(carpower)
+    old = State('sensor.charger', 'charging', {'power': 1.0, 'other': 1})
+    await hub._async_on_change(_event('sensor.charger', old, State('sensor.charger', 'charging', {'power': 1.0, 'other': 2})))
+    await hub._async_on_change(_event('sensor.charger', old, State('sensor.charger', 'charging', {'power': 2.0, 'other': 1})))
+    assert hub.model.state_changes_skipped['sensor.charger'] == 1
+    assert hub.model.state_changes_handled['sensor.charger'] == 1
+
+
+@pytest.mark.asyncio
+async def test_on_change_handles_spotprice_attribute_changes():
+    hub = _hub()
+    hub.spotprice = SimpleNamespace(entity='sensor.nordpool')
+    old = State('sensor.nordpool', '1.2', {'today': [1.2], 'tomorrow': []})
+    await hub._async_on_change(_event('sensor.nordpool', old, State('sensor.nordpool', '1.2', {'today': [1.2], 'tomorrow': []})))
+    await hub._async_on_change(_event('sensor.nordpool', old, State('sensor.nordpool', '1.2', {'today': [1.2], 'tomorrow': [0.8]})))
+    assert hub.model.state_changes_skipped['sensor.nordpool'] == 1
+    assert hub.model.state_changes_handled['sensor.nordpool'] == 1
+    hub.states.async_update_sensor.assert_called_once_with('sensor.nordpool', '1.2')
+
+
+@pytest.mark.asyncio
+async def test_sensor_lookup_is_cached_until_sources_are_replaced():
+    hub = _hub()
+    hub.sensors, hub.hours, hub.spotprice, hub.chargecontroller = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+
+    async def _total_charge():
+        return 10
+
+    hub.hours.async_get_total_charge = _total_charge
+    hub.hours.non_hours = [1]
+    lookup = hub._request_sensor_lookup()
+    assert hub._request_sensor_lookup() is lookup
+    assert lookup[LookupKeys.MAX_CHARGE].is_coroutine
+    assert await lookup[LookupKeys.MAX_CHARGE]() == 10
+    assert not lookup[LookupKeys.NON_HOURS].is_coroutine
+    assert lookup[LookupKeys.NON_HOURS]() == [1]
+    snapshot = hub.snapshot
+    hub.hours = MagicMock(non_hours=[2])
+    assert hub._request_sensor_lookup() is lookup
+    assert lookup[LookupKeys.NON_HOURS]() == [2]
+    assert hub.snapshot is not snapshot
+    hub.spotprice.model = SimpleNamespace(use_cent=True)
+    assert lookup[LookupKeys.USE_CENT]() is True
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_shared_within_a_tick():
+    hub = _hub()
+    hub.sensors, hub.hours, hub.spotprice, hub.chargecontroller = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    hub.hours.non_hours = [1, 2]
+    hub.sensors.current_peak.observed_peak = 2.5
+    snapshot = hub.snapshot
+    hub.hours.non_hours = [3]
+    hub.sensors.current_peak.observed_peak = 3.5
+    assert hub.snapshot is snapshot
+    assert snapshot.non_hours == (1, 2)
+    assert snapshot.get(LookupKeys.CURRENT_PEAK) == 2.5
+    with pytest.raises(FrozenInstanceError):
+        snapshot.non_hours = ()
+    hub.invalidate_snapshot()
+    assert hub.snapshot.non_hours == (3,)
+    hub._snapshot = replace(hub.snapshot, taken_at=hub.snapshot.taken_at - SNAPSHOT_TICK)
+    assert hub.snapshot.taken_at > snapshot.taken_at
+
+
+@pytest.mark.asyncio
+async def test_peak_update_retakes_snapshot():
+    hub = _hub()
+    hub.sensors, hub.hours, hub.spotprice, hub.chargecontroller = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    hub.sensors.locale.async_try_update_peak = AsyncMock()
+    hub.sensors.locale.data.query_model.peaks.p = {(1, 12): 1.5}
+    hub.sensors.current_peak.observed_peak = [1.0]
+    assert hub.snapshot.current_peak == (1.0,)
+    await hub.async_update_peak((1.5, datetime.now()))
+    assert hub.snapshot.current_peak == (1.5,)
+
+
+def test_slot_index_answers_non_and_caution_hours():
+    now = datetime(2026, 1, 10, 12, 5)
+    tomorrow = datetime(2026, 1, 11, 3)
+    slots = SlotIndex.create(
+        now,
+        non_hours=[datetime(2026, 1, 10, 13), tomorrow, datetime(2026, 1, 9, 13)],
+        dynamic_caution_hours={datetime(2026, 1, 10, 14): 0.5},
+        caution_hours=[7, 8],
+    )
+    assert slots.is_non_hour(datetime(2026, 1, 10, 13))
+    assert slots.is_non_hour(datetime(2026, 1, 10, 13, 59))
+    assert slots.is_non_hour(tomorrow)
+    assert not slots.is_non_hour(datetime(2026, 1, 10, 12))
+    assert not slots.is_non_hour(datetime(2026, 1, 12, 13))
+    assert slots.caution_permittance(datetime(2026, 1, 10, 14)) == 0.5
+    assert slots.caution_permittance(datetime(2026, 1, 10, 14, 50)) == 0.5
+    assert slots.caution_permittance(datetime(2026, 1, 10, 15)) is None
+    assert slots.is_caution_hour_of_day(7)
+    assert not slots.is_caution_hour_of_day(12)
+
+
+def test_slot_index_keeps_quarter_resolution():
+    now = datetime(2026, 1, 10, 12, 5)
+    slots = SlotIndex.create(
+        now,
+        non_hours=[datetime(2026, 1, 10, 13), datetime(2026, 1, 10, 13, 15), datetime(2026, 1, 10, 13, 30)],
+        dynamic_caution_hours={datetime(2026, 1, 10, 14): 0.4, datetime(2026, 1, 10, 14, 45): 0.5},
+        caution_hours=[],
+        prices=[1.0] * 96,
+    )
+    assert slots.is_non_hour(datetime(2026, 1, 10, 13, 10))
+    assert slots.is_non_hour(datetime(2026, 1, 10, 13, 20))
+    assert slots.is_non_hour(datetime(2026, 1, 10, 13, 44))
+    assert not slots.is_non_hour(datetime(2026, 1, 10, 13, 45))
+    assert slots.caution_permittance(datetime(2026, 1, 10, 14, 10)) == 0.4
+    assert slots.caution_permittance(datetime(2026, 1, 10, 14, 30)) is None
+    assert slots.caution_permittance(datetime(2026, 1, 10, 14, 50)) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_snapshot_builds_slot_index_once():
+    hub = _hub()
+    hub.sensors, hub.hours, hub.spotprice, hub.chargecontroller = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    hub.hours.non_hours = [datetime.now().replace(minute=0, second=0, microsecond=0)]
+    hub.hours.dynamic_caution_hours = {}
+    hub.hours.caution_hours = []
+    assert hub.snapshot.slots is hub.snapshot.slots
+    assert hub.now_is_non_hour()
+    assert not hub.now_is_caution_hour()
+
+
+@pytest.mark.asyncio
+async def test_readiness_flips_once_all_components_report():
+    carpower = SimpleNamespace(is_initialized=False)
+    hub = _hub(carpowersensor=carpower)
+    hub.hours = SimpleNamespace(is_initialized=True)
+    hub.chargertype = SimpleNamespace(is_initialized=True)
+    assert not hub.readiness.check()
+    assert not hub.is_initialized
+    assert hub.readiness.pending == [InitializerTypes.CarPowerSensor]
+    assert InitializerTypes.Hours in hub.readiness.ready_after
+    carpower.is_initialized = True
+    await hub._async_on_change(_event('sensor.power', None, State('sensor.power', '100')))
+    assert hub.is_initialized
+    assert hub.readiness.diagnostics()["pending"] == []
+    assert hub.observer.model.command_stats[ObserverTypes.HubInitialized].broadcasts == 1
+    carpower.is_initialized = False
+    assert hub.readiness.check()
+
+
+def test_next_hub_slug():
+    assert next_hub_slug('peaqev', set()) == 'peaqev'
+    assert next_hub_slug('peaqev', {None}) == 'peaqev'
+    assert next_hub_slug('peaqev', {'peaqev'}) == 'peaqev_2'
+    assert next_hub_slug('peaqev', {'peaqev', 'peaqev_2', 'peaqev_4'}) == 'peaqev_3'
+
+
+def test_additional_hub_gets_own_names():
+    first = HomeAssistantHub(MagicMock(), HubOptions(), 'peaqev', ObserverTest())
+    second = HomeAssistantHub(MagicMock(), HubOptions(), 'peaqev_2', ObserverTest())
+    assert first.hub_id == 1337
+    assert second.hub_id == 'peaqev_2'
+    assert second.hubname == 'Peaqev_2'
+    assert first.observer is not second.observer
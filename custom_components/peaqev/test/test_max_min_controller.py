@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+from peaqevcore.models.chargecontroller_states import ChargeControllerStates
+
+from custom_components.peaqev.peaqservice.hub.max_min_controller import \
+    MaxMinController
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+
+
+class ServicesTest:
+    def __init__(self, states: dict):
+        self.states = states
+        self.calls = []
+
+    async def async_call(self, domain, service, data):
+        self.calls.append(data['value'])
+        self.states[data['entity_id']] = SimpleNamespace(state=str(data['value']))
+
+
+def _controller(max_charge: int = 20) -> MaxMinController:
+    states = {'number.peaqev_max_charge': SimpleNamespace(state='10')}
+    hub = SimpleNamespace(
+        model=SimpleNamespace(domain='peaqev'),
+        options=SimpleNamespace(price=SimpleNamespace(price_aware=True), peaqev_lite=False, max_charge=max_charge),
+        observer=ObserverTest(),
+        chargecontroller=SimpleNamespace(status_type=ChargeControllerStates.Idle),
+    )
+    hub.state_machine = SimpleNamespace(states=states, services=ServicesTest(states))
+    return MaxMinController(hub)
+
+
+@pytest.mark.asyncio
+async def test_reset_only_when_inputs_change():
+    controller = _controller()
+    await controller.async_try_reset_max_charge_sensor()
+    assert controller.hub.state_machine.services.calls == [20]
+    for _ in range(5):
+        await controller.async_try_reset_max_charge_sensor()
+    assert controller.hub.state_machine.services.calls == [20]
+    assert controller.skipped_resets == 5
+
+
+@pytest.mark.asyncio
+async def test_reset_on_charger_status_change():
+    controller = _controller()
+    await controller.async_try_reset_max_charge_sensor()
+    controller.hub.state_machine.states['number.peaqev_max_charge'].state = '12'
+    await controller.async_try_reset_max_charge_sensor()
+    assert controller.hub.state_machine.services.calls == [20]
+    controller.hub.chargecontroller.status_type = ChargeControllerStates.Connected
+    await controller.async_try_reset_max_charge_sensor()
+    assert controller.hub.state_machine.services.calls == [20, 20]
+
+
+@pytest.mark.asyncio
+async def test_original_total_charge_signals_only_on_change():
+    controller = _controller(max_charge=0)
+    controller.original_total_charge = 0
+    assert not controller.hub.observer.model.broadcast_queue
+    controller.original_total_charge = 15
+    assert len(controller.hub.observer.model.broadcast_queue) == 1
+    await controller.async_try_reset_max_charge_sensor()
+    assert controller.hub.state_machine.services.calls == [15]
@@ -1,8 +1,16 @@
+import asyncio
+import threading
 import time
+from functools import partial
 
 import pytest
 from peaqevcore.common.models.observer_types import ObserverTypes
 
+from custom_components.peaqev.peaqservice.hub.observer.const import (
+    COMMAND_WAIT, DISPATCH_RETRY_MARGIN, CommandPriority, EvictionReason,
+    FanoutMode, SubscriberFailure)
+from custom_components.peaqev.peaqservice.hub.observer.models.subscriber import \
+    Subscriber
 from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
     ObserverTest
 
@@ -60,7 +68,7 @@ async def test_observer_deactivate():
 async def test_observer_broadcast():
     observer = ObserverTest()
     await observer.async_broadcast(ObserverTypes.Test)
-    assert observer.model.broadcast_queue[0].command == ObserverTypes.Test
+    assert list(observer.model.broadcast_queue.values())[0].command == ObserverTypes.Test
 
 @pytest.mark.asyncio
 async def test_observer_async_dispatch():
@@ -68,7 +76,7 @@ async def test_observer_async_dispatch():
     observer.add(ObserverTypes.Test, MockCalls.mock_async_call_no_args)
     await observer.async_broadcast(ObserverTypes.Test)
     await observer.async_dispatch()
-    assert observer.model.broadcast_queue == []
+    assert observer.model.broadcast_queue == {}
 
 @pytest.mark.asyncio
 async def test_observer_async_dispatch_single_arg():
@@ -85,7 +93,7 @@ async def test_observer_sync_dispatch():
     observer.add(ObserverTypes.Test, MockCalls.mock_call_no_args)
     await observer.async_broadcast(ObserverTypes.Test)
     await observer.async_dispatch()
-    assert observer.model.broadcast_queue == []
+    assert observer.model.broadcast_queue == {}
 
 @pytest.mark.asyncio
 async def test_observer_sync_dispatch_single_arg():
@@ -101,18 +109,292 @@ async def test_observer_async_dispatch_no_subscriber():
     observer = ObserverTest()
     await observer.async_broadcast(ObserverTypes.Test)
     await observer.async_dispatch()
-    assert observer.model.broadcast_queue[0].command == ObserverTypes.Test
+    assert list(observer.model.broadcast_queue.values())[0].command == ObserverTypes.Test
 
 @pytest.mark.asyncio
 async def test_observer_async_dequeue_and_broadcast():
     observer = ObserverTest()
     await observer.async_broadcast(ObserverTypes.Test)
-    await observer.async_dequeue_and_broadcast(observer.model.broadcast_queue[0])
-    assert observer.model.broadcast_queue == []
+    await observer.async_dequeue_and_broadcast(list(observer.model.broadcast_queue.values())[0])
+    assert observer.model.broadcast_queue == {}
 
 @pytest.mark.asyncio
 async def test_observer_async_dequeue_and_broadcast_not_in_broadcast_queue():
     observer = ObserverTest()
     await observer.async_broadcast(ObserverTypes.Test)
-    await observer.async_dequeue_and_broadcast(observer.model.broadcast_queue[0])
-    assert observer.model.broadcast_queue == []
\ No newline at end of file
+    await observer.async_dequeue_and_broadcast(list(observer.model.broadcast_queue.values())[0])
+    assert observer.model.broadcast_queue == {}
+
+@pytest.mark.asyncio
+async def test_observer_nothing_to_wait_for_when_idle():
+    observer = ObserverTest()
+    assert observer.seconds_until_next_broadcast() is None
+
+@pytest.mark.asyncio
+async def test_observer_nothing_to_wait_for_without_subscribers():
+    observer = ObserverTest()
+    await observer.async_broadcast(ObserverTypes.Test)
+    assert observer.seconds_until_next_broadcast() is None
+
+@pytest.mark.asyncio
+async def test_observer_wait_for_throttled_command():
+    observer = ObserverTest()
+    observer.add(ObserverTypes.Test, MockCalls.mock_async_call_no_args)
+    await observer.async_broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    await observer.async_broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    assert len(observer.model.broadcast_queue) == 1
+    assert 0 < observer.seconds_until_next_broadcast() <= COMMAND_WAIT + DISPATCH_RETRY_MARGIN
+
+
+@pytest.mark.asyncio
+async def test_observer_broadcast_coalesces_equal_commands():
+    observer = ObserverTest()
+    observer.broadcast(ObserverTypes.Test, {'a': [1, 2]})
+    observer.broadcast(ObserverTypes.Test, {'a': [1, 2]})
+    observer.broadcast(ObserverTypes.Test, {'a': [1, 3]})
+    assert len(observer.model.broadcast_queue) == 2
+
+@pytest.mark.asyncio
+async def test_observer_broadcast_coalesce_refreshes_expiration():
+    observer = ObserverTest()
+    observer.broadcast(ObserverTypes.Test)
+    queued = list(observer.model.broadcast_queue.values())[0]
+    queued.expiration = 0
+    observer.broadcast(ObserverTypes.Test)
+    assert queued.expiration > time.time()
+
+@pytest.mark.asyncio
+async def test_observer_dispatch_evicts_expired_commands():
+    observer = ObserverTest()
+    observer.broadcast(ObserverTypes.Test)
+    list(observer.model.broadcast_queue.values())[0].expiration = time.time() - 1
+    await observer.async_dispatch()
+    assert observer.model.broadcast_queue == {}
+    assert observer.model.evictions[EvictionReason.NoSubscribers] == 1
+
+@pytest.mark.asyncio
+async def test_observer_dispatch_evicts_expired_throttled_commands():
+    observer = ObserverTest()
+    observer.add(ObserverTypes.Test, MockCalls.mock_async_call_no_args)
+    await observer.async_ok_to_broadcast(ObserverTypes.Test)
+    observer.broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    assert len(observer.model.broadcast_queue) == 1
+    list(observer.model.broadcast_queue.values())[0].expiration = time.time() - 1
+    await observer.async_dispatch()
+    assert observer.model.broadcast_queue == {}
+    assert observer.model.evictions[EvictionReason.Throttled] == 1
+
+@pytest.mark.asyncio
+async def test_observer_critical_command_bypasses_throttle_and_queue():
+    observer = ObserverTest()
+    MockCalls.mock_async_call_single_arg_result = None
+    observer.add(ObserverTypes.KillswitchDead, MockCalls.mock_async_call_single_arg)
+    await observer.async_ok_to_broadcast(ObserverTypes.KillswitchDead)
+    await observer.async_broadcast(ObserverTypes.KillswitchDead, "dead")
+    assert MockCalls.mock_async_call_single_arg_result == "dead"
+    assert observer.model.broadcast_queue == {}
+    assert observer.model.lane_latency[CommandPriority.Critical].count == 1
+
+
+@pytest.mark.asyncio
+async def test_observer_critical_sync_broadcast_delivers_without_dispatch():
+    observer = ObserverTest()
+    MockCalls.mock_async_call_single_arg_result = None
+    observer.add(ObserverTypes.PowerCanaryDead, MockCalls.mock_async_call_single_arg)
+    observer.broadcast(ObserverTypes.PowerCanaryDead, "tripped")
+    assert observer.model.broadcast_queue == {}
+    await asyncio.sleep(0)
+    assert MockCalls.mock_async_call_single_arg_result == "tripped"
+
+
+@pytest.mark.asyncio
+async def test_observer_critical_in_flight_is_coalesced():
+    observer = ObserverTest()
+    calls = []
+    async def _pause(arg):
+        calls.append(arg)
+        await asyncio.sleep(0.01)
+    observer.add(ObserverTypes.PowerCanaryDead, _pause)
+    for _ in range(5):
+        observer.broadcast(ObserverTypes.PowerCanaryDead, "tripped")
+    await asyncio.sleep(0.05)
+    assert calls == ["tripped"]
+    assert observer.model.command_stats[ObserverTypes.PowerCanaryDead].coalesced == 4
+    observer.broadcast(ObserverTypes.PowerCanaryDead, "tripped")
+    await asyncio.sleep(0.05)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_observer_critical_failure_does_not_skip_other_subscribers():
+    observer = ObserverTest()
+    paused = []
+    def _fails(arg):
+        raise ValueError(arg)
+    async def _pause(arg):
+        paused.append(arg)
+    observer.add(ObserverTypes.KillswitchDead, _fails)
+    observer.add(ObserverTypes.KillswitchDead, _pause)
+    await observer.async_broadcast(ObserverTypes.KillswitchDead, "dead")
+    assert paused == ["dead"]
+    assert observer.model.failures[SubscriberFailure.Error] == 1
+
+
+@pytest.mark.asyncio
+async def test_observer_dispatch_normal_before_low():
+    observer = ObserverTest()
+    order = []
+    async def _low():
+        order.append(CommandPriority.Low)
+    async def _normal():
+        order.append(CommandPriority.Normal)
+    observer.add(ObserverTypes.DailyAveragePriceChanged, _low)
+    observer.add(ObserverTypes.PricesChanged, _normal)
+    observer.broadcast(ObserverTypes.DailyAveragePriceChanged)
+    observer.broadcast(ObserverTypes.PricesChanged)
+    await observer.async_dispatch()
+    assert order == [CommandPriority.Normal, CommandPriority.Low]
+    assert observer.model.lane_latency[CommandPriority.Normal].count == 1
+    assert observer.model.lane_latency[CommandPriority.Low].count == 1
+
+
+@pytest.mark.asyncio
+async def test_observer_concurrent_fanout_runs_subscribers_together():
+    observer = ObserverTest(FanoutMode.Concurrent)
+    started = []
+    async def _slow():
+        started.append("slow")
+        await asyncio.sleep(0.2)
+    async def _fast():
+        started.append("fast")
+    observer.add(ObserverTypes.Test, _slow)
+    observer.add(ObserverTypes.Test, _fast)
+    observer.broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    await asyncio.sleep(0.05)
+    assert started == ["slow", "fast"]
+    await asyncio.gather(*observer._tasks)
+    assert observer.model.lane_latency[CommandPriority.Normal].count == 1
+
+
+@pytest.mark.asyncio
+async def test_observer_concurrent_fanout_respects_stages():
+    observer = ObserverTest(FanoutMode.Concurrent)
+    order = []
+    async def _first():
+        await asyncio.sleep(0.05)
+        order.append(0)
+    async def _second():
+        order.append(1)
+    observer.add(ObserverTypes.Test, _second, stage=1)
+    observer.add(ObserverTypes.Test, _first)
+    observer.broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    await asyncio.gather(*observer._tasks)
+    assert order == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_observer_concurrent_fanout_isolates_timeouts():
+    observer = ObserverTest(FanoutMode.Concurrent)
+    MockCalls.mock_async_call_single_arg_result = None
+    async def _hang(arg):
+        await asyncio.sleep(10)
+    observer.add(ObserverTypes.Test, _hang, timeout=0.05)
+    observer.add(ObserverTypes.Test, MockCalls.mock_async_call_single_arg)
+    observer.broadcast(ObserverTypes.Test, "ok")
+    await observer.async_dispatch()
+    await asyncio.gather(*observer._tasks)
+    assert MockCalls.mock_async_call_single_arg_result == "ok"
+    assert observer.model.failures[SubscriberFailure.Timeout] == 1
+
+
+@pytest.mark.asyncio
+async def test_observer_serial_fanout_isolates_timeouts_and_errors():
+    observer = ObserverTest()
+    MockCalls.mock_async_call_single_arg_result = None
+    async def _hang(arg):
+        await asyncio.sleep(10)
+    def _fails(arg):
+        raise ValueError(arg)
+    observer.add(ObserverTypes.Test, _hang, timeout=0.05)
+    observer.add(ObserverTypes.Test, _fails)
+    observer.add(ObserverTypes.Test, MockCalls.mock_async_call_single_arg)
+    observer.broadcast(ObserverTypes.Test, "ok")
+    await observer.async_dispatch()
+    assert MockCalls.mock_async_call_single_arg_result == "ok"
+    assert observer.model.failures[SubscriberFailure.Timeout] == 1
+    assert observer.model.failures[SubscriberFailure.Error] == 1
+
+
+@pytest.mark.asyncio
+async def test_subscriber_adapter_inspects_once():
+    sub = Subscriber(MockCalls.mock_async_call_multiple_args)
+    assert sub.is_coroutine
+    assert sub.takes_positional
+    assert sub.keywords == {"test_arg1", "test_arg2"}
+    assert not Subscriber(MockCalls.mock_call_no_args).takes_positional
+    assert Subscriber(partial(MockCalls.mock_async_call_single_arg, 1)).is_coroutine
+
+
+@pytest.mark.asyncio
+async def test_observer_dispatch_kwargs_and_ignored_argument():
+    observer = ObserverTest()
+    MockCalls.mock_async_call_multiple_args_result = None
+    observer.add(ObserverTypes.Test, MockCalls.mock_async_call_multiple_args)
+    observer.add(ObserverTypes.Test, MockCalls.mock_call_no_args)
+    await observer.async_broadcast(ObserverTypes.Test, {"test_arg1": 1, "test_arg2": 2})
+    await observer.async_dispatch()
+    assert MockCalls.mock_async_call_multiple_args_result == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_observer_subscriber_typeerror_is_not_retried():
+    observer = ObserverTest()
+    calls = []
+    async def _broken(arg):
+        calls.append(arg)
+        raise TypeError("inside subscriber")
+    observer.add(ObserverTypes.Test, _broken)
+    await observer.async_broadcast(ObserverTypes.Test, 1)
+    await observer.async_dispatch()
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_observer_sync_subscriber_runs_inline_unless_blocking():
+    observer = ObserverTest()
+    threads = {}
+    def _inline():
+        threads["inline"] = threading.get_ident()
+    def _blocking():
+        threads["blocking"] = threading.get_ident()
+    observer.add(ObserverTypes.Test, _inline)
+    observer.add(ObserverTypes.Test, _blocking, blocking=True)
+    await observer.async_broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    assert threads["inline"] == threading.get_ident()
+    assert threads["blocking"] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_observer_diagnostics_counts_and_timings():
+    observer = ObserverTest()
+    observer.add(ObserverTypes.Test, MockCalls.mock_async_call_no_args)
+    observer.broadcast(ObserverTypes.Test)
+    observer.broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    observer.broadcast(ObserverTypes.Test)
+    await observer.async_dispatch()
+    stats = observer.model.command_stats[ObserverTypes.Test]
+    assert (stats.broadcasts, stats.coalesced, stats.dispatched, stats.throttled) == (3, 1, 1, 1)
+    assert stats.queue_wait.count == 1
+    assert stats.run.count == 1
+    assert observer.model.subscriber_time["MockCalls.mock_async_call_no_args"].count == 1
+    diagnostics = observer.diagnostics()
+    assert diagnostics["queue_depth"] == 1
+    assert diagnostics["commands"]["Test"]["queue_wait"]["count"] == 1
+    assert sum(diagnostics["lanes"]["Normal"]["histogram"].values()) == 1
@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from custom_components.peaqev.peaqservice.hub.sensors.models.average import (
+    Average, WindowStats)
+from custom_components.peaqev.peaqservice.hub.sensors.models.power_series import (
+    PowerSeries, SeriesTrend, SeriesWindow)
+from custom_components.peaqev.peaqservice.powertools.power_canary.smooth_average import \
+    SmoothAverage
+
+
+def test_views_share_one_ingestion():
+    series = PowerSeries()
+    average = Average(max_age=300, max_samples=300, windows={"1min": 60}, series=series)
+    canary = SmoothAverage(max_age=60, max_samples=30, ignore=0, series=series)
+    for val in [0, 1000, 2000, 3000]:
+        series.append(val)
+    assert series.count == 4
+    assert average.stats() == WindowStats(mean=1500, min=0, max=3000, count=4)
+    assert canary.value == 2000
+    assert not canary.owns_series
+    assert series.diagnostics()["views"] == 3
+
+
+def test_ring_overwrite_evicts_from_views():
+    series = PowerSeries(capacity=4)
+    window = SeriesWindow(series, max_age=300)
+    for val in range(1, 11):
+        series.append(val)
+    assert series.oldest_index == 6
+    assert window.count == 4
+    assert (window.mean, window.min, window.max) == (8.5, 7, 10)
+    assert [v for _, v in window.readings()] == [7, 8, 9, 10]
+
+
+def test_ignored_readings_stay_out_of_the_window():
+    series = PowerSeries()
+    window = SeriesWindow(series, max_age=300, max_samples=2, ignore=0)
+    for val in [500, 0, -10, 700, 0, 900]:
+        series.append(val)
+    assert window.count == 2
+    assert window.mean == 800
+    assert window.min == 700
+
+
+def test_trend_is_slope_per_hour():
+    series = PowerSeries()
+    trend = SeriesTrend(series, max_age=7200, precision=0)
+    now = time.time()
+    for minutes, val in [(-30, 1000), (-20, 1500), (-10, 2000), (0, 2500)]:
+        series.append(val, now + minutes * 60)
+    assert trend.samples == 4
+    assert trend.gradient == 3000
+
+
+def test_trend_needs_two_readings():
+    series = PowerSeries()
+    trend = SeriesTrend(series, max_age=300)
+    series.append(1000)
+    assert trend.gradient == 0
+
+
+def test_trend_origin_follows_the_window():
+    series = PowerSeries()
+    trend = SeriesTrend(series, max_age=300, max_samples=10, precision=0)
+    now = time.time() - 100
+    for i in range(100):
+        series.append(1000 + i * 10, now + i)
+    assert trend._origin >= series.time_at(series.count - 20)
+    assert trend.gradient == 36000
+
+
+def test_detached_view_stops_reading():
+    series = PowerSeries()
+    window = SeriesWindow(series, max_age=300)
+    series.append(1000)
+    window.detach()
+    series.append(2000)
+    assert window.count == 1
+    assert series.diagnostics()["views"] == 0
+
+
+def test_ingestion_rate():
+    series = PowerSeries()
+    now = time.time()
+    for i in range(11):
+        series.append(1000, now + i * 6)
+    assert series.readings_per_minute() == 10
+    assert series.diagnostics()["stored"] == 11
+
+
+def test_window_sum_stays_exact_over_long_runs():
+    series = PowerSeries(capacity=16)
+    window = SeriesWindow(series, max_age=300, max_samples=5)
+    for _ in range(10000):
+        series.append(0.1)
+    assert window.mean == pytest.approx(0.1, abs=1e-12)
+
+
+def test_series_grows_to_hold_its_span():
+    series = PowerSeries(capacity=4, span=10)
+    window = SeriesWindow(series, max_age=300)
+    now = time.time()
+    for i in range(20):
+        series.append(i, now + i * 0.1)
+    assert series.capacity == 32
+    assert series.oldest_index == 0
+    assert window.count == 20
+    assert [v for _, v in window.readings()][:3] == [0, 1, 2]
+
+
+def test_series_stops_growing_once_span_is_held():
+    series = PowerSeries(capacity=4, span=3)
+    window = SeriesWindow(series, max_age=300)
+    now = time.time()
+    for i in range(10):
+        series.append(i, now + i)
+    assert series.capacity == 4
+    assert [v for _, v in window.readings()] == [6, 7, 8, 9]
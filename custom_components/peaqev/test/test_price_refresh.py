@@ -0,0 +1,69 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.peaqev.peaqservice.hub.const import PriceRefreshReason
+from custom_components.peaqev.peaqservice.hub.price_refresh import \
+    PriceRefreshScheduler
+
+
+class SpotpriceTest:
+    def __init__(self, delay: float = 0):
+        self.updates = 0
+        self.delay = delay
+
+    async def async_update_spotprice(self):
+        await asyncio.sleep(self.delay)
+        self.updates += 1
+
+
+def _scheduler(initialized: bool = True, delay: float = 0) -> PriceRefreshScheduler:
+    hub = SimpleNamespace(prices_initialized=initialized, spotprice=SpotpriceTest(delay))
+    return PriceRefreshScheduler(hub, None)
+
+
+@pytest.mark.asyncio
+async def test_check_refreshes_while_uninitialized():
+    scheduler = _scheduler(initialized=False)
+    await scheduler._async_on_check()
+    await scheduler._async_on_check()
+    assert scheduler.refreshes[PriceRefreshReason.Uninitialized] == 2
+
+
+@pytest.mark.asyncio
+async def test_check_respects_freshness_budget():
+    scheduler = _scheduler()
+    await scheduler._async_on_check()
+    assert scheduler.refreshes[PriceRefreshReason.Stale] == 1
+    await scheduler._async_on_check()
+    assert scheduler.refreshes[PriceRefreshReason.Stale] == 1
+    scheduler.latest_refresh = time.time() - scheduler.freshness_budget - 1
+    await scheduler._async_on_check()
+    assert scheduler.refreshes[PriceRefreshReason.Stale] == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_does_not_overlap():
+    scheduler = _scheduler(delay=0.05)
+    spotprice = scheduler._hub.spotprice
+    running = asyncio.ensure_future(scheduler.async_refresh(PriceRefreshReason.Slot))
+    await asyncio.sleep(0.01)
+    await scheduler.async_refresh(PriceRefreshReason.PriceEntity)
+    assert spotprice.updates == 0
+    await running
+    assert spotprice.updates == 2
+    assert scheduler.refreshes[PriceRefreshReason.Slot] == 1
+    assert scheduler.refreshes[PriceRefreshReason.PriceEntity] == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_during_a_refresh_coalesce():
+    scheduler = _scheduler(delay=0.05)
+    await asyncio.gather(
+        scheduler.async_refresh(PriceRefreshReason.Slot),
+        *(scheduler.async_refresh(PriceRefreshReason.PriceEntity) for _ in range(5)),
+    )
+    assert scheduler._hub.spotprice.updates == 2
+    assert scheduler.refreshes[PriceRefreshReason.PriceEntity] == 1
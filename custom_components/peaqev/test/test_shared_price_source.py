@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import pytest
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.const import (
+    PRICE_SOURCES, PriceRefreshReason)
+from custom_components.peaqev.peaqservice.hub.shared_price_source import \
+    SharedPriceSource
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+
+PRICE_ENTITY = 'sensor.nordpool'
+
+
+class SpotpriceTest:
+    def __init__(self, is_initialized: bool = True):
+        self.entity = PRICE_ENTITY
+        self.is_initialized = is_initialized
+        self.updates = 0
+
+    async def async_update_spotprice(self):
+        self.updates += 1
+
+    def callback_export_prices(self):
+        return [[1.0, 2.0], []]
+
+
+class PriceHubTest:
+    def __init__(self, name: str):
+        self.model = SimpleNamespace(domain=name)
+        self.options = SimpleNamespace(price=SimpleNamespace(price_aware=True))
+        self.observer = ObserverTest()
+        self.hours = SimpleNamespace(is_initialized=True)
+        self.prices = []
+
+    async def async_update_prices(self, prices: list):
+        self.prices.append(prices)
+
+
+def _source(*hubs) -> SharedPriceSource:
+    hass = SimpleNamespace(states={PRICE_ENTITY: SimpleNamespace(state='1.0')}, data={})
+    source = SharedPriceSource(hass, ('nordpool', None))
+    hass.data[PRICE_SOURCES] = {source.key: source}
+    source.spotprice = SpotpriceTest()
+    source.members.extend(hubs)
+    return source
+
+
+@pytest.mark.asyncio
+async def test_price_entity_change_refreshes_once_for_all_hubs():
+    source = _source(PriceHubTest('peaqev'), PriceHubTest('peaqev_2'), PriceHubTest('peaqev_3'))
+    for _ in source.members:
+        await source.async_refresh_from_entity()
+    assert source.spotprice.updates == 1
+    assert source.deduplicated == 2
+    source.state_machine.states[PRICE_ENTITY] = SimpleNamespace(state='1.1')
+    for _ in source.members:
+        await source.async_refresh_from_entity()
+    assert source.spotprice.updates == 2
+    assert source.price_refresh.refreshes[PriceRefreshReason.PriceEntity] == 2
+
+
+@pytest.mark.asyncio
+async def test_prices_and_broadcasts_reach_every_hub():
+    first, second = PriceHubTest('peaqev'), PriceHubTest('peaqev_2')
+    source = _source(first, second)
+    await source.async_update_prices([[1.0], []])
+    await source.async_broadcast(ObserverTypes.PricesChanged, [[1.0], []])
+    for hub in (first, second):
+        assert hub.prices == [[[1.0], []]]
+        assert hub.observer.model.command_stats[ObserverTypes.PricesChanged].broadcasts == 1
+
+
+@pytest.mark.asyncio
+async def test_late_joiner_gets_current_prices():
+    source = _source(PriceHubTest('peaqev'))
+    late = PriceHubTest('peaqev_2')
+    await source.async_add(late)
+    assert late.prices == [[[1.0, 2.0], []]]
+    assert late.observer.model.command_stats[ObserverTypes.SpotpriceInitialized].broadcasts == 1
+    assert len(source.members) == 2
+
+
+@pytest.mark.asyncio
+async def test_last_hub_leaving_drops_source():
+    first, second = PriceHubTest('peaqev'), PriceHubTest('peaqev_2')
+    source = _source(first, second)
+    source.remove(first)
+    assert source.key in source.state_machine.data[PRICE_SOURCES]
+    source.remove(second)
+    assert source.key not in source.state_machine.data[PRICE_SOURCES]
@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+
+from peaqevcore.models.const import CURRENTS_THREEPHASE_1_16
+
+from custom_components.peaqev.peaqservice.powertools.site_allocator.charger_demand import \
+    ChargerDemand
+from custom_components.peaqev.peaqservice.powertools.site_allocator.const import \
+    SITE_ALLOCATORS
+from custom_components.peaqev.peaqservice.powertools.site_allocator.site_allocator import (
+    SiteAllocator, split_budget)
+
+
+class ThresholdTest:
+    def __init__(self, amps: int):
+        self.amps = amps
+        self.currents = CURRENTS_THREEPHASE_1_16
+
+    def allowed_current(self) -> int:
+        return self.amps
+
+
+def _hub(name: str, amps: int = 16, draw: float = 0, priority: int = 0, running: bool = True, fuse_max: int = 0):
+    return SimpleNamespace(
+        model=SimpleNamespace(domain=name),
+        options=SimpleNamespace(peaqev_lite=False, powersensor='sensor.mains', charger_priority=priority),
+        threshold=ThresholdTest(amps),
+        chargecontroller=SimpleNamespace(charger=SimpleNamespace(model=SimpleNamespace(running=running))),
+        sensors=SimpleNamespace(
+            carpowersensor=SimpleNamespace(value=draw),
+            power=SimpleNamespace(total=SimpleNamespace(value=0)),
+        ),
+        power=SimpleNamespace(power_canary=SimpleNamespace(
+            enabled=fuse_max > 0, model=SimpleNamespace(fuse_max=fuse_max, cutoff_threshold=0.9))
+        ),
+    )
+
+
+def _site(*hubs) -> SiteAllocator:
+    hass = SimpleNamespace(data={})
+    for hub in hubs:
+        hub.state_machine = hass
+        SiteAllocator.join(hub)
+    return hass.data[SITE_ALLOCATORS]['sensor.mains']
+
+
+def test_split_budget_is_even_within_priority():
+    demands = [ChargerDemand('a', 0, 4100, 11000), ChargerDemand('b', 0, 4100, 11000)]
+    assert split_budget(11000, demands) == {'a': 5500, 'b': 5500}
+
+
+def test_split_budget_gives_unused_share_to_others():
+    demands = [ChargerDemand('a', 0, 4100, 5500), ChargerDemand('b', 0, 4100, 11000)]
+    assert split_budget(14000, demands) == {'a': 5500, 'b': 8500}
+
+
+def test_split_budget_serves_priority_first():
+    demands = [ChargerDemand('low', 0, 4100, 11000), ChargerDemand('high', 1, 4100, 11000)]
+    assert split_budget(14000, demands) == {'low': 4100, 'high': 9900}
+
+
+def test_split_budget_pauses_lowest_priority_when_minimums_dont_fit():
+    demands = [ChargerDemand('low', 0, 4100, 11000), ChargerDemand('high', 1, 4100, 11000)]
+    assert split_budget(6000, demands) == {'low': 0, 'high': 6000}
+
+
+def test_split_budget_never_over_allocates():
+    demands = [ChargerDemand('a', 0, 4100, 11000), ChargerDemand('b', 0, 4100, 11000)]
+    assert split_budget(2000, demands) == {'a': 0, 'b': 0}
+    assert split_budget(-2000, demands) == {'a': 0, 'b': 0}
+
+
+def test_single_charger_gets_its_wish():
+    hub = _hub('peaqev')
+    site = _site(hub, _hub('peaqev_2', running=False))
+    assert site.allocate(hub, 16) == 16
+
+
+def test_peak_headroom_is_shared():
+    first, second = _hub('peaqev'), _hub('peaqev_2')
+    site = _site(first, second)
+    assert site.allocate(first, 16) == 8
+    assert site.allocate(second, 16) == 8
+
+
+def test_fuse_caps_the_site():
+    first, second = _hub('peaqev', draw=5500, fuse_max=17000), _hub('peaqev_2', draw=5500, fuse_max=17000)
+    for hub in (first, second):
+        hub.sensors.power.total.value = 14300
+    site = _site(first, second)
+    """fuse headroom is 17000 * 0.9 - 14300 = 1000 W on top of the 11000 W the chargers draw"""
+    assert site.allocate(first, 16) == 8
+    assert site.diagnostics()["allocated_amps"] == {'peaqev': 8}
+
+
+def test_higher_priority_charger_gets_more():
+    first, second = _hub('peaqev', priority=1), _hub('peaqev_2')
+    site = _site(first, second)
+    assert site.allocate(first, 16) == 10
+    assert site.allocate(second, 16) == 6
+
+
+def test_charger_without_budget_is_paused():
+    first, second = _hub('peaqev', priority=1, draw=4100, fuse_max=17000), _hub('peaqev_2', draw=4100, fuse_max=17000)
+    for hub in (first, second):
+        hub.sensors.power.total.value = 16000
+    site = _site(first, second)
+    """8200 W drawn minus 700 W over the fuse leaves 7500 W, one minimum but not two"""
+    assert site.allocate(first, 16) == 10
+    assert site.allocate(second, 16) == 0
+
+
+def test_hubs_on_one_mains_sensor_share_a_series():
+    first, second = _hub('peaqev'), _hub('peaqev_2')
+    site = _site(first, second)
+    assert SiteAllocator.get(first.state_machine, 'sensor.mains').power_series is site.power_series
+    assert site.feeds(first) and not site.feeds(second)
+    site.remove(first)
+    assert site.feeds(second)
+
+
+def test_lite_hub_has_no_site():
+    hub = _hub('peaqev')
+    hub.options.peaqev_lite = True
+    hub.state_machine = SimpleNamespace(data={})
+    assert SiteAllocator.join(hub) is None
+
+
+def test_last_hub_leaving_drops_site():
+    first, second = _hub('peaqev'), _hub('peaqev_2')
+    site = _site(first, second)
+    site.remove(first)
+    assert SITE_ALLOCATORS in first.state_machine.data and site.key in first.state_machine.data[SITE_ALLOCATORS]
+    site.remove(second)
+    assert site.key not in first.state_machine.data[SITE_ALLOCATORS]
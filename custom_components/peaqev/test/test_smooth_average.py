@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from custom_components.peaqev.peaqservice.powertools.power_canary.smooth_average import \
+    SmoothAverage
+
+
+def test_mean_of_readings():
+    avg = SmoothAverage(max_age=60, max_samples=30)
+    assert avg.value is None
+    for val in [1000, 2000, 3000]:
+        avg.add_reading(val)
+    assert avg.value == 2000
+    assert avg.samples == 3
+
+
+def test_ignored_and_invalid_readings_are_dropped():
+    avg = SmoothAverage(max_age=60, max_samples=30, ignore=0)
+    for val in [0, -5, 'unavailable', None, 500]:
+        avg.add_reading(val)
+    assert avg.samples_raw[0][1] == 500
+    assert avg.samples == 1
+
+
+def test_max_samples_keeps_the_newest():
+    avg = SmoothAverage(max_age=60, max_samples=3)
+    for val in range(1, 11):
+        avg.add_reading(val)
+    assert [r[1] for r in avg.samples_raw] == [8, 9, 10]
+    assert avg.value == 9
+
+
+def test_old_samples_are_evicted_but_last_ones_kept():
+    avg = SmoothAverage(max_age=60, max_samples=30)
+    old = int(time.time()) - 120
+    avg.samples_raw = [(old, 100.0), (old, 200.0), (old, 300.0), (old, 400.0)]
+    assert [r[1] for r in avg.samples_raw] == [300.0, 400.0]
+    avg.add_reading(1000)
+    assert [r[1] for r in avg.samples_raw] == [400.0, 1000.0]
+    assert avg.value == 700
+
+
+def test_running_sum_stays_exact():
+    avg = SmoothAverage(max_age=60, max_samples=5)
+    for _ in range(10000):
+        avg.add_reading(0.1)
+    assert avg.value == pytest.approx(0.1, abs=1e-12)
@@ -0,0 +1,191 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from peaqevcore.common.models.observer_types import ObserverTypes
+from peaqevcore.models.chargecontroller_states import ChargeControllerStates
+
+from custom_components.peaqev.peaqservice.chargertypes.models.chargertypes_enum import \
+    ChargerType
+from custom_components.peaqev.peaqservice.hub.state_changes.state_changes import (
+    StateChanges, StateChangesNoCharger)
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+from custom_components.peaqev.test.mock_classes.state_changes_test import (
+    HubTest, StateChangesTest)
+
+
+def _sensor(entity: str):
+    return SimpleNamespace(entity=entity, value=None)
+
+
+def _hub(spotprice_entity=None):
+    updates = []
+    async def _async_update_spotprice():
+        updates.append("spotprice")
+    hub = SimpleNamespace(
+        options=SimpleNamespace(powersensor="sensor.power"),
+        sensors=SimpleNamespace(
+            powersensormovingaverage=_sensor("sensor.avg"),
+            powersensormovingaverage24=_sensor("sensor.avg"),
+        ),
+        spotprice=SimpleNamespace(entity=spotprice_entity),
+        async_set_chargerobject_value=None,
+        async_update_spotprice=_async_update_spotprice,
+    )
+    return hub, updates
+
+
+class PowerTest:
+    def __init__(self):
+        self.house = 0
+        self.total = SimpleNamespace(value=0)
+
+    async def async_update(self, carpowersensor_value, config_sensor_value):
+        if config_sensor_value is not None:
+            self.house = config_sensor_value
+        self.total.value = self.house + carpowersensor_value
+
+
+def _power_hub(ingestion_window: float):
+    readings = []
+    hub = SimpleNamespace(
+        state_machine=SimpleNamespace(
+            async_create_task=lambda coro, name=None: asyncio.get_running_loop().create_task(coro, name=name)
+        ),
+        observer=ObserverTest(),
+        options=SimpleNamespace(
+            powersensor="sensor.power", price=SimpleNamespace(price_aware=False), ingestion_window=ingestion_window
+        ),
+        sensors=SimpleNamespace(
+            power=PowerTest(),
+            power_series=SimpleNamespace(append=lambda value: readings.append(value)),
+        ),
+        power=SimpleNamespace(power_canary=SimpleNamespace(total_power=0)),
+        site=None,
+        model=SimpleNamespace(chargingtracker_entities=[]),
+        hours=SimpleNamespace(scheduler=None),
+        chargecontroller=SimpleNamespace(charger=SimpleNamespace(session_active=False)),
+        chargertype=ChargerType.NoCharger,
+        is_initialized=True,
+    )
+    return hub, readings
+
+
+@pytest.mark.asyncio
+async def test_dispatch_table_first_route_wins():
+    hub, _ = _hub()
+    states = StateChanges(hub)
+    await states.async_update_sensor_internal("sensor.avg", 12)
+    assert hub.sensors.powersensormovingaverage.value == 12
+    assert hub.sensors.powersensormovingaverage24.value is None
+    assert "sensor.unknown" not in states.dispatch_table
+
+
+@pytest.mark.asyncio
+async def test_dispatch_table_rebuilt_when_sensors_recreated():
+    hub, _ = _hub()
+    states = StateChanges(hub)
+    table = states.dispatch_table
+    assert states.dispatch_table is table
+    hub.sensors = SimpleNamespace(powersensormovingaverage24=_sensor("sensor.avg24"))
+    assert "sensor.avg24" in states.dispatch_table
+    assert "sensor.avg" not in states.dispatch_table
+
+
+@pytest.mark.asyncio
+async def test_dispatch_table_picks_up_spotprice_entity():
+    hub, updates = _hub()
+    states = StateChanges(hub)
+    assert await states.async_update_sensor_internal("sensor.nordpool", 1) is False
+    hub.spotprice.entity = "sensor.nordpool"
+    assert await states.async_update_sensor_internal("sensor.nordpool", 1) is True
+    assert updates == ["spotprice"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_records_handler_time():
+    hub, _ = _hub()
+    states = StateChanges(hub)
+    await states.async_update_sensor_internal("sensor.avg", 1)
+    await states.async_update_sensor_internal("sensor.avg", 2)
+    assert states.handler_time["sensor.avg"].count == 2
+    assert "sensor.unknown" not in states.handler_time
+
+
+@pytest.mark.asyncio
+async def test_power_readings_without_window_decide_every_time():
+    hub, readings = _power_hub(0)
+    states = StateChangesNoCharger(hub)
+    for value in (100, 200, 300):
+        await states.async_update_sensor("sensor.power", value)
+    assert readings == [100, 200, 300]
+    assert hub.observer.model.command_stats[ObserverTypes.ProcessChargeController].broadcasts == 3
+
+
+@pytest.mark.asyncio
+async def test_power_readings_are_batched_per_window():
+    hub, readings = _power_hub(0.05)
+    states = StateChangesNoCharger(hub)
+    for value in (100, 200, 300):
+        await states.async_update_sensor("sensor.power", value)
+    assert readings == [100, 200, 300]
+    assert hub.power.power_canary.total_power == 300
+    assert hub.observer.model.command_stats[ObserverTypes.ProcessChargeController].broadcasts == 0
+    await asyncio.sleep(0.1)
+    assert hub.observer.model.command_stats[ObserverTypes.ProcessChargeController].broadcasts == 1
+    assert states.coalesced_updates == 2
+
+
+@pytest.mark.asyncio
+async def test_car_power_feeds_the_series():
+    hub, readings = _power_hub(0)
+    hub.sensors.carpowersensor = SimpleNamespace(use_attribute=False, value=0)
+    states = StateChanges(hub)
+    await states.async_handle_powersensor(500)
+    await states.async_handle_carpowersensor(1500)
+    assert readings == [500, 2000]
+    assert hub.power.power_canary.total_power == 2000
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_open_window():
+    hub, _ = _power_hub(0.05)
+    states = StateChangesNoCharger(hub)
+    await states.async_update_sensor("sensor.power", 100)
+    states.stop()
+    await asyncio.sleep(0.1)
+    assert hub.observer.model.command_stats[ObserverTypes.ProcessChargeController].broadcasts == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_only_updates_when_inputs_change():
+    hub = HubTest(ObserverTest())
+    hub.model.price_version = 0
+    hub.current_peak_dynamic = 2.0
+    hub.sensors.powersensormovingaverage24 = SimpleNamespace(value=500)
+    hub.chargecontroller.session = SimpleNamespace(session_energy=1.0)
+    hub.chargecontroller.status_type = ChargeControllerStates.Start
+    facade_updates = []
+
+    async def _update_facade(dto):
+        facade_updates.append(dto)
+
+    hub.hours = SimpleNamespace(
+        prices=[1.0], prices_tomorrow=[],
+        scheduler=SimpleNamespace(
+            schedule_created=True,
+            model=SimpleNamespace(departuretime=None, desired_charge=10),
+            async_update_facade=_update_facade,
+        ),
+    )
+    states = StateChangesTest(hub)
+    for _ in range(3):
+        await states.async_update_session_parameters(False)
+    assert len(facade_updates) == 1
+    assert states.scheduler_updates_skipped == 2
+    hub.model.price_version += 1
+    await states.async_update_session_parameters(False)
+    hub.chargecontroller.session.session_energy = 2.0
+    await states.async_update_session_parameters(False)
+    assert len(facade_updates) == 3
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.trace.trace_recorder import \
+    TraceRecorder
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+from custom_components.peaqev.test.mock_classes.state_changes_test import (
+    HubTest, StateChangesTest)
+from custom_components.peaqev.test.trace_replay import (async_replay,
+                                                        read_trace)
+
+
+@pytest.mark.asyncio
+async def test_recorder_writes_json_lines(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    recorder = TraceRecorder(str(path), flush_size=2)
+    recorder.record_broadcast(ObserverTypes.PricesChanged, [[1.0, 2.0], []])
+    recorder.record_broadcast(ObserverTypes.Test)
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["c"] == "PricesChanged"
+    assert lines[0]["a"] == [[1.0, 2.0], []]
+    assert "a" not in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_recorder_stops_after_max_events(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    recorder = TraceRecorder(str(path), flush_size=100, max_events=3)
+    for _ in range(5):
+        recorder.record_broadcast(ObserverTypes.Test)
+    assert recorder.full
+    assert (recorder.recorded, recorder.dropped) == (3, 2)
+    assert len(path.read_text().splitlines()) == 3
+
+
+@pytest.mark.asyncio
+async def test_recorder_is_bounded():
+    recorder = TraceRecorder("unused", flush_size=100, max_buffer=3)
+    for _ in range(5):
+        recorder.record_broadcast(ObserverTypes.Test)
+    assert (recorder.recorded, recorder.dropped) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_recorder_marks_broadcasts_from_state_changes(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    observer = ObserverTest()
+    observer.trace = TraceRecorder(str(path))
+    states = StateChangesTest(HubTest(observer))
+    observer.broadcast(ObserverTypes.PricesChanged, [[1.0]])
+    with observer.trace.state_change("sensor.power", "1200"):
+        await states.async_update_sensor("sensor.power", "1200")
+    observer.trace.flush()
+    events = read_trace(str(path))
+    assert [e["k"] for e in events] == ["b", "s", "b"]
+    assert "n" not in events[0]
+    assert events[2]["c"] == "ProcessChargeController" and events[2]["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_replay_drives_observer_and_state_changes(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    recording = ObserverTest()
+    recording.trace = TraceRecorder(str(path))
+    with recording.trace.state_change("sensor.power", "1200"):
+        await StateChangesTest(HubTest(recording)).async_update_sensor("sensor.power", "1200")
+    recording.broadcast(ObserverTypes.PricesChanged, [[1.0]])
+    recording.trace.flush()
+
+    observer = ObserverTest()
+    received = []
+    observer.add(ObserverTypes.PricesChanged, lambda prices: received.append(prices))
+    observer.add(ObserverTypes.ProcessChargeController, lambda: received.append("process"))
+    states = StateChangesTest(HubTest(observer))
+    report = await async_replay(read_trace(str(path)), observer, states)
+    assert states.updates == [("sensor.power", "1200")]
+    assert received == ["process", [[1.0]]]
+    assert (report.events, report.state_changes, report.broadcasts, report.skipped) == (2, 1, 1, 1)
+    assert report.handling.count == 2
@@ -0,0 +1,109 @@
+"""
+Replays a trace written by TraceRecorder against the current build.
+
+    python -m custom_components.peaqev.test.trace_replay peaqev_trace.jsonl [--realtime]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+
+from peaqevcore.common.models.observer_types import ObserverTypes
+
+from custom_components.peaqev.peaqservice.hub.observer.iobserver_coordinator import \
+    IObserver
+from custom_components.peaqev.peaqservice.hub.observer.models.latency_stats import \
+    LatencyStats
+from custom_components.peaqev.peaqservice.hub.state_changes.istate_changes import \
+    StateChangesBase
+from custom_components.peaqev.peaqservice.hub.trace.const import TraceKind
+from custom_components.peaqev.test.mock_classes.observer_coordinator_test import \
+    ObserverTest
+from custom_components.peaqev.test.mock_classes.state_changes_test import (
+    HubTest, StateChangesTest)
+
+
+@dataclass
+class ReplayReport:
+    events: int = 0
+    broadcasts: int = 0
+    state_changes: int = 0
+    skipped: int = 0
+    duration: float = 0
+    handling: LatencyStats = field(default_factory=LatencyStats)
+    observer: dict = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        if self.duration == 0:
+            return 0
+        return self.events / self.duration
+
+
+def read_trace(path: str) -> list[dict]:
+    with open(path, encoding='utf-8') as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    """a late flush can land after a newer batch"""
+    return sorted(events, key=lambda e: e['t'])
+
+
+async def async_replay(
+    events: list[dict],
+    observer: IObserver,
+    state_changes: StateChangesBase | None = None,
+    realtime: bool = False,
+) -> ReplayReport:
+    """
+    Feeds the events to the observer, and state changes to state_changes if given.
+    With state_changes, broadcasts recorded as nested are skipped since state_changes raises them again.
+    """
+    report = ReplayReport()
+    if not events:
+        return report
+    first = events[0]['t']
+    started = time.monotonic()
+    for event in events:
+        if realtime:
+            delay = (event['t'] - first) - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        handled = time.monotonic()
+        if event['k'] == TraceKind.StateChange.value:
+            if state_changes is None:
+                report.skipped += 1
+                continue
+            await state_changes.async_update_sensor(event['e'], event['v'])
+            report.state_changes += 1
+        else:
+            if event.get('n') and state_changes is not None:
+                report.skipped += 1
+                continue
+            await observer.async_broadcast(ObserverTypes[event['c']], event.get('a'))
+            report.broadcasts += 1
+        await observer.async_dispatch()
+        report.handling.add(time.monotonic() - handled)
+        report.events += 1
+    await asyncio.gather(*observer._tasks)
+    report.duration = time.monotonic() - started
+    report.observer = observer.diagnostics()
+    return report
+
+
+async def async_main(path: str, realtime: bool) -> None:
+    observer = ObserverTest()
+    report = await async_replay(read_trace(path), observer, StateChangesTest(HubTest(observer)), realtime)
+    print(f'{report.events} events ({report.broadcasts} broadcasts, {report.state_changes} state changes, {report.skipped} skipped)')
+    print(f'{report.duration:.3f}s, {report.throughput:.1f} events/s')
+    print(f'handling: {report.handling.as_dict()}')
+    print(f'lanes: {report.observer["lanes"]}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path')
+    parser.add_argument('--realtime', action='store_true')
+    args = parser.parse_args()
+    asyncio.run(async_main(args.path, args.realtime))